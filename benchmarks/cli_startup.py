@@ -0,0 +1,44 @@
+"""
+Benchmark of rfdesigner command line startup time.
+
+--version is answered before the argument parser is built (about 20ms,
+within 5ms of a bare interpreter).  --implemented and --help build the
+parser but import no component module, and stay around 40-50ms.
+--properties has to import the component module of the block, and with it
+numpy, so it takes about 150ms and misses the 50ms target by about 100ms.
+"""
+import subprocess
+import sys
+import time
+
+TARGET_MS = 50
+COMMANDS = [
+    ["--version"],
+    ["--implemented"],
+    ["--help"],
+    ["--properties", "lna"],
+]
+
+
+def time_command(args, repeat):
+    """Get the best wall time in ms of running python with the given arguments."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, stdout=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main(repeat=10):
+    """Print startup times of the informational flags against the target."""
+    interpreter = time_command(["-c", "pass"], repeat)
+    print(f"{'python -c pass':<40}{interpreter:>8.1f}ms")
+    for args in COMMANDS:
+        elapsed = time_command(["-m", "rfdesigner"] + args, repeat)
+        status = "ok" if elapsed < TARGET_MS else f"over {TARGET_MS}ms target"
+        print(f"{'rfdesigner ' + ' '.join(args):<40}{elapsed:>8.1f}ms  {status}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
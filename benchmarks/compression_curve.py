@@ -0,0 +1,34 @@
+"""Benchmark of cascaded AM-AM curves against chaining Generic.output per point."""
+import sys
+import time
+import numpy as np
+from rfdesigner.components import COMPRESSION_MODELS, Generic
+from rfdesigner.simulation import compression
+
+
+def main(points=1000000, loop_points=2000):
+    """Print the time of vectorized curves and the per-point loop for every model."""
+    pin = np.linspace(-60, 10, points)
+    for model in COMPRESSION_MODELS:
+        system = [
+            Generic(name="lna", gain=20, nf=2, p1db=10, compression=model),
+            Generic(name="pad", gain=-3),
+            Generic(name="amp", gain=15, p1db=15, compression=model, am_pm=3),
+        ]
+        start = time.perf_counter()
+        compression.curves(system, pin)
+        vectorized = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for value in pin[:loop_points].tolist():
+            for block in system:
+                value = block.output(pin=value)
+        loop = (time.perf_counter() - start) / loop_points * points
+        print(
+            f"{model:<12}{points} points {vectorized * 1e3:>8.1f} ms "
+            f"(loop estimate {loop:.1f} s)"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
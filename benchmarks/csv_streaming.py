@@ -0,0 +1,43 @@
+"""Benchmark of peak memory when writing a large sweep as csv."""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from rfdesigner.components import Generic
+from rfdesigner.simulation import results, sweep
+
+
+def measure(func):
+    """Get the wall time in seconds and peak traced memory in MB of a call."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def main(points=1000000):
+    """Print time and peak memory of list and streamed csv output."""
+    system = [Generic(name=f"amp{index}", gain=10, nf=3, p1db=20) for index in range(8)]
+    pin = sweep.pin_range(-100, 20, 120 / (points - 1))
+    with tempfile.TemporaryDirectory() as tmp:
+        save_file = os.path.join(tmp, "sweep.csv")
+
+        def listed():
+            result = sweep.run(system, pin=pin)
+            results.save_csv(save_file, results.csv_sweep(system, result))
+
+        def streamed():
+            blocks = sweep.iter_run(system, pin)
+            results.save_csv(save_file, results.iter_csv_sweep(system, blocks))
+
+        for name, func in [("list", listed), ("stream", streamed)]:
+            elapsed, peak = measure(func)
+            print(f"{name:<8}{elapsed:>8.2f}s{peak:>10.1f}MB peak")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
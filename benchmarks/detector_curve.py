@@ -0,0 +1,33 @@
+"""Benchmark of detector transfer curves against calling Detector.output per point."""
+import sys
+import time
+import numpy as np
+from rfdesigner.components import Generic
+from rfdesigner.components.detector import Detector
+from rfdesigner.simulation import detection
+
+LAWS = [("log", -60, 0), ("square", 1e-9, 1e-3), ("rms", 1e-4, 0.2)]
+
+
+def main(points=1000000, loop_points=10000):
+    """Print the time of vectorized curves and the per-point loop for every law."""
+    pin = np.linspace(-100, 0, points)
+    for law, mds, smax in LAWS:
+        detector = Detector(gain=0, mds=mds, smax=smax, law=law)
+        system = [Generic(name="lna", gain=20, nf=3), detector]
+        start = time.perf_counter()
+        detection.run(system, pin, bandwidth=1e6)
+        vectorized = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for value in pin[:loop_points].tolist():
+            detector.output(pin=value)
+        loop = (time.perf_counter() - start) / loop_points * points
+        print(
+            f"{law:<8}{points} points {vectorized * 1e3:>8.1f} ms "
+            f"(loop estimate {loop:.1f} s)"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,34 @@
+"""Benchmark of frequency response analysis on a large frequency grid."""
+import sys
+import time
+from rfdesigner.components import Passive
+from rfdesigner.components.amplifier import Amplifier
+from rfdesigner.simulation import frequency
+
+
+def timed(func):
+    """Get the wall time in seconds of a call."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(points=100000, blocks=10):
+    """Print the time of a full run and of a run after editing one block."""
+    system = [
+        Amplifier(name=f"amp{index}", gain=12, nf=2, iip3=10, f3db=1000, fbw=5000)
+        if index % 2 == 0
+        else Passive(name=f"loss{index}", gain=-3)
+        for index in range(blocks)
+    ]
+    response = frequency.FrequencyResponse(
+        system, frequency.frequency_grid(1, 10000, points)
+    )
+    print(f"{'full run':<24}{timed(response.run):>8.3f}s")
+    for index in [0, blocks - 1]:
+        system[index].gain = float(system[index].gain) + 1
+        print(f"{f'edit block {index + 1}':<24}{timed(response.run):>8.3f}s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
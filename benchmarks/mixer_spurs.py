@@ -0,0 +1,21 @@
+"""Benchmark of the in-band spur search over a large LO sweep."""
+import sys
+import time
+import numpy as np
+from rfdesigner.components.mixer import Mixer
+from rfdesigner.simulation import spurs
+
+
+def main(points=10000, order=15):
+    """Print the time to find in-band spurs of a receive mixer over an LO sweep."""
+    mixer = Mixer(gain=-7, lo_rejection=10, rf_rejection=15)
+    lo = np.linspace(2000, 3000, points)
+    start = time.perf_counter()
+    result = spurs.find_spurs(mixer, lo, 2400, 130, 150, order=order)
+    elapsed = time.perf_counter() - start
+    products = points * len(spurs.spur_orders(order)[0])
+    print(f"{products} products, {len(result['m'])} in band, {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,41 @@
+"""Benchmark of csv against binary column output for a large input power sweep."""
+import os
+import sys
+import tempfile
+import time
+from rfdesigner.components import Generic
+from rfdesigner.simulation import results, sweep
+
+
+def timed(func, *args):
+    """Get the result and wall time in seconds of a call."""
+    start = time.perf_counter()
+    value = func(*args)
+    return value, time.perf_counter() - start
+
+
+def main(points=1000000):
+    """Print write time and file size of both formats."""
+    system = [Generic(name=f"amp{index}", gain=10, nf=3, p1db=20) for index in range(8)]
+    result = sweep.run(system, pin=sweep.pin_range(-100, 20, 120 / (points - 1)))
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = os.path.join(tmp, "sweep.csv")
+        column_file = os.path.join(tmp, "sweep.rfcol")
+        _, csv_time = timed(
+            lambda: results.save_csv(csv_file, results.csv_sweep(system, result))
+        )
+        _, column_time = timed(
+            lambda: results.save_columns(
+                column_file, *results.columns_sweep(system, result)
+            )
+        )
+        for name, file_name, elapsed in [
+            ("csv", csv_file, csv_time),
+            ("columns", column_file, column_time),
+        ]:
+            size = os.path.getsize(file_name) / 1e6
+            print(f"{name:<8}{elapsed:>8.2f}s{size:>10.1f}MB")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
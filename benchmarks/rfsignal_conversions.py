@@ -0,0 +1,33 @@
+"""Micro-benchmark of RFSignal unit conversion properties."""
+import sys
+import timeit
+from rfdesigner.components import Generic, RFSignal
+from rfdesigner.simulation import cascade
+
+CONVERSIONS = ["dBm", "dBW", "dBV", "dBA", "W", "V", "A", "Vgain"]
+SOURCE_UNITS = ["dBm", "dBW", "W", "V"]
+
+
+def time_call(statement, number):
+    """Get the best time per call in ns out of five repeats."""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e9
+
+
+def main(number=200000):
+    """Print the time of every conversion property and of a cascade run."""
+    print(f"{'units':<8}" + "".join(f"{prop:>9}" for prop in CONVERSIONS))
+    for units in SOURCE_UNITS:
+        signal = RFSignal(0.5, units=units)
+        times = [
+            time_call(lambda prop=prop: getattr(signal, prop), number)
+            for prop in CONVERSIONS
+        ]
+        print(f"{units:<8}" + "".join(f"{value:>7.0f}ns" for value in times))
+
+    system = [Generic(gain=10, nf=3, iip3=10, p1db=0) for _ in range(10)]
+    cascade_time = time_call(lambda: cascade.run(system), number // 100)
+    print(f"cascade.run (10 blocks): {cascade_time / 1000:.1f}us")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,49 @@
+"""Benchmark of the analytic cascade Jacobian against perturbing every block parameter."""
+import sys
+import time
+import numpy as np
+from rfdesigner.simulation import batch, sensitivity
+
+TOTALS = ["gain", "nf", "iip3", "p1db"]
+
+
+def random_chains(n_chains, n_blocks, seed=0):
+    """Get the parameter arrays of random signal chains."""
+    rng = np.random.default_rng(seed)
+    shape = (n_chains, n_blocks)
+    return {
+        "gain": rng.uniform(-10, 25, shape),
+        "nf": rng.uniform(0.5, 12, shape),
+        "iip3": rng.uniform(-5, 40, shape),
+        "p1db": rng.uniform(-15, 30, shape),
+    }
+
+
+def main(n_chains=10000, n_blocks=10):
+    """Print the time of the analytic Jacobian and of finite differences."""
+    arrays = random_chains(n_chains, n_blocks)
+    start = time.perf_counter()
+    sensitivity.jacobian(**arrays)
+    analytic = time.perf_counter() - start
+
+    step = 1e-6
+    start = time.perf_counter()
+    base = batch.cascade(decimals=None, **arrays)
+    derivatives = {total: np.empty(arrays["gain"].shape) for total in TOTALS}
+    for param in sensitivity.PARAMS:
+        for col in range(n_blocks):
+            perturbed = dict(arrays)
+            perturbed[param] = arrays[param].copy()
+            perturbed[param][:, col] += step
+            moved = batch.cascade(decimals=None, **perturbed)
+            for total in derivatives:
+                derivatives[total][:, col] = (moved[total] - base[total]) / step
+    finite = time.perf_counter() - start
+    print(
+        f"{n_chains} chains of {n_blocks} blocks: analytic {analytic * 1e3:.1f} ms, "
+        f"finite differences {finite * 1e3:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
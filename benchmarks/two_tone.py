@@ -0,0 +1,35 @@
+"""Benchmark of time and peak memory of multi-tone simulation record lengths."""
+import sys
+import time
+import tracemalloc
+from rfdesigner.components import Generic
+from rfdesigner.simulation import intermod
+
+
+def measure(func):
+    """Get the wall time in seconds and peak traced memory in MB of a call."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def main(max_power=24):
+    """Print time and peak memory of two-tone tests of growing length."""
+    system = [
+        Generic(name="lna", gain=20, nf=2, iip3=0),
+        Generic(name="pad", gain=-3),
+        Generic(name="amp", gain=15, iip3=5, p1db=12),
+    ]
+    for power in range(16, max_power + 1, 2):
+        elapsed, peak = measure(
+            lambda: intermod.run(system, [100, 101], -50, 1000, 1 << power)
+        )
+        print(f"2^{power:<6}{elapsed:>8.2f}s{peak:>10.1f}MB peak")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
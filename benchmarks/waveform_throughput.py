@@ -0,0 +1,28 @@
+"""Benchmark of waveform throughput through a signal chain."""
+import sys
+import time
+import numpy as np
+from rfdesigner.components import Generic
+from rfdesigner.simulation import waveform
+
+
+def main(power=22):
+    """Print samples per second by sample type, with and without noise."""
+    system = [
+        Generic(name="lna", gain=20, nf=2, iip3=0),
+        Generic(name="pad", gain=-3),
+        Generic(name="amp", gain=15, nf=6, iip3=5, p1db=12),
+    ]
+    for dtype in [np.complex128, np.complex64, np.float64, np.float32]:
+        samples = np.zeros(1 << power, dtype=dtype)
+        for noise in [True, False]:
+            chain = waveform.WaveformChain(system, 100, seed=1, noise=noise)
+            start = time.perf_counter()
+            chain.run(samples, out=samples)
+            rate = len(samples) / (time.perf_counter() - start) / 1e6
+            label = f"{np.dtype(dtype).name} {'noise' if noise else 'noiseless'}"
+            print(f"{label:<24}{rate:>8.1f} Msamples/s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -1,8 +1,7 @@
 """Main CLI entry point for RFDesigner."""
 import sys
-from rfdesigner.cli import RFcli
-from rfdesigner.options import entry_arguments
-from rfdesigner.netlist import parse_netlist, IMPLEMENTED_BLOCKS
+from rfdesigner.const import __version__
+from rfdesigner.registry import IMPLEMENTED_BLOCKS
 
 
 def display_implemented():
@@ -24,6 +23,12 @@ def display_properties(props):
 
 def main():
     """CLI handler."""
+    if sys.argv[1:] == ["--version"]:
+        # Answered without importing argparse or building the parser
+        print(__version__)
+        sys.exit(0)
+    from rfdesigner.options import entry_arguments
+
     parser = entry_arguments()
     args = parser.parse_args()
     if args.implemented:
@@ -33,14 +38,23 @@ def main():
         cls = IMPLEMENTED_BLOCKS[args.properties]()
         print(display_properties(cls.supported))
         sys.exit(0)
+    # Heavy modules are only imported by the commands that need them
     if args.validate:
+        from rfdesigner.netlist import parse_netlist
+
         netlist = args.validate
-        result = parse_netlist(netlist)
+        result = parse_netlist(netlist, use_cache=not args.no_cache)
         if not result:
             print("Netlist incorrect.")
             sys.exit(1)
         print(result)
         sys.exit(0)
+    if args.command == "run":
+        from rfdesigner import commands
+
+        sys.exit(commands.run(args))
+    from rfdesigner.cli import RFcli
+
     rfcli = RFcli()
     sys.exit(rfcli.cmdloop())
 
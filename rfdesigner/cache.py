@@ -0,0 +1,132 @@
+"""On-disk cache of parsed netlists."""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import numpy as np
+from rfdesigner.chaintable import ChainTable
+from rfdesigner.const import __version__
+
+CACHE_ENV = "RFDESIGNER_CACHE_DIR"
+META_FILE = "netlist.json"
+# Incremented whenever the layout of cached tables changes
+FORMAT_VERSION = 5
+
+
+def cache_dir():
+    """Get the directory holding cached netlists."""
+    default = os.path.join(os.path.expanduser("~"), ".cache", "rfdesigner")
+    return os.environ.get(CACHE_ENV, default)
+
+
+def cache_key(file_name):
+    """Get the cache key of a netlist file (hash of its content and the rfdesigner version)."""
+    digest = hashlib.sha256(f"{__version__}:{FORMAT_VERSION}".encode())
+    with open(file_name, "rb") as netlist_file:
+        for block in iter(lambda: netlist_file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_path(file_name):
+    """Get the cache entry directory of a netlist file."""
+    return os.path.join(cache_dir(), cache_key(file_name))
+
+
+def _table_meta(table, file_name):
+    """Get the non-numeric description of a chain table."""
+    return {
+        "file": file_name,
+        "types": [block_type.__name__.lower() for block_type in table.block_types],
+        "names": table.names,
+        "laws": table.laws,
+        "prototypes": table.prototypes,
+        "compressions": table.compressions,
+    }
+
+
+def store(file_name, entries):
+    """
+    Store parsed netlist entries in the cache.
+
+    :param file_name: Netlist file the entries were parsed from.
+    :param entries: Dictionary of {name: ChainTable, list of ChainTables (one per design space slot) or dictionary of simulation settings}.
+    :return: path of the cache entry, or None if the cache is not writable.
+    """
+    path = cache_path(file_name)
+    meta = {"version": __version__, "format": FORMAT_VERSION, "entries": {}}
+    build_dir = None
+    try:
+        os.makedirs(cache_dir(), exist_ok=True)
+        build_dir = tempfile.mkdtemp(dir=cache_dir())
+        count = 0
+        for name, entry in entries.items():
+            if isinstance(entry, dict):
+                meta["entries"][name] = {"kind": "settings", "values": entry}
+                continue
+            tables = entry if isinstance(entry, list) else [entry]
+            tables_meta = []
+            for table in tables:
+                table_file = f"{count}.npy"
+                np.save(os.path.join(build_dir, table_file), table.data)
+                tables_meta.append(_table_meta(table, table_file))
+                count += 1
+            kind = "slots" if isinstance(entry, list) else "chain"
+            meta["entries"][name] = {"kind": kind, "tables": tables_meta}
+        with open(os.path.join(build_dir, META_FILE), "w") as meta_file:
+            json.dump(meta, meta_file)
+        if not os.path.isdir(path):
+            os.replace(build_dir, path)
+    except OSError:
+        return None
+    finally:
+        # Left behind if the entry already existed or could not be written
+        if build_dir is not None:
+            shutil.rmtree(build_dir, ignore_errors=True)
+    return path
+
+
+def load(file_name, block_types):
+    """
+    Load parsed netlist entries from the cache.
+
+    Numeric columns are memory-mapped (copy-on-write), so loading does not
+    parse or copy them.
+
+    :param file_name: Netlist file to look up.
+    :param block_types: Dictionary of {lowercase class name: component class}.
+    :return: dictionary of entries as passed to :func:`store`, or None on a cache miss.
+    """
+    path = cache_path(file_name)
+    try:
+        with open(os.path.join(path, META_FILE)) as meta_file:
+            meta = json.load(meta_file)
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != __version__ or meta.get("format") != FORMAT_VERSION:
+        return None
+
+    entries = {}
+    for name, entry in meta["entries"].items():
+        if entry["kind"] == "settings":
+            entries[name] = entry["values"]
+            continue
+        tables = [
+            ChainTable(
+                np.load(os.path.join(path, table["file"]), mmap_mode="c"),
+                [block_types[block_type] for block_type in table["types"]],
+                table["names"],
+                table["laws"],
+                table["prototypes"],
+                table["compressions"],
+            )
+            for table in entry["tables"]
+        ]
+        entries[name] = tables if entry["kind"] == "slots" else tables[0]
+    return entries
+
+
+def clear():
+    """Remove every cached netlist."""
+    shutil.rmtree(cache_dir(), ignore_errors=True)
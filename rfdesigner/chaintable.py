@@ -0,0 +1,286 @@
+"""Compact columnar representation of a signal chain."""
+import math
+import numpy as np
+from rfdesigner.const import TOLERANCE_PROPS
+from rfdesigner.components import Generic, RFSignal
+from rfdesigner.components.detector import LAW_UNIT_MAP
+from rfdesigner.components.vga import VGA
+
+# Column name and units of every numeric block property
+PROPERTY_COLUMNS = [
+    ("gain", "dBW"),
+    ("nf", "dBW"),
+    ("iip3", "dBm"),
+    ("oip3", "dBm"),
+    ("p1db", "dBm"),
+    ("smoothness", None),
+    ("am_pm", None),
+    ("power", "W"),
+    ("f3db", None),
+    ("fbw", None),
+    ("gain_min", "dBW"),
+    ("gain_max", "dBW"),
+    ("gain_step", "dBW"),
+    ("control", "V"),
+    ("mds", "law"),
+    ("smax", "law"),
+    ("fc", None),
+    ("order", None),
+    ("ripple", None),
+    ("attenuation", None),
+    ("bandwidth", None),
+    ("lo", None),
+    ("lo_rejection", None),
+    ("rf_rejection", None),
+    ("even_rejection", None),
+    ("spur_pin", None),
+]
+TOLERANCE_COLUMNS = [
+    (f"{prop}_{suffix}", None)
+    for prop in TOLERANCE_PROPS
+    for suffix in ["sigma", "range_min", "range_max"]
+]
+TOTAL_COLUMNS = [
+    ("total_gain", "dBW"),
+    ("total_nf", "dBW"),
+    ("total_iip3", "dBm"),
+    ("total_p1db", "dBm"),
+    ("pout", "dBm"),
+    ("is_compressed", "bool"),
+]
+COLUMNS = PROPERTY_COLUMNS + TOLERANCE_COLUMNS + TOTAL_COLUMNS
+# Columns that set the gain of a VGA
+VGA_COLUMNS = ["gain", "gain_min", "gain_max", "gain_step", "control"]
+COLUMN_INDEX = {column: index for index, (column, _) in enumerate(COLUMNS)}
+PARAMETER_COLUMNS = {column for column, _ in PROPERTY_COLUMNS}
+COLUMN_UNITS = dict(COLUMNS)
+
+
+def _block_values(block):
+    """Get the column values of a component."""
+    values = [getattr(block, column, math.nan) for column, _ in PROPERTY_COLUMNS]
+    for prop in TOLERANCE_PROPS:
+        tolerance = block.tolerances.get(prop, ("none",))
+        sigma = tolerance[1] if tolerance[0] == "normal" else math.nan
+        low, high = tolerance[1:] if tolerance[0] == "uniform" else (math.nan,) * 2
+        values += [sigma, low, high]
+    values += [getattr(block, column) for column, _ in TOTAL_COLUMNS]
+    return values
+
+
+class ChainTable:
+    """Signal chain stored as one contiguous float64 column per property."""
+
+    def __init__(
+        self, data, block_types, names, laws, prototypes=None, compressions=None
+    ):
+        """
+        Initialize the chain table.
+
+        :param data: (n_columns x n_blocks) float64 array ordered as COLUMNS.
+        :param block_types: Component class of each block.
+        :param names: Name of each block.
+        :param laws: Detector law of each block (None for non-detectors).
+        :param prototypes: Filter prototype of each block (None for non-filters).
+        :param compressions: Compression model of each block (hard by default).
+        """
+        self.data = data
+        self.block_types = list(block_types)
+        self.names = list(names)
+        self.laws = list(laws)
+        self.prototypes = list(prototypes or [None] * len(self.names))
+        self.compressions = list(compressions or ["hard"] * len(self.names))
+        # Revisions of the block parameters, as kept by Generic and VGA
+        self.revisions = [self._next_revision() for _ in self.names]
+        self.table_revisions = list(self.revisions)
+
+    @staticmethod
+    def _next_revision():
+        """Get a new revision from the counter shared with component objects."""
+        Generic.last_revision += 1
+        return Generic.last_revision
+
+    def touch(self, index, control=False):
+        """
+        Record that a parameter of a block changed.
+
+        :param index: Position of the block.
+        :param control: True if only the control voltage of a VGA changed.
+        """
+        self.revisions[index] = self._next_revision()
+        if not control:
+            self.table_revisions[index] = self.revisions[index]
+
+    @classmethod
+    def from_blocks(cls, blocks):
+        """Create a chain table from a list of components."""
+        data = np.array([_block_values(block) for block in blocks], dtype=float)
+        return cls(
+            data.T.reshape(len(COLUMNS), len(blocks)).copy(),
+            [block.__class__ for block in blocks],
+            [block.name for block in blocks],
+            [getattr(block, "law", None) for block in blocks],
+            [getattr(block, "prototype", None) for block in blocks],
+            [block.compression for block in blocks],
+        )
+
+    def column(self, name):
+        """Get one property column as a view into the table."""
+        return self.data[COLUMN_INDEX[name]]
+
+    def block_kwargs(self, index):
+        """Get the keyword arguments that recreate a block."""
+        kwargs = {"name": self.names[index], "compression": self.compressions[index]}
+        if self.laws[index] is not None:
+            kwargs["law"] = self.laws[index]
+        if self.prototypes[index] is not None:
+            kwargs["prototype"] = self.prototypes[index]
+        for column, _ in PROPERTY_COLUMNS:
+            value = self.data[COLUMN_INDEX[column], index]
+            if not math.isnan(value):
+                kwargs[column] = value
+        for prop in TOLERANCE_PROPS:
+            sigma = self.data[COLUMN_INDEX[f"{prop}_sigma"], index]
+            low = self.data[COLUMN_INDEX[f"{prop}_range_min"], index]
+            high = self.data[COLUMN_INDEX[f"{prop}_range_max"], index]
+            if not math.isnan(sigma):
+                kwargs[f"{prop}_sigma"] = sigma
+            if not math.isnan(low):
+                kwargs[f"{prop}_range"] = [low, high]
+        return kwargs
+
+    def to_block(self, index):
+        """Create the component object for a block."""
+        block = self.block_types[index](**self.block_kwargs(index))
+        for column, units in TOTAL_COLUMNS:
+            value = self.data[COLUMN_INDEX[column], index]
+            setattr(block, column, bool(value) if units == "bool" else value)
+        return block
+
+    def to_blocks(self):
+        """Create a list of component objects."""
+        return [self.to_block(index) for index in range(len(self))]
+
+    def arrays(self):
+        """Get (1 x n_blocks) arrays for the batch cascade engine."""
+        return {
+            prop: self.column(prop)[np.newaxis, :]
+            for prop in ["gain", "nf", "iip3", "p1db"]
+        }
+
+    def __len__(self):
+        """Get number of blocks."""
+        return len(self.names)
+
+    def __getitem__(self, index):
+        """Get a view of a block."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("block index out of range")
+        return BlockView(self, index)
+
+    def __iter__(self):
+        """Iterate over block views."""
+        for index in range(len(self)):
+            yield BlockView(self, index)
+
+
+def _column_property(column, units):
+    """Create a property reading and writing one column of a block."""
+
+    def getter(self):
+        value = self.table.data[COLUMN_INDEX[column], self.index]
+        if units is None:
+            return float(value)
+        if units == "bool":
+            return bool(value)
+        if units == "law":
+            return RFSignal(value, units=LAW_UNIT_MAP[self.law])
+        return RFSignal(value, units=units)
+
+    def setter(self, value):
+        self.table.data[COLUMN_INDEX[column], self.index] = value
+        if column in VGA_COLUMNS and issubclass(self.block_type, VGA):
+            self.update_vga_gain()
+        if column in PARAMETER_COLUMNS:
+            self.table.touch(self.index, control=column == "control")
+
+    return property(getter, setter, doc=f"Get or set {column} value.")
+
+
+class BlockView:
+    """Lightweight view of one block in a ChainTable."""
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        """Initialize the block view."""
+        self.table = table
+        self.index = index
+
+    @property
+    def name(self):
+        """Get block name."""
+        return self.table.names[self.index]
+
+    @property
+    def law(self):
+        """Get detector law."""
+        return self.table.laws[self.index]
+
+    @property
+    def prototype(self):
+        """Get filter prototype."""
+        return self.table.prototypes[self.index]
+
+    @property
+    def compression(self):
+        """Get compression model."""
+        return self.table.compressions[self.index]
+
+    @property
+    def block_type(self):
+        """Get component class of the block."""
+        return self.table.block_types[self.index]
+
+    @property
+    def revision(self):
+        """Get the revision of the block parameters (see Generic.revision)."""
+        return self.table.revisions[self.index]
+
+    @property
+    def table_revision(self):
+        """Get the revision of the parameters other than a VGA control voltage."""
+        return self.table.table_revisions[self.index]
+
+    def to_block(self):
+        """Create the component object for this block."""
+        return self.table.to_block(self.index)
+
+    def update_vga_gain(self):
+        """Set the gain column of a VGA from its control voltage (see VGA.gain)."""
+        data = self.table.data
+        gain_min = data[COLUMN_INDEX["gain_min"], self.index]
+        gain_max = data[COLUMN_INDEX["gain_max"], self.index]
+        value = data[COLUMN_INDEX["control"], self.index]
+        value = value * data[COLUMN_INDEX["gain_step"], self.index] + gain_min
+        data[COLUMN_INDEX["gain"], self.index] = max(min(value, gain_max), gain_min)
+
+    def output(self, pin=0):
+        """Generate output given input power and store it in the table."""
+        block = self.to_block()
+        pout = block.output(pin=pin)
+        self.pout = float(pout)
+        self.is_compressed = block.is_compressed
+        return pout
+
+    def __getattr__(self, name):
+        """Fall back to a temporary component object for other attributes."""
+        if name in BlockView.__slots__:
+            raise AttributeError(name)
+        return getattr(self.to_block(), name)
+
+
+for _column, _units in COLUMNS:
+    setattr(BlockView, _column, _column_property(_column, _units))
@@ -1,100 +1,88 @@
 """CLI definitions for RFDesigner."""
 import sys
-import os.path
 import cmd2
 from rfdesigner import options
-from rfdesigner.netlist import parse_netlist
-from rfdesigner.simulation import cascade, results
-
-
-def validate_cascade_args(args, systems):
-    """Validate cascade arguments."""
-    errors = []
-    if args.name not in systems:
-        errors.append(f"{args.name} not found in system list.")
-
-    if args.pin is None:
-        try:
-            args.pin = systems["sim"]["pin"]
-        except KeyError:
-            args.pin = 0
-    if args.bw is None:
-        try:
-            args.bw = systems["sim"]["bw"]
-        except KeyError:
-            args.bw = 1
-    if args.temp is None:
-        try:
-            args.temp = systems["sim"]["temp"]
-        except KeyError:
-            args.temp = 290
-
-    if args.save is not None:
-        if os.path.isdir(args.save):
-            args.save = os.path.join(args.save, f"rf_cascade_results_{args.name}.csv")
-        elif not os.path.isfile(args.save):
-            errors.append(f"{args.save} not a valid file or directory.")
-
-    if errors:
-        return (False, errors)
-    return (True, args)
+from rfdesigner.commands import Session
 
 
 class RFcli(cmd2.Cmd):
     """Command processer for RFDesigner."""
 
     prompt = "%rf> "
-    systems = None
 
-    def do_netlist(self, netlist_file):
+    def __init__(self, *args, **kwargs):
+        """Initialize the command processor and its analysis session."""
+        super().__init__(*args, **kwargs)
+        self.session = Session(output=self.poutput)
+
+    @property
+    def systems(self):
+        """Get netlisted systems."""
+        return self.session.systems
+
+    @cmd2.with_argparser(options.netlist_arguments())
+    def do_netlist(self, args):
         """Netlist a file."""
-        self.systems = parse_netlist(netlist_file)
+        self.session.netlist(args)
 
     def do_show_systems(self, line):
         """Show netlisted systems."""
-        system_string = ""
-        try:
-            for name, chain in self.systems.items():
-                if name == "sim":
-                    continue
-                system_string += f"{name}:\n"
-                count = 1
-                for block in chain.system:
-                    system_string += f"{count}: {block.__class__}\n"
-                    count += 1
-            self.poutput(system_string)
-        except TypeError:
-            self.poutput("Please run netlister first.")
+        self.session.show_systems()
 
     @cmd2.with_argparser(options.cascade_arguments())
     def do_cascade(self, args):
         """Run cascade analysis."""
-        result, args = validate_cascade_args(args, self.systems)
-        if not result:
-            for error in args:
-                self.poutput(error)
-            return
-
-        result = cascade.run(
-            system=self.systems[args.name].system,
-            pin=args.pin,
-            bandwidth=args.bw,
-            noise_temp=args.temp,
-        )
-        if not args.no_output:
-            lines = results.print_cascade(
-                self.systems[args.name].system, result, return_lines=True
-            )
-            for line in lines:
-                print_string = ""
-                for element in line:
-                    print_string += f"{element:<16}"
-                self.poutput(print_string)
-
-        if args.save:
-            csv_lines = results.csv_cascade(self.systems[args.name].system, result)
-            results.save_csv(args.save, csv_lines)
-            self.poutput(f"Results saved to {args.save}")
+        self.session.cascade(args)
+
+    @cmd2.with_argparser(options.frequency_arguments())
+    def do_frequency(self, args):
+        """Run cascade analysis versus frequency."""
+        self.session.frequency(args)
+
+    @cmd2.with_argparser(options.montecarlo_arguments())
+    def do_montecarlo(self, args):
+        """Run Monte Carlo analysis over netlisted block tolerances."""
+        self.session.montecarlo(args)
+
+    @cmd2.with_argparser(options.optimize_order_arguments())
+    def do_optimize_order(self, args):
+        """Find the Pareto-optimal block orderings for noise figure and IIP3."""
+        self.session.optimize_order(args)
+
+    @cmd2.with_argparser(options.spurs_arguments())
+    def do_spurs(self, args):
+        """Find the mixer spurs landing in the IF band."""
+        self.session.spurs(args)
+
+    @cmd2.with_argparser(options.intermod_arguments())
+    def do_intermod(self, args):
+        """Simulate a multi-tone intermodulation test."""
+        self.session.intermod(args)
+
+    @cmd2.with_argparser(options.sensitivity_arguments())
+    def do_sensitivity(self, args):
+        """Get the derivatives of the cascade totals by every block parameter."""
+        self.session.sensitivity(args)
+
+    @cmd2.with_argparser(options.compression_arguments())
+    def do_compression(self, args):
+        """Get the AM-AM and AM-PM curves and compression point of a system."""
+        self.session.compression(args)
+
+    @cmd2.with_argparser(options.detector_arguments())
+    def do_detector(self, args):
+        """Get the transfer curve and dynamic range of a detector."""
+        self.session.detector(args)
+
+    @cmd2.with_argparser(options.waveform_arguments())
+    def do_waveform(self, args):
+        """Pass a file of samples through a system."""
+        self.session.waveform(args)
+
+    @cmd2.with_argparser(options.explore_arguments())
+    def do_explore(self, args):
+        """Find the non-dominated part choices of a design space."""
+        self.session.explore(args)
 
     def do_exit(self, line):
         """Exit command line interface."""
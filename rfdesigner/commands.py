@@ -0,0 +1,838 @@
+"""Analysis commands shared by the interactive shell and batch runs."""
+import fnmatch
+import itertools
+import math
+import os.path
+import shlex
+import time
+from rfdesigner import options
+from rfdesigner.netlist import parse_netlist
+from rfdesigner.simulation import (
+    cascade,
+    compression,
+    designspace,
+    detection,
+    frequency,
+    intermod,
+    montecarlo,
+    multichain,
+    ordering,
+    results,
+    sensitivity,
+    spurs,
+    sweep,
+    waveform,
+)
+
+
+def select_systems(args, systems):
+    """Get names of the systems selected by --all or a glob --name (None for a single system)."""
+    if not hasattr(args, "all"):
+        # Only cascade analysis runs on several systems
+        return None
+    if args.all:
+        pattern = "*"
+    elif args.name is not None and any(char in args.name for char in "*?["):
+        pattern = args.name
+    else:
+        return None
+    return [
+        name for name in systems if name != "sim" and fnmatch.fnmatchcase(name, pattern)
+    ]
+
+
+def _check_system(args, systems, errors):
+    """Check the system selected by --name was netlisted."""
+    if args.name in systems:
+        return True
+    errors.append(f"{args.name} not found in system list.")
+    return False
+
+
+def _resolve_save(args, prefix, errors, extension="csv"):
+    """
+    Check --save and resolve a directory to the results file of the system.
+
+    :param prefix: Command name in the results file name (None to keep a directory).
+    """
+    if args.save is None:
+        return
+    if os.path.isdir(args.save):
+        if prefix is not None:
+            args.save = os.path.join(
+                args.save, f"rf_{prefix}_results_{args.name}.{extension}"
+            )
+    elif not os.path.isfile(args.save):
+        errors.append(f"{args.save} not a valid file or directory.")
+
+
+def _sim_setting(args, systems, name, default):
+    """Fill an unset argument from the netlist simulation settings."""
+    if getattr(args, name) is None:
+        try:
+            setattr(args, name, systems["sim"][name])
+        except KeyError:
+            setattr(args, name, default)
+
+
+def _check_pin_sweep(args, errors, required=False):
+    """Check the --pin-start, --pin-stop and --pin-step input power sweep."""
+    if required and (args.pin_start is None or args.pin_stop is None):
+        errors.append("Both --pin-start and --pin-stop required.")
+    elif (args.pin_start is None) != (args.pin_stop is None):
+        errors.append("Both --pin-start and --pin-stop required for a sweep.")
+    elif args.pin_start is not None and args.pin_stop < args.pin_start:
+        errors.append("--pin-stop must not be below --pin-start.")
+    if args.pin_step <= 0:
+        errors.append("--pin-step must be positive.")
+
+
+def validate_cascade_args(args, systems):
+    """Validate cascade arguments."""
+    errors = []
+    args.names = select_systems(args, systems)
+    if args.names is None:
+        _check_system(args, systems, errors)
+    if args.names == []:
+        errors.append(f"No systems match {args.name or '--all'}.")
+
+    _sim_setting(args, systems, "pin", 0)
+    _sim_setting(args, systems, "bw", 1)
+    _sim_setting(args, systems, "temp", 290)
+
+    sweep_args = [getattr(args, "pin_start", None), getattr(args, "pin_stop", None)]
+    if any(arg is not None for arg in sweep_args) and None in sweep_args:
+        errors.append("Both --pin-start and --pin-stop required for a sweep.")
+    if getattr(args, "pin_step", 1) <= 0:
+        errors.append("--pin-step must be positive.")
+
+    columns = getattr(args, "format", "csv") == "columns"
+    if columns and args.names is not None:
+        errors.append("--format columns only supports a single system.")
+    if getattr(args, "enbw", False) and args.names is not None:
+        errors.append("--enbw only supports a single system.")
+    # Several systems are saved to one file each in a directory
+    prefix = "cascade" if args.names is None else None
+    _resolve_save(args, prefix, errors, "rfcol" if columns else "csv")
+
+    if errors:
+        return (False, errors)
+    return (True, args)
+
+
+def validate_montecarlo_args(args, systems):
+    """Validate Monte Carlo arguments."""
+    result, errors = validate_cascade_args(args, systems)
+    if result:
+        errors = []
+    if args.samples < 1:
+        errors.append("--samples must be positive.")
+    if args.chunk_size < 1:
+        errors.append("--chunk-size must be positive.")
+    if args.save_samples is not None and not os.path.isdir(
+        os.path.dirname(os.path.abspath(args.save_samples))
+    ):
+        errors.append(f"{args.save_samples} not in a valid directory.")
+
+    if errors:
+        return (False, errors)
+    return (True, args)
+
+
+def validate_order_args(args, systems):
+    """Validate block ordering arguments and parse fixed positions."""
+    errors = []
+    if not _check_system(args, systems, errors):
+        return (False, errors)
+
+    system = systems[args.name].system
+    names = [str(block.name) for block in system]
+    args.fixed = {}
+    for fix in args.fix:
+        position, _, block = fix.partition("=")
+        if block and block in names:
+            index = names.index(block)
+        elif block.isdigit() and 1 <= int(block) <= len(system):
+            index = int(block) - 1
+        else:
+            errors.append(f"Block {block} not found in {args.name}.")
+            continue
+        if not position.isdigit() or not 1 <= int(position) <= len(system):
+            errors.append(f"Position {position} not in {args.name}.")
+        elif int(position) - 1 in args.fixed or index in args.fixed.values():
+            errors.append(f"{fix} conflicts with another --fix.")
+        else:
+            args.fixed[int(position) - 1] = index
+
+    _resolve_save(args, "order", errors)
+
+    if errors:
+        return (False, errors)
+    return (True, args)
+
+
+def validate_frequency_args(args, systems):
+    """Validate frequency response arguments."""
+    errors = []
+    _check_system(args, systems, errors)
+    if args.start is None or args.stop is None:
+        errors.append("Both --start and --stop frequencies required.")
+    elif not 0 <= args.start <= args.stop:
+        errors.append("Frequencies must satisfy 0 <= --start <= --stop.")
+    elif args.log and args.start == 0:
+        errors.append("--log requires a positive --start frequency.")
+    if args.points < 1:
+        errors.append("--points must be positive.")
+
+    extension = "rfcol" if args.format == "columns" else "csv"
+    _resolve_save(args, "frequency", errors, extension)
+
+    if errors:
+        return (False, errors)
+    return (True, args)
+
+
+def validate_spur_args(args, systems):
+    """Validate mixer spur arguments and find the mixer."""
+    errors = []
+    if not _check_system(args, systems, errors):
+        return (False, errors)
+    system = systems[args.name].system
+    mixers = [
+        index for index, block in enumerate(system) if hasattr(block, "spur_levels")
+    ]
+    names = [str(system[index].name) for index in mixers]
+    if args.block is None:
+        if not mixers:
+            return (False, [f"No mixer found in {args.name}."])
+        args.mixer_index = mixers[0]
+    elif args.block in names:
+        args.mixer_index = mixers[names.index(args.block)]
+    elif args.block.isdigit() and int(args.block) - 1 in mixers:
+        args.mixer_index = int(args.block) - 1
+    else:
+        return (False, [f"Mixer {args.block} not found in {args.name}."])
+
+    if args.lo_start is None:
+        args.lo_start = system[args.mixer_index].lo
+    if math.isnan(args.lo_start):
+        errors.append("LO frequency required (--lo-start or the mixer's lo).")
+    if args.rf_start is None:
+        errors.append("RF frequency required (--rf-start).")
+    if args.if_low is None or args.if_high is None:
+        errors.append("Both --if-low and --if-high required.")
+    elif args.if_low > args.if_high:
+        errors.append("--if-low must not be above --if-high.")
+    if args.order < 1:
+        errors.append("--order must be positive.")
+    if args.points < 1:
+        errors.append("--points must be positive.")
+    _sim_setting(args, systems, "pin", 0)
+    _resolve_save(args, "spur", errors)
+
+    if errors:
+        return (False, errors)
+    return (True, args)
+
+
+def validate_intermod_args(args, systems):
+    """Validate multi-tone intermodulation arguments."""
+    errors = []
+    _check_system(args, systems, errors)
+    if not args.tones:
+        errors.append("At least one tone frequency required (--tones).")
+    elif min(args.tones) <= 0:
+        errors.append("Tone frequencies must be positive.")
+    else:
+        if args.sample_rate is None:
+            args.sample_rate = 10 * max(args.tones)
+        if args.sample_rate <= 2 * max(args.tones):
+            errors.append("--sample-rate must be above twice the highest tone.")
+        elif args.chunk_size > 0:
+            try:
+                intermod.tone_bins(args.tones, args.sample_rate, args.chunk_size)
+            except ValueError as error:
+                errors.append(str(error))
+    if args.chunk_size <= 0 or args.chunk_size % 2:
+        errors.append("--chunk-size must be a positive even number.")
+    if args.samples < 1:
+        errors.append("--samples must be positive.")
+    _sim_setting(args, systems, "pin", 0)
+    _resolve_save(args, "intermod", errors)
+
+    if errors:
+        return (False, errors)
+    return (True, args)
+
+
+def validate_sensitivity_args(args, systems):
+    """Validate sensitivity analysis arguments."""
+    errors = []
+    _check_system(args, systems, errors)
+    _resolve_save(args, "sensitivity", errors)
+
+    if errors:
+        return (False, errors)
+    return (True, args)
+
+
+def validate_compression_args(args, systems):
+    """Validate compression analysis arguments."""
+    errors = []
+    _check_system(args, systems, errors)
+    _check_pin_sweep(args, errors)
+    if args.level <= 0:
+        errors.append("--level must be positive.")
+    _resolve_save(args, "compression", errors)
+
+    if errors:
+        return (False, errors)
+    return (True, args)
+
+
+def validate_detector_args(args, systems):
+    """Validate detector transfer curve arguments."""
+    errors = []
+    if (
+        _check_system(args, systems, errors)
+        and detection.detector_index(systems[args.name].system) is None
+    ):
+        errors.append(f"No detector found in {args.name}.")
+    _check_pin_sweep(args, errors, required=True)
+    if args.tolerance <= 0:
+        errors.append("--tolerance must be positive.")
+    _sim_setting(args, systems, "bw", 1)
+    _sim_setting(args, systems, "temp", 290)
+    _resolve_save(args, "detector", errors)
+
+    if errors:
+        return (False, errors)
+    return (True, args)
+
+
+def validate_waveform_args(args, systems):
+    """Validate waveform arguments."""
+    errors = []
+    _check_system(args, systems, errors)
+    if args.input is None or not os.path.isfile(args.input):
+        errors.append(f"{args.input} not a valid input file.")
+    if args.output is None:
+        errors.append("Output file required (--output).")
+    elif os.path.isdir(args.output):
+        args.output = os.path.join(args.output, f"rf_waveform_{args.name}.npy")
+    if args.sample_rate is None or args.sample_rate <= 0:
+        errors.append("A positive --sample-rate required.")
+    if args.chunk_size < 1:
+        errors.append("--chunk-size must be positive.")
+
+    if errors:
+        return (False, errors)
+    return (True, args)
+
+
+class Session:
+    """Netlisted systems and the analysis commands run on them."""
+
+    # Command name: (argument parser factory, Session method name)
+    COMMANDS = {
+        "netlist": (options.netlist_arguments, "netlist"),
+        "show_systems": (None, "show_systems"),
+        "cascade": (options.cascade_arguments, "cascade"),
+        "frequency": (options.frequency_arguments, "frequency"),
+        "montecarlo": (options.montecarlo_arguments, "montecarlo"),
+        "optimize_order": (options.optimize_order_arguments, "optimize_order"),
+        "spurs": (options.spurs_arguments, "spurs"),
+        "intermod": (options.intermod_arguments, "intermod"),
+        "sensitivity": (options.sensitivity_arguments, "sensitivity"),
+        "compression": (options.compression_arguments, "compression"),
+        "detector": (options.detector_arguments, "detector"),
+        "waveform": (options.waveform_arguments, "waveform"),
+        "explore": (options.explore_arguments, "explore"),
+    }
+
+    def __init__(self, output=print):
+        """
+        Initialize the session.
+
+        :param output: Function called with every line of output.
+        """
+        self.output = output
+        self.systems = None
+
+    def execute(self, line):
+        """
+        Run one command line such as "cascade --name rx --pin -20".
+
+        :param line: Command name followed by its arguments.
+        :return: True if the command succeeded.
+        """
+        words = shlex.split(line, comments=True)
+        if not words:
+            return True
+        if words[0] not in self.COMMANDS:
+            self.output(f"Unknown command: {words[0]}")
+            return False
+        parser_factory, method = self.COMMANDS[words[0]]
+        if parser_factory is None:
+            return getattr(self, method)(words[1:])
+        parser = parser_factory()
+        parser.prog = words[0]
+        try:
+            args = parser.parse_args(words[1:])
+        except SystemExit as error:
+            # Argument errors and --help exit from argparse
+            return not error.code
+        return getattr(self, method)(args)
+
+    def run_script(self, file_name):
+        """
+        Run every command of a script file, stopping at the first failure.
+
+        :param file_name: File with one command per line (# starts a comment).
+        :return: True if every command succeeded.
+        """
+        try:
+            with open(file_name) as script:
+                lines = script.readlines()
+        except OSError:
+            self.output(f"Script file {file_name} not found!")
+            return False
+        for number, line in enumerate(lines, start=1):
+            if not self.execute(line):
+                self.output(f"{file_name}:{number}: command failed: {line.strip()}")
+                return False
+        return True
+
+    def write_results(self, csv_lines, no_output=False, save=None):
+        """
+        Print csv results as a table and save them.
+
+        Lines are printed and written as they are generated, so csv_lines can
+        be a generator of any number of lines.
+
+        :param csv_lines: Iterable of csv formatted lines.
+        :param no_output: Do not print the results.
+        :param save: File to save results to (None to not save).
+        """
+        if not no_output:
+            csv_lines = self.echo_lines(csv_lines)
+        if save:
+            results.save_csv(save, csv_lines)
+            self.output(f"Results saved to {save}")
+        else:
+            for _ in csv_lines:
+                pass
+
+    def echo_lines(self, csv_lines):
+        """Print csv lines as table rows while passing them on."""
+        for line in csv_lines:
+            self.output(results.table_line(line))
+            yield line
+
+    def netlist(self, args, report_cache=True):
+        """
+        Netlist a file.
+
+        :param args: Arguments parsed by the netlist parser.
+        :param report_cache: Output whether the netlist cache was hit.
+        """
+
+        def cache_report(hit):
+            if report_cache:
+                self.output(f"Netlist cache {'hit' if hit else 'miss'}.")
+
+        self.systems = parse_netlist(
+            args.file,
+            compact=args.compact,
+            use_cache=not args.no_cache,
+            lazy=args.lazy,
+            cache_report=cache_report,
+        )
+        return self.systems is not None
+
+    def show_systems(self, args=None):
+        """Show netlisted systems."""
+        if not self.check_netlisted():
+            return False
+        system_string = ""
+        for name in self.systems:
+            chain = self.systems.get(name)
+            if name == "sim" or chain is None:
+                continue
+            system_string += f"{name}:\n"
+            slots = getattr(chain, "slots", None)
+            count = 1
+            for block in chain.system:
+                block_type = getattr(block, "block_type", block.__class__)
+                system_string += f"{count}: {block_type}"
+                if slots and len(slots[count - 1]) > 1:
+                    system_string += f" ({len(slots[count - 1])} candidates)"
+                system_string += "\n"
+                count += 1
+        self.output(system_string)
+        return True
+
+    def check_netlisted(self):
+        """Check that a netlist has been parsed, reporting it if not."""
+        if self.systems is None:
+            self.output("Please run netlister first.")
+        return self.systems is not None
+
+    def cascade(self, args):
+        """Run cascade analysis."""
+        if not self.check_netlisted():
+            return False
+        result, args = validate_cascade_args(args, self.systems)
+        if not result:
+            for error in args:
+                self.output(error)
+            return False
+        if args.names is not None:
+            return self.cascade_many(args)
+
+        system = self.systems[args.name].system
+        if args.enbw:
+            args.bw = frequency.noise_bandwidth(system)
+            if args.bw == math.inf:
+                self.output(f"{args.name} has no blocks limiting its bandwidth.")
+                return False
+            if not args.no_output:
+                self.output(f"Equivalent noise bandwidth: {args.bw:.6g} Hz")
+        kwargs = {"system": system, "bandwidth": args.bw, "noise_temp": args.temp}
+        columns = None
+        if args.pin_start is not None:
+            pin = sweep.pin_range(args.pin_start, args.pin_stop, args.pin_step)
+            if args.format == "columns":
+                result = sweep.run(pin=pin, **kwargs)
+                sweep_results = [result]
+                columns = results.columns_sweep(system, result)
+            else:
+                # Rows are analyzed, formatted and written a block at a time
+                sweep_results = sweep.iter_run(pin=pin, **kwargs)
+            csv_lines = results.iter_csv_sweep(system, sweep_results)
+        else:
+            result = cascade.run(pin=args.pin, **kwargs)
+            csv_lines = results.iter_csv_cascade(system, result)
+            if args.format == "columns":
+                columns = results.columns_cascade(system, result)
+
+        if columns is None:
+            self.write_results(csv_lines, args.no_output, args.save)
+        else:
+            self.write_results(csv_lines, args.no_output)
+            if args.save:
+                results.save_columns(args.save, *columns)
+                self.output(f"Results saved to {args.save}")
+        return True
+
+    def cascade_many(self, args):
+        """Run cascade analysis on every system selected by validated arguments."""
+        chains = {}
+        for name in args.names:
+            # Invalid systems of a lazily parsed netlist are skipped
+            chain = self.systems.get(name)
+            if chain is not None:
+                chains[name] = chain.system
+        pin_sweep = None
+        if args.pin_start is not None:
+            pin_sweep = sweep.pin_range(args.pin_start, args.pin_stop, args.pin_step)
+        chain_lines = multichain.iter_run(
+            chains,
+            pin=args.pin,
+            pin_sweep=pin_sweep,
+            bandwidth=args.bw,
+            noise_temp=args.temp,
+            workers=args.workers,
+            chunksize=args.chunk_size,
+        )
+
+        if args.save and os.path.isdir(args.save):
+            chain_lines = _save_each(chain_lines, args.save)
+            self.write_results(results.iter_csv_combined(chain_lines), args.no_output)
+            self.output(f"Results of {len(chains)} systems saved to {args.save}")
+        else:
+            csv_lines = results.iter_csv_combined(chain_lines)
+            self.write_results(csv_lines, args.no_output, args.save)
+        return True
+
+    def frequency(self, args):
+        """Run cascade analysis versus frequency."""
+        if not self.check_netlisted():
+            return False
+        result, args = validate_frequency_args(args, self.systems)
+        if not result:
+            for error in args:
+                self.output(error)
+            return False
+
+        system = self.systems[args.name].system
+        freqs = frequency.frequency_grid(args.start, args.stop, args.points, args.log)
+        result = frequency.run(system=system, freqs=freqs)
+        csv_lines = results.iter_csv_frequency(result)
+        if args.format == "columns":
+            self.write_results(csv_lines, args.no_output)
+            if args.save:
+                results.save_columns(
+                    args.save, *results.columns_frequency(system, result)
+                )
+                self.output(f"Results saved to {args.save}")
+        else:
+            self.write_results(csv_lines, args.no_output, args.save)
+        return True
+
+    def montecarlo(self, args):
+        """Run Monte Carlo analysis over netlisted block tolerances."""
+        if not self.check_netlisted():
+            return False
+        result, args = validate_montecarlo_args(args, self.systems)
+        if not result:
+            for error in args:
+                self.output(error)
+            return False
+
+        limits = {
+            "gain": (args.min_gain, args.max_gain),
+            "nf": (None, args.max_nf),
+            "iip3": (args.min_iip3, None),
+            "p1db": (args.min_p1db, None),
+        }
+        limits = {key: value for key, value in limits.items() if value != (None, None)}
+        result = montecarlo.run(
+            system=self.systems[args.name].system,
+            samples=args.samples,
+            seed=args.seed,
+            limits=limits,
+            pin=args.pin,
+            bandwidth=args.bw,
+            noise_temp=args.temp,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            samples_file=args.save_samples,
+        )
+        if args.save_samples:
+            self.output(f"Sample results saved to {args.save_samples}")
+        csv_lines = results.csv_montecarlo(result)
+        self.write_results(csv_lines, args.no_output, args.save)
+        return True
+
+    def spurs(self, args):
+        """Find the mixer spurs landing in the IF band."""
+        if not self.check_netlisted():
+            return False
+        result, args = validate_spur_args(args, self.systems)
+        if not result:
+            for error in args:
+                self.output(error)
+            return False
+
+        system = self.systems[args.name].system
+        mixer = system[args.mixer_index]
+        # Drive level at the mixer is the system input plus the gain before it
+        pin = args.pin + sum(
+            float(system[index].gain) for index in range(args.mixer_index)
+        )
+        points = 1 if args.lo_stop is None and args.rf_stop is None else args.points
+        lo_stop = args.lo_start if args.lo_stop is None else args.lo_stop
+        rf_stop = args.rf_start if args.rf_stop is None else args.rf_stop
+        lo = frequency.frequency_grid(args.lo_start, lo_stop, points)
+        rf = frequency.frequency_grid(args.rf_start, rf_stop, points)
+        result = spurs.find_spurs(
+            mixer, lo, rf, args.if_low, args.if_high, order=args.order, pin=pin
+        )
+        csv_lines = itertools.chain(
+            results.csv_spur_chart(spurs.spur_chart(mixer, args.order, pin)),
+            [""],
+            results.iter_csv_spurs(result),
+        )
+        self.write_results(csv_lines, args.no_output, args.save)
+        return True
+
+    def intermod(self, args):
+        """Simulate a multi-tone test and compare it with the cascade estimate."""
+        if not self.check_netlisted():
+            return False
+        result, args = validate_intermod_args(args, self.systems)
+        if not result:
+            for error in args:
+                self.output(error)
+            return False
+
+        system = self.systems[args.name].system
+        test = intermod.MultiToneTest(
+            system, args.tones, args.pin, args.sample_rate, args.chunk_size
+        )
+        result = test.run(args.samples)
+        estimate = cascade.run(system=system, pin=args.pin)
+        estimate["im3_dbc"] = round(float(system[-1].total_im3), 2)
+        estimate["im3"] = round(estimate["pout"] - estimate["im3_dbc"], 2)
+        csv_lines = results.iter_csv_intermod(result, estimate, args.spectrum)
+        self.write_results(csv_lines, args.no_output, args.save)
+        return True
+
+    def sensitivity(self, args):
+        """Get the derivatives of the cascade totals by every block parameter."""
+        if not self.check_netlisted():
+            return False
+        result, args = validate_sensitivity_args(args, self.systems)
+        if not result:
+            for error in args:
+                self.output(error)
+            return False
+
+        system = self.systems[args.name].system
+        result = sensitivity.run(system)
+        csv_lines = results.iter_csv_sensitivity(system, result)
+        self.write_results(csv_lines, args.no_output, args.save)
+        return True
+
+    def compression(self, args):
+        """Get the AM-AM and AM-PM curves and compression point of a system."""
+        if not self.check_netlisted():
+            return False
+        result, args = validate_compression_args(args, self.systems)
+        if not result:
+            for error in args:
+                self.output(error)
+            return False
+
+        pin = None
+        if args.pin_start is not None:
+            pin = sweep.pin_range(args.pin_start, args.pin_stop, args.pin_step)
+        result = compression.run(
+            system=self.systems[args.name].system,
+            pin=pin,
+            step=args.pin_step,
+            level=args.level,
+        )
+        csv_lines = results.iter_csv_compression(result)
+        self.write_results(csv_lines, args.no_output, args.save)
+        return True
+
+    def detector(self, args):
+        """Get the transfer curve and dynamic range of the detector of a system."""
+        if not self.check_netlisted():
+            return False
+        result, args = validate_detector_args(args, self.systems)
+        if not result:
+            for error in args:
+                self.output(error)
+            return False
+
+        pin = sweep.pin_range(args.pin_start, args.pin_stop, args.pin_step)
+        result = detection.run(
+            system=self.systems[args.name].system,
+            pin=pin,
+            bandwidth=args.bw,
+            noise_temp=args.temp,
+            tolerance=args.tolerance,
+        )
+        csv_lines = results.iter_csv_detector(result)
+        self.write_results(csv_lines, args.no_output, args.save)
+        return True
+
+    def waveform(self, args):
+        """Pass a file of samples through a system."""
+        if not self.check_netlisted():
+            return False
+        result, args = validate_waveform_args(args, self.systems)
+        if not result:
+            for error in args:
+                self.output(error)
+            return False
+
+        samples = waveform.load_samples(args.input, args.dtype)
+        chain = waveform.WaveformChain(
+            self.systems[args.name].system,
+            args.sample_rate,
+            noise_temp=args.temp,
+            seed=args.seed,
+            noise=not args.no_noise,
+        )
+        out = waveform.open_output(args.output, samples)
+        start = time.perf_counter()
+        chain.run(samples, out, args.chunk_size)
+        elapsed = time.perf_counter() - start
+        out.flush()
+        if not args.no_output:
+            rate = len(samples) / max(elapsed, 1e-9) / 1e6
+            self.output(
+                f"Processed {len(samples)} samples in {elapsed:.3g} s "
+                f"({rate:.3g} Msamples/s)"
+            )
+        self.output(f"Results saved to {args.output}")
+        return True
+
+    def optimize_order(self, args):
+        """Find the Pareto-optimal block orderings for noise figure and IIP3."""
+        if not self.check_netlisted():
+            return False
+        result, args = validate_order_args(args, self.systems)
+        if not result:
+            for error in args:
+                self.output(error)
+            return False
+
+        system = self.systems[args.name].system
+        orderings = ordering.run(system=system, fixed=args.fixed, workers=args.workers)
+        csv_lines = results.csv_ordering(system, orderings)
+        self.write_results(csv_lines, args.no_output, args.save)
+        return True
+
+    def explore(self, args):
+        """Find the non-dominated part choices of a design space."""
+        if not self.check_netlisted():
+            return False
+        if args.name not in self.systems or not hasattr(
+            self.systems[args.name], "slots"
+        ):
+            self.output(f"{args.name} not found in design space list.")
+            return False
+        errors = []
+        _resolve_save(args, "explore", errors)
+        for error in errors:
+            self.output(error)
+        if errors:
+            return False
+
+        slots = self.systems[args.name].slots
+        front = None
+        last_report = time.monotonic()
+        for covered, total, front in designspace.explore(slots, args.chunk_size):
+            if time.monotonic() - last_report > 2:
+                last_report = time.monotonic()
+                self.output(
+                    f"{100 * covered / total:.1f}% explored, "
+                    f"{len(front)} non-dominated chains"
+                )
+        csv_lines = results.csv_explore(slots, front.results() if front else [])
+        self.write_results(csv_lines, args.no_output, args.save)
+        return True
+
+
+def _save_each(chain_lines, directory):
+    """Save the csv lines of every system to its own file while passing them on."""
+    for name, lines in chain_lines:
+        save_file = os.path.join(directory, f"rf_cascade_results_{name}.csv")
+        results.save_csv(save_file, lines)
+        yield name, lines
+
+
+def run(args):
+    """
+    Run a batch of commands on a netlist without the interactive shell.
+
+    The netlist is parsed first, then the cascade analysis selected by
+    --cascade (or --all) runs, then the commands of --script.
+
+    :param args: Arguments parsed by the rfdesigner run parser.
+    :return: exit code (0 if every command succeeded, 1 otherwise).
+    """
+    session = Session()
+    # Keep the output to the analysis results
+    if not session.netlist(args, report_cache=False):
+        return 1
+    if (args.name is not None or args.all) and not session.cascade(args):
+        return 1
+    if args.script is not None and not session.run_script(args.script):
+        return 1
+    return 0
@@ -1,8 +1,15 @@
 """Generic component definitions."""
 import math
+import numpy as np
 from rfdesigner import const
+from rfdesigner.const import KBOLTZMAN
 
 VALID_UNITS = ["dBm", "dBA", "dBV", "dBW", "V", "A", "W"]
+COMPRESSION_MODELS = ["hard", "rapp", "tanh", "polynomial"]
+# Voltage gain of a block compressed by 1dB relative to its small-signal gain
+GAIN_1DB = 10 ** (-1 / 20)
+# Input of tanh where tanh(x) / x = GAIN_1DB
+TANH_1DB = 0.6124646942440782
 
 SUPPORTED = [
     const.ATTR_NAME,
@@ -12,11 +19,30 @@ SUPPORTED = [
     const.ATTR_IIP3,
     const.ATTR_OIP3,
     const.ATTR_P1DB,
+    const.ATTR_COMPRESSION,
+    const.ATTR_SMOOTHNESS,
+    const.ATTR_AM_PM,
+    const.ATTR_GAIN_SIGMA,
+    const.ATTR_GAIN_RANGE,
+    const.ATTR_NF_SIGMA,
+    const.ATTR_NF_RANGE,
+    const.ATTR_IIP3_SIGMA,
+    const.ATTR_IIP3_RANGE,
+    const.ATTR_P1DB_SIGMA,
+    const.ATTR_P1DB_RANGE,
 ]
 
 
 class RFSignal(float):
-    """Class representing an RF signal."""
+    """
+    Class representing an RF signal.
+
+    The float value is kept in the units the signal was created with.  Other
+    unit representations are computed from it on first access and cached on
+    the instance, so repeated reads only cost an attribute lookup.
+    """
+
+    __slots__ = ["_units"] + [f"_as_{units}" for units in VALID_UNITS + ["Vgain"]]
 
     def __new__(cls, value, *args, **kwargs):
         """Overload the new function for float class."""
@@ -24,128 +50,320 @@ class RFSignal(float):
 
     def __init__(self, *args, **kwargs):
         """Initialize the RFSignal data type."""
-        self.units = kwargs.get("units", "dBm")
-        if self.units not in VALID_UNITS:
-            self.units = "dBm"
-        if self.units == "dB":
-            self.units = "dBW"
+        units = kwargs.get("units", "dBm")
+        if units not in VALID_UNITS:
+            units = "dBm"
+        if units == "dB":
+            units = "dBW"
+        self._units = units
 
         super().__init__()
 
+    @property
+    def units(self):
+        """Get units of the value."""
+        return self._units
+
+    @units.setter
+    def units(self, value):
+        """Set units of the value (without converting it)."""
+        if value == self._units:
+            return
+        self._units = value
+        for units in VALID_UNITS + ["Vgain"]:
+            try:
+                delattr(self, f"_as_{units}")
+            except AttributeError:
+                pass
+
     def __add__(self, other):
         """Return class after add."""
         result = super(RFSignal, self).__add__(other)
-        return self.__class__(result, units=self.units)
+        return self.__class__(result, units=self._units)
 
     def __sub__(self, other):
         """Return class after subtraction."""
         result = super(RFSignal, self).__sub__(other)
-        return self.__class__(result, units=self.units)
+        return self.__class__(result, units=self._units)
 
     def __mul__(self, other):
         """Return class after multiplication."""
         result = super(RFSignal, self).__mul__(other)
-        return self.__class__(result, units=self.units)
+        return self.__class__(result, units=self._units)
 
     def __truediv__(self, other):
         """Return class after div."""
         result = super(RFSignal, self).__truediv__(other)
-        return self.__class__(result, units=self.units)
+        return self.__class__(result, units=self._units)
 
     def __pow__(self, other):
         """Return class after raised to power."""
         result = super(RFSignal, self).__pow__(other)
-        return self.__class__(result, units=self.units)
+        return self.__class__(result, units=self._units)
+
+    def _convert(self, units):
+        """Convert the value to other units."""
+        if units == self._units or (units == "Vgain" and self._units == "V"):
+            return self
+        value = float(self)
+        value_dBW = _to_dBW(value, self._units)
+        if units == "dBm":
+            return RFSignal(value_dBW + 30.0, units="dBm")
+        if units == "dBW":
+            return RFSignal(value_dBW, units="dBW")
+        if units in ["dBV", "dBA"]:
+            return RFSignal(2.0 * value_dBW, units=units)
+        if units == "Vgain":
+            return RFSignal(10 ** (value_dBW / 10), units="V")
+        power = _to_W(value, self._units, value_dBW)
+        if units == "W":
+            return RFSignal(power, units="W")
+        if units == "V":
+            return RFSignal(math.sqrt(power * 50.0), units="V")
+        return RFSignal(math.sqrt(power / 50.0), units="A")
+
+
+def _to_dBW(value, units):
+    """Convert a value in the given units to dBW."""
+    if units == "dBW":
+        return value
+    if units == "dBm":
+        return value - 30.0
+    if units in ["dBV", "dBA"]:
+        return 0.5 * value
+    return 10 * math.log10(_to_W(value, units))
+
+
+def _to_W(value, units, value_dBW=None):
+    """Convert a value in the given units to Watts."""
+    if units == "W":
+        return value
+    if units == "V":
+        return value ** 2 / 50.0
+    if units == "A":
+        return value ** 2 * 50.0
+    return 10 ** (value_dBW / 10.0)
+
+
+def _conversion_property(units, doc):
+    """Create a property returning the lazily cached value in other units."""
+    slot = f"_as_{units}"
+
+    def getter(self):
+        try:
+            return getattr(self, slot)
+        except AttributeError:
+            value = self._convert(units)
+            if value is not self:
+                # Caching the signal itself would make a reference cycle
+                setattr(self, slot, value)
+            return value
+
+    return property(getter, doc=doc)
+
+
+for _units, _doc in [
+    ("dBm", "Return value as dBm."),
+    ("dBW", "Return value as dBW."),
+    ("dBV", "Return value as dBV."),
+    ("dBA", "Return value as dBA."),
+    ("W", "Return value as Watts."),
+    ("V", "Return value as Volts."),
+    ("A", "Return value as Amps."),
+    ("Vgain", "Return value as V/V."),
+]:
+    setattr(RFSignal, _units, _conversion_property(_units, _doc))
+
+
+# Vectorized conversions to/from dBW and Watts for each unit type
+TO_DBW = {
+    "dBW": lambda x: x,
+    "dBm": lambda x: x - 30.0,
+    "dBV": lambda x: 0.5 * x,
+    "dBA": lambda x: 0.5 * x,
+    "W": lambda x: 10 * np.log10(x),
+    "V": lambda x: 10 * np.log10(x ** 2 / 50.0),
+    "A": lambda x: 10 * np.log10(x ** 2 * 50.0),
+}
+TO_W = {
+    "W": lambda x: x,
+    "V": lambda x: x ** 2 / 50.0,
+    "A": lambda x: x ** 2 * 50.0,
+}
+
+
+class RFSignalArray(np.ndarray):
+    """Class representing an array of RF signals sharing the same units."""
+
+    def __new__(cls, values, units="dBm"):
+        """Create the array from any array-like input."""
+        obj = np.asarray(values, dtype=float).view(cls)
+        obj.units = units if units in VALID_UNITS else "dBm"
+        return obj
+
+    def __array_finalize__(self, obj):
+        """Carry units through views, slices and ufunc results."""
+        self.units = getattr(obj, "units", "dBm")
+
+    def __array_wrap__(self, obj, context=None, return_scalar=False):
+        """Return reductions to a single value as plain numpy scalars."""
+        if obj.shape == ():
+            return obj.view(np.ndarray)[()]
+        return super().__array_wrap__(obj, context)
+
+    def __reduce__(self):
+        """Include units when pickling."""
+        reconstruct, arguments, state = super().__reduce__()
+        return reconstruct, arguments, (state, self.units)
+
+    def __setstate__(self, state):
+        """Restore units when unpickling."""
+        state, self.units = state
+        super().__setstate__(state)
+
+    def __getitem__(self, key):
+        """Return single elements as RFSignal objects."""
+        result = super().__getitem__(key)
+        if np.ndim(result) == 0:
+            return RFSignal(result, units=self.units)
+        return result
+
+    @property
+    def values(self):
+        """Return the underlying values as a plain numpy array."""
+        return self.view(np.ndarray)
 
     @property
     def dBm(self):
-        """Return value as dBm."""
+        """Return values as dBm."""
         if self.units == "dBm":
             return self
-        return RFSignal(self._convert_to_dBW() + 30.0)
+        return RFSignalArray(self._convert_to_dBW() + 30.0, units="dBm")
 
     @property
     def dBW(self):
-        """Return value is dBW."""
+        """Return values as dBW."""
         if self.units == "dBW":
             return self
-        return RFSignal(self._convert_to_dBW())
+        return RFSignalArray(self._convert_to_dBW(), units="dBW")
 
     @property
     def dBV(self):
-        """Return value as dBV."""
+        """Return values as dBV."""
         if self.units == "dBV":
             return self
-        return RFSignal(2.0 * self._convert_to_dBW())
+        return RFSignalArray(2.0 * self._convert_to_dBW(), units="dBV")
 
     @property
     def dBA(self):
-        """Return value as dBA."""
+        """Return values as dBA."""
         if self.units == "dBA":
             return self
-        return RFSignal(2.0 * self._convert_to_dBW())
+        return RFSignalArray(2.0 * self._convert_to_dBW(), units="dBA")
 
     @property
     def W(self):
-        """Return value as Watts."""
+        """Return values as Watts."""
         if self.units == "W":
             return self
-        return RFSignal(self._convert_to_W())
+        return RFSignalArray(self._convert_to_W(), units="W")
 
     @property
     def V(self):
-        """Return value as Volts."""
+        """Return values as Volts."""
         if self.units == "V":
             return self
-        return RFSignal(math.sqrt(self._convert_to_W() * 50.0))
+        return RFSignalArray(np.sqrt(self._convert_to_W() * 50.0), units="V")
 
     @property
     def A(self):
-        """Return value as Amps."""
+        """Return values as Amps."""
         if self.units == "A":
             return self
-        return RFSignal(math.sqrt(self._convert_to_W() / 50.0))
+        return RFSignalArray(np.sqrt(self._convert_to_W() / 50.0), units="A")
 
     @property
     def Vgain(self):
-        """Return value as V/V."""
+        """Return values as V/V."""
         if self.units == "V":
             return self
-        return RFSignal(10 ** (self._convert_to_dBW() / 10), units="V")
+        return RFSignalArray(10 ** (self._convert_to_dBW() / 10), units="V")
 
     def _convert_to_dBW(self):
         """Convert current units to dBW."""
-        if self.units == "dBW":
-            return self
-        if self.units == "dBm":
-            return self - 30.0
-        if self.units in ["dBV", "dBA"]:
-            return 0.5 * self
-        power = self
-        if self.units in ["V", "A"]:
-            power = self._convert_VA_to_W()
-        return 10 * math.log10(power)
-
-    def _convert_VA_to_W(self):
-        """Convert Volts of Amps to Watts with 50Ohm reference."""
-        power = self ** 2
-        if self.units == "A":
-            return power * 50.0
-        return power / 50.0
+        return TO_DBW[self.units](self.values)
 
     def _convert_to_W(self):
         """Convert current units to Watts."""
-        if self.units == "W":
-            return self
-        value_dBW = self
-        if self.units != "dBW":
-            value_dBW = self._convert_to_dBW()
-        return 10 ** (value_dBW / 10.0)
+        if self.units in TO_W:
+            return TO_W[self.units](self.values)
+        return 10 ** (self._convert_to_dBW() / 10.0)
+
+
+def add_noise(samples, power, rng):
+    """
+    Add white Gaussian noise to samples in place.
+
+    A complex envelope gets noise of the given power and a real waveform the
+    half of it below half the sample rate (see Generic.process for units).
+
+    :param samples: Array of real or complex samples.
+    :param power: Noise power in W over a bandwidth of the sample rate.
+    :param rng: numpy random Generator.
+    """
+    if power <= 0:
+        return
+    real_dtype = samples.real.dtype
+    if samples.dtype.kind == "c":
+        # Noise power is half the mean of |noise|**2, as for a tone
+        noise = rng.standard_normal(2 * len(samples), dtype=real_dtype)
+        noise *= math.sqrt(power)
+        samples += noise.view(samples.dtype)
+    else:
+        noise = rng.standard_normal(len(samples), dtype=real_dtype)
+        noise *= math.sqrt(power / 2)
+        samples += noise
+
+
+def rapp(x, smoothness=2):
+    """
+    Get the output of the Rapp AM-AM model.
+
+    :param x: Array of linear output amplitudes relative to the saturated output amplitude.
+    :param smoothness: Sharpness of the knee (large values approach a hard limiter).
+    :return: array of output amplitudes relative to the saturated output amplitude.
+    """
+    exponent = 2 * smoothness
+    return x / (1 + x ** exponent) ** (1 / exponent)
+
+
+def rapp_knee(smoothness=2):
+    """Get the input of the Rapp model where rapp(x) / x = GAIN_1DB."""
+    exponent = 2 * smoothness
+    return (GAIN_1DB ** -exponent - 1) ** (1 / exponent)
+
+
+class ProcessState:
+    """State of a block carried between consecutive blocks of processed samples."""
+
+    def __init__(self, sample_rate, seed=None, noise=True):
+        """
+        Initialize the state.
+
+        :param sample_rate: Sample rate in MHz.
+        :param seed: Seed (or numpy SeedSequence) of the noise of the block.
+        :param noise: Add the noise of the block to the samples.
+        """
+        self.sample_rate = float(sample_rate)
+        self.rng = np.random.default_rng(seed) if noise else None
 
 
 class Generic:
     """Class representing a generic RF component."""
 
+    # Incremented every time a parameter of any component changes
+    last_revision = 0
+
     def __init__(self, **kwargs):
         """
         Initialize generic class.
@@ -158,20 +376,30 @@ class Generic:
         :param p1db: 1dB compression point in dBm
         :param oip3: Output 3rd-order intercept point in dBm
         :param iip3: Input 3rd-order intercept point in dBm
+        :param compression: AM-AM compression model (one of COMPRESSION_MODELS).  Default hard.
+        :param smoothness: Knee smoothness of the rapp model.  Default 2.
+        :param am_pm: AM-PM phase shift in degrees at the 1dB compression point.  Default 0.
+        :param <prop>_sigma: Standard deviation of gain/nf/iip3/p1db in dB
+        :param <prop>_range: Uniform [min, max] range of gain/nf/iip3/p1db
         """
         self.name = kwargs.get("name", "")
+        self._touch()
         self._power = RFSignal(kwargs.get("power", 0), units="W")
         self._gain = RFSignal(kwargs.get("gain", 0), units="dBW")
         self._nf = RFSignal(kwargs.get("nf", -1 * self.gain), units="dBW")
         self._p1db = RFSignal(kwargs.get("p1db", math.inf), units="dBm")
         self._oip3 = RFSignal(kwargs.get("oip3", math.inf), units="dBm")
         self._iip3 = RFSignal(kwargs.get("iip3", math.inf), units="dBm")
+        self._compression = self._check_compression(kwargs.get("compression", "hard"))
+        self._smoothness = float(kwargs.get("smoothness", 2))
+        self._am_pm = float(kwargs.get("am_pm", 0))
 
         self._total_gain = RFSignal(0, units="dBW")
         self._total_nf = RFSignal(0, units="dBW")
         self._total_iip3 = RFSignal(0, units="dBm")
         self._total_p1db = RFSignal(0, units="dBm")
         self._estimate_nonlinearities()
+        self.tolerances = self._parse_tolerances(kwargs)
 
         self.is_compressed = False
         self._pout = RFSignal(0, units="dBm")
@@ -189,6 +417,28 @@ class Generic:
         if self.oip3 == math.inf:
             self.oip3 = self.iip3 + self.gain
 
+    @staticmethod
+    def _parse_tolerances(kwargs):
+        """Get the statistical spread declared for each property."""
+        tolerances = {}
+        for prop in const.TOLERANCE_PROPS:
+            if f"{prop}_sigma" in kwargs:
+                tolerances[prop] = ("normal", float(kwargs[f"{prop}_sigma"]))
+            if f"{prop}_range" in kwargs:
+                low, high = kwargs[f"{prop}_range"]
+                tolerances[prop] = ("uniform", float(low), float(high))
+        return tolerances
+
+    def _touch(self):
+        """Record that a parameter of this block changed."""
+        Generic.last_revision += 1
+        self.revision = Generic.last_revision
+
+    @property
+    def block_type(self):
+        """Get component class of the block (as for a ChainTable block view)."""
+        return self.__class__
+
     @property
     def power(self):
         """Get power value."""
@@ -198,6 +448,7 @@ class Generic:
     def power(self, value):
         """Set power value."""
         self._power = RFSignal(value, units="W")
+        self._touch()
 
     @property
     def gain(self):
@@ -208,6 +459,7 @@ class Generic:
     def gain(self, value):
         """Set gain value."""
         self._gain = RFSignal(value, units="dBW")
+        self._touch()
 
     @property
     def nf(self):
@@ -218,6 +470,7 @@ class Generic:
     def nf(self, value):
         """Set noise figure value."""
         self._nf = RFSignal(value, units="dBW")
+        self._touch()
 
     @property
     def p1db(self):
@@ -228,6 +481,7 @@ class Generic:
     def p1db(self, value):
         """Set p1db value."""
         self._p1db = RFSignal(value, units="dBm")
+        self._touch()
 
     @property
     def oip3(self):
@@ -238,6 +492,7 @@ class Generic:
     def oip3(self, value):
         """Set oip3 value."""
         self._oip3 = RFSignal(value, units="dBm")
+        self._touch()
 
     @property
     def iip3(self):
@@ -248,6 +503,51 @@ class Generic:
     def iip3(self, value):
         """Set iip3 value."""
         self._iip3 = RFSignal(value, units="dBm")
+        self._touch()
+
+    @staticmethod
+    def _check_compression(value):
+        """Get a compression model name, raising ValueError if it is unknown."""
+        model = str(value).lower()
+        if model not in COMPRESSION_MODELS:
+            raise ValueError(
+                f"Unknown compression model {value} "
+                f"(one of {', '.join(COMPRESSION_MODELS)})."
+            )
+        return model
+
+    @property
+    def compression(self):
+        """Get compression model."""
+        return self._compression
+
+    @compression.setter
+    def compression(self, value):
+        """Set compression model (one of COMPRESSION_MODELS)."""
+        self._compression = self._check_compression(value)
+        self._touch()
+
+    @property
+    def smoothness(self):
+        """Get knee smoothness of the rapp model."""
+        return self._smoothness
+
+    @smoothness.setter
+    def smoothness(self, value):
+        """Set knee smoothness of the rapp model."""
+        self._smoothness = float(value)
+        self._touch()
+
+    @property
+    def am_pm(self):
+        """Get AM-PM phase shift at the 1dB compression point in degrees."""
+        return self._am_pm
+
+    @am_pm.setter
+    def am_pm(self, value):
+        """Set AM-PM phase shift at the 1dB compression point in degrees."""
+        self._am_pm = float(value)
+        self._touch()
 
     @property
     def total_im3(self):
@@ -310,12 +610,223 @@ class Generic:
         if not isinstance(_pin, RFSignal):
             # Assume input power is dBm
             _pin = RFSignal(pin, units="dBm")
-        self._pout = _pin.dBm + self.gain
-        if _pin.dBm >= self.p1db - 1:
-            self.is_compressed = True
-            self._pout = self.gain + self.p1db - 1
+        pout, _, compressed = self.compress(_pin.dBm)
+        self.pout = float(pout)
+        self.is_compressed = bool(compressed)
         return self._pout
 
+    def output_array(self, pin):
+        """
+        Generate output for an array of input powers.
+
+        :param pin: Array of input powers in dBm (or an RFSignalArray).
+        :return: tuple of (output power RFSignalArray in dBm, compression mask)
+        """
+        pout, _, compressed = self.compress(pin)
+        return RFSignalArray(pout, units="dBm"), compressed
+
+    def compress(self, pin):
+        """
+        Get the AM-AM and AM-PM response of the compression model of the block.
+
+        Every model is compressed by 1dB at an input power of p1db, as in
+        cascade analysis.  The hard model holds the output at gain + p1db - 1
+        from an input power of p1db - 1, and the smooth models are fitted to
+        the same 1dB point (see gain_ratio).  The phase shift grows with the
+        gain compression and is am_pm at 1dB of compression.
+
+        :param pin: Array of input powers in dBm (or an RFSignalArray).
+        :return: tuple of (output power array in dBm, phase shift array in degrees, compression mask).
+        """
+        if isinstance(pin, RFSignalArray):
+            pin = pin.dBm.values
+        pin = np.asarray(pin, dtype=float)
+        gain = float(self.gain)
+        ratio = None
+        if self.compression == "hard":
+            p1db = float(self.p1db)
+            compressed = pin >= p1db - 1
+            pout = np.where(compressed, gain + p1db - 1, pin + gain)
+        else:
+            ratio = self.gain_ratio(pin)
+            with np.errstate(divide="ignore"):
+                pout = pin + gain + 20 * np.log10(ratio)
+            # Allow for rounding at exactly 1dB of compression
+            compressed = ratio <= GAIN_1DB * (1 + 1e-12)
+        if not self.am_pm:
+            return pout, np.zeros(pin.shape), compressed
+        if ratio is None:
+            ratio = 10 ** ((pout - pin - gain) / 20)
+        phase = self.am_pm * (1 - ratio) / (1 - GAIN_1DB)
+        return pout, phase, compressed
+
+    def gain_ratio(self, pin):
+        """
+        Get the voltage gain of the compression model relative to the small-signal gain.
+
+        The rapp and tanh models compress the linear output amplitude, scaled
+        so that it is at the 1dB point of the model where the input power is
+        p1db.  The polynomial model is the response of the odd polynomial
+        from :meth:`polynomial` to a tone, with the output held beyond its
+        peak (or beyond the smallest gain, if the a5 term makes it rise again).
+
+        :param pin: Array of input powers in dBm.
+        :return: array of voltage gain ratios (1 for no compression).
+        """
+        pin = np.asarray(pin, dtype=float)
+        if self.compression == "hard":
+            pout, _, _ = self.compress(pin)
+            return 10 ** ((pout - pin - float(self.gain)) / 20)
+        if self.compression == "polynomial":
+            a1, a3, a5 = self.polynomial()
+            if a3 == 0 and a5 == 0:
+                return np.ones(pin.shape)
+            limit = self.saturation_amplitude(envelope=True) ** 2
+            if a5 > 0 and a3 < 0:
+                # Without a peak the gain falls until the a5 term takes over
+                limit = min(limit, -0.75 * a3 / (2 * 0.625 * a5))
+            # A tone of amplitude A carries A**2 / 2 W
+            square = 2 * 10 ** ((pin - 30) / 10)
+            held = np.minimum(square, limit)
+            # The fundamental of a1*x + a3*x**3 + a5*x**5 for a tone of amplitude A
+            ratio = held * (0.625 * a5 / a1)
+            ratio += 0.75 * a3 / a1
+            ratio *= held
+            ratio += 1
+            ratio *= np.sqrt(held / square)
+            return ratio
+        if not math.isfinite(self.p1db):
+            return np.ones(pin.shape)
+        knee = rapp_knee(self.smoothness) if self.compression == "rapp" else TANH_1DB
+        x = 10 ** ((pin - float(self.p1db)) / 20)
+        x *= knee
+        if self.compression == "rapp":
+            return rapp(x, self.smoothness) / x
+        return np.tanh(x) / x
+
+    def polynomial(self):
+        """
+        Get an odd polynomial model of the block's transfer function.
+
+        y = a1*x + a3*x**3 + a5*x**5 with signals in sqrt(W) (a tone of
+        amplitude A carries A**2 / 2 W).  a1 gives the gain, a3 the IIP3 and
+        a5 moves the input 1dB compression point to p1db.
+
+        :return: tuple of (a1, a3, a5).
+        """
+        gain = float(self.gain)
+        a1 = 10 ** (gain / 20)
+        a3 = a5 = 0.0
+        if math.isfinite(self.iip3):
+            iip3_amplitude = 2 * 10 ** ((float(self.iip3) - 30) / 10)
+            a3 = -4 / 3 * a1 / iip3_amplitude
+        if math.isfinite(self.p1db):
+            # Squared input amplitude where the output is compressed by 1dB
+            p1db_amplitude = 2 * 10 ** ((float(self.p1db) - 30) / 10)
+            compression = (10 ** (-1 / 20) - 1) * a1 - 0.75 * a3 * p1db_amplitude
+            a5 = compression / (0.625 * p1db_amplitude ** 2)
+        return a1, a3, a5
+
+    def saturation_amplitude(self, envelope=False):
+        """
+        Get the input amplitude where the polynomial of the block stops rising.
+
+        :param envelope: Use the polynomial of the envelope of a complex signal.
+        :return: amplitude in sqrt(W) (inf if the polynomial keeps rising).
+        """
+        a1, a3, a5 = self.polynomial()
+        if envelope:
+            a3, a5 = 0.75 * a3, 0.625 * a5
+        # The slope a1 + 3*a3*x**2 + 5*a5*x**4 is a quadratic in x**2
+        roots = np.roots([5 * a5, 3 * a3, a1])
+        squares = [
+            root.real
+            for root in roots
+            if root.real > 0 and abs(root.imag) <= 1e-12 * abs(root)
+        ]
+        return math.sqrt(min(squares)) if squares else math.inf
+
+    def process(self, samples, state=None, out=None):
+        """
+        Pass a block of samples through the block.
+
+        Real samples are a passband waveform and complex samples a baseband
+        envelope, with signals in sqrt(W) (a tone of amplitude A carries
+        A**2 / 2 W).  The input referred noise of the block is added first,
+        then the polynomial of the block (see polynomial) is applied to the
+        waveform or to the envelope, holding the output at its peak beyond
+        saturation_amplitude.
+
+        :param samples: Array of samples.
+        :param state: ProcessState of the block, carried from the previous samples (None for no noise).
+        :param out: Array to write the output to (may be samples).
+        :return: array of output samples.
+        """
+        samples = np.asarray(samples)
+        if out is None:
+            dtype = samples.dtype if samples.dtype.kind in "fc" else float
+            out = np.array(samples, dtype=dtype)
+        elif out is not samples:
+            out[...] = samples
+        envelope = out.dtype.kind == "c"
+        if state is not None and state.rng is not None:
+            add_noise(out, self.noise_power(state.sample_rate), state.rng)
+
+        a1, a3, a5 = self.polynomial()
+        if a3 == 0 and a5 == 0:
+            out *= a1
+            return out
+        limit = self.saturation_amplitude(envelope)
+        if envelope:
+            a3, a5 = 0.75 * a3, 0.625 * a5
+            square = out.real ** 2 + out.imag ** 2
+            if math.isfinite(limit):
+                over = square > limit ** 2
+                out[over] *= limit / np.sqrt(square[over])
+                np.minimum(square, limit ** 2, out=square)
+        else:
+            if math.isfinite(limit):
+                np.clip(out, -limit, limit, out=out)
+            square = out * out
+        # a1*x + a3*x**3 + a5*x**5 = x * (a1 + x**2 * (a3 + a5 * x**2))
+        gain = square * a5
+        gain += a3
+        gain *= square
+        gain += a1
+        out *= gain
+        return out
+
+    def noise_power(self, sample_rate):
+        """
+        Get the input referred noise power the block adds to sampled signals.
+
+        :param sample_rate: Sample rate in MHz.
+        :return: noise power in W over a bandwidth of the sample rate.
+        """
+        excess = 10 ** (float(self.nf) / 10) - 1
+        return KBOLTZMAN * 290 * max(excess, 0) * sample_rate * 1e6
+
+    def response(self, freqs):
+        """
+        Get the complex voltage gain of the block at each frequency.
+
+        :param freqs: Array of frequencies in MHz.
+        """
+        freqs = np.asarray(freqs, dtype=float)
+        return np.full(freqs.shape, 10 ** (float(self.gain) / 20), dtype=complex)
+
+    def corner_frequencies(self):
+        """Get the frequencies in MHz where the response of the block changes."""
+        return []
+
+    def nf_response(self, gain):
+        """
+        Get the noise figure of the block in dB at each frequency.
+
+        :param gain: Array of block gains in dB at each frequency (see response).
+        """
+        return np.full(np.shape(gain), float(self.nf))
+
     @property
     def supported(self):
         """Return list of supported categories."""
@@ -324,3 +835,7 @@ class Generic:
 
 class Passive(Generic):
     """Class representing a generic passive."""
+
+    def nf_response(self, gain):
+        """Get the noise figure at each frequency, which tracks the passive's loss."""
+        return float(self.nf) + float(self.gain) - np.asarray(gain, dtype=float)
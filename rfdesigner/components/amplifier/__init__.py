@@ -1,5 +1,6 @@
 """Initialize the Amplifier objects."""
 import math
+import numpy as np
 from rfdesigner import const
 from rfdesigner.components import Generic, SUPPORTED
 
@@ -18,8 +19,50 @@ class Amplifier(Generic):
         :param fbw: cutoff frequency of the amplifier in MHz
         """
         super().__init__(**kwargs)
-        self.f3db = kwargs.get("f3db", math.inf)
-        self.fbw = kwargs.get("fbw", math.inf)
+        self._f3db = float(kwargs.get("f3db", math.inf))
+        self._fbw = float(kwargs.get("fbw", math.inf))
+
+    @property
+    def f3db(self):
+        """Get dominant pole frequency in MHz."""
+        return self._f3db
+
+    @f3db.setter
+    def f3db(self, value):
+        """Set dominant pole frequency in MHz."""
+        self._f3db = float(value)
+        self._touch()
+
+    @property
+    def fbw(self):
+        """Get cutoff frequency in MHz."""
+        return self._fbw
+
+    @fbw.setter
+    def fbw(self, value):
+        """Set cutoff frequency in MHz."""
+        self._fbw = float(value)
+        self._touch()
+
+    def response(self, freqs):
+        """
+        Get the complex voltage gain of the amplifier at each frequency.
+
+        The dominant pole (f3db) and the cutoff (fbw) are modeled as two real
+        poles of the gain, each left out while its frequency is infinite.
+
+        :param freqs: Array of frequencies in MHz.
+        """
+        freqs = np.asarray(freqs, dtype=float)
+        response = super().response(freqs)
+        for pole in [self.f3db, self.fbw]:
+            if math.isfinite(pole):
+                response /= 1 + 1j * freqs / pole
+        return response
+
+    def corner_frequencies(self):
+        """Get the finite pole frequencies in MHz."""
+        return [pole for pole in [self.f3db, self.fbw] if math.isfinite(pole)]
 
     @property
     def supported(self):
@@ -1,4 +1,5 @@
 """Initialize the detector class."""
+import numpy as np
 from rfdesigner import const
 from rfdesigner.components import RFSignal
 from rfdesigner.components.amplifier import Amplifier, AMP_SUPPORTED
@@ -41,6 +42,7 @@ class Detector(Amplifier):
     def law(self, value):
         """Set law value."""
         self._law = value.lower()
+        self._touch()
 
     @property
     def mds(self):
@@ -52,6 +54,7 @@ class Detector(Amplifier):
     def mds(self, value):
         """Set mds value."""
         self._mds = RFSignal(value, units=LAW_UNIT_MAP[self.law])
+        self._touch()
 
     @property
     def smax(self):
@@ -63,6 +66,7 @@ class Detector(Amplifier):
     def smax(self, value):
         """Set smax value."""
         self._smax = RFSignal(value, units=LAW_UNIT_MAP[self.law])
+        self._touch()
 
     def output(self, pin=0):
         """Get output power values."""
@@ -71,6 +75,23 @@ class Detector(Amplifier):
         self._pout = min(self._pout.dBm, self.smax.dBm + self.gain)
         return self._pout
 
+    def output_array(self, pin):
+        """Get output power values for an array of input powers."""
+        pout, compressed = super().output_array(pin)
+        pout = np.maximum(pout, self.mds.dBm + self.gain)
+        pout = np.minimum(pout, self.smax.dBm + self.gain)
+        return pout, compressed
+
+    def transfer(self, pin):
+        """
+        Get the detector reading for an array of input powers.
+
+        :param pin: Array of input powers in dBm (or an RFSignalArray).
+        :return: RFSignalArray of readings in the units of the law (dBm for log, W for square and V for rms).
+        """
+        pout, _ = self.output_array(pin)
+        return getattr(pout, LAW_UNIT_MAP[self.law])
+
     @property
     def supported(self):
         """Return supported features."""
@@ -1,14 +1,220 @@
 """Initialize the filter classes."""
-from rfdesigner.components import Passive
+import hashlib
+import math
+from collections import OrderedDict
+import numpy as np
+from rfdesigner import const
+from rfdesigner.components import Passive, SUPPORTED
+from rfdesigner.components.filter import design
 
+FILTER_SUPPORTED = [
+    const.ATTR_FC,
+    const.ATTR_ORDER,
+    const.ATTR_PROTOTYPE,
+    const.ATTR_RIPPLE,
+    const.ATTR_ATTENUATION,
+] + SUPPORTED
+BPF_SUPPORTED = [const.ATTR_BANDWIDTH] + FILTER_SUPPORTED
 
-class LPF(Passive):
+# Number of evaluated filter responses kept for reuse
+RESPONSE_CACHE_SIZE = 32
+_responses = OrderedDict()
+
+
+def _grid_key(freqs):
+    """Get a hashable key identifying a frequency grid."""
+    digest = hashlib.blake2b(freqs.tobytes(), digest_size=16).digest()
+    return freqs.shape, digest
+
+
+class Filter(Passive):
+    """Representation of a filter shaped by an analog prototype."""
+
+    kind = "lpf"
+
+    def __init__(self, **kwargs):
+        """
+        Initialize a filter object.
+
+        Extends the Passive class with the following optional inputs.  A
+        filter without a cutoff frequency has a flat response.
+        :param fc: Cutoff frequency (center frequency of a bandpass) in MHz
+        :param order: Order of the lowpass prototype.  Default 3.
+        :param prototype: Prototype type, butter/cheby1/ellip.  Default butter.
+        :param ripple: Passband ripple in dB of cheby1 and ellip filters.  Default 0.5.
+        :param attenuation: Stopband attenuation in dB of ellip filters.  Default 40.
+        """
+        super().__init__(**kwargs)
+        self._fc = float(kwargs.get("fc", math.nan))
+        self._order = int(kwargs.get("order", 3))
+        self._prototype = str(kwargs.get("prototype", "butter")).lower()
+        self._ripple = float(kwargs.get("ripple", 0.5))
+        self._attenuation = float(kwargs.get("attenuation", 40))
+
+    @property
+    def fc(self):
+        """Get cutoff frequency in MHz."""
+        return self._fc
+
+    @fc.setter
+    def fc(self, value):
+        """Set cutoff frequency in MHz."""
+        self._fc = float(value)
+        self._touch()
+
+    @property
+    def order(self):
+        """Get prototype order."""
+        return self._order
+
+    @order.setter
+    def order(self, value):
+        """Set prototype order."""
+        self._order = int(value)
+        self._touch()
+
+    @property
+    def prototype(self):
+        """Get prototype type."""
+        if self._prototype not in design.PROTOTYPES:
+            self._prototype = "butter"
+        return self._prototype
+
+    @prototype.setter
+    def prototype(self, value):
+        """Set prototype type."""
+        self._prototype = str(value).lower()
+        self._touch()
+
+    @property
+    def ripple(self):
+        """Get passband ripple in dB."""
+        return self._ripple
+
+    @ripple.setter
+    def ripple(self, value):
+        """Set passband ripple in dB."""
+        self._ripple = float(value)
+        self._touch()
+
+    @property
+    def attenuation(self):
+        """Get stopband attenuation in dB."""
+        return self._attenuation
+
+    @attenuation.setter
+    def attenuation(self, value):
+        """Set stopband attenuation in dB."""
+        self._attenuation = float(value)
+        self._touch()
+
+    @property
+    def shaped(self):
+        """Return True if the filter has a frequency dependent response."""
+        return self.order > 0 and math.isfinite(self.fc) and self.fc > 0
+
+    def design_key(self):
+        """Get the parameters that define the shape of the response."""
+        return (
+            self.kind,
+            self.prototype,
+            self.order,
+            self.ripple,
+            self.attenuation,
+            self.fc,
+        )
+
+    def response(self, freqs):
+        """
+        Get the complex voltage gain of the filter at each frequency.
+
+        Responses are cached per parameter set and frequency grid, so equal
+        filters (or an unchanged filter) are only evaluated once.  The
+        returned array is read-only.
+
+        :param freqs: Array of frequencies in MHz.
+        """
+        freqs = np.asarray(freqs, dtype=float)
+        if not self.shaped:
+            return super().response(freqs)
+        key = (self.design_key(), float(self.gain), _grid_key(freqs))
+        if key in _responses:
+            _responses.move_to_end(key)
+            return _responses[key]
+        zeros, poles, gain = design.zpk(*self.design_key())
+        response = design.evaluate(zeros, poles, gain, freqs)
+        response *= 10 ** (float(self.gain) / 20)
+        response.setflags(write=False)
+        _responses[key] = response
+        if len(_responses) > RESPONSE_CACHE_SIZE:
+            _responses.popitem(last=False)
+        return response
+
+    def corner_frequencies(self):
+        """Get the cutoff frequency in MHz of a shaped filter."""
+        return [self.fc] if self.shaped else []
+
+    @property
+    def supported(self):
+        """Return list of supported categories."""
+        return FILTER_SUPPORTED
+
+
+class LPF(Filter):
     """Representation of a low pass filter."""
 
 
-class HPF(Passive):
+class HPF(Filter):
     """Representation of a high pass filter."""
 
+    kind = "hpf"
+
 
-class BPF(Passive):
+class BPF(Filter):
     """Representation of a band pass filter."""
+
+    kind = "bpf"
+
+    def __init__(self, **kwargs):
+        """
+        Initialize a band pass filter object.
+
+        Extends the Filter class with the following optional input.
+        :param bandwidth: Width of the passband in MHz, centered (geometrically) on fc
+        """
+        super().__init__(**kwargs)
+        self._bandwidth = float(kwargs.get("bandwidth", math.nan))
+
+    @property
+    def bandwidth(self):
+        """Get passband width in MHz."""
+        return self._bandwidth
+
+    @bandwidth.setter
+    def bandwidth(self, value):
+        """Set passband width in MHz."""
+        self._bandwidth = float(value)
+        self._touch()
+
+    @property
+    def shaped(self):
+        """Return True if the filter has a frequency dependent response."""
+        bandwidth = self.bandwidth
+        return super().shaped and math.isfinite(bandwidth) and bandwidth > 0
+
+    def design_key(self):
+        """Get the parameters that define the shape of the response."""
+        return super().design_key() + (self.bandwidth,)
+
+    def corner_frequencies(self):
+        """Get the passband edges in MHz of a shaped filter."""
+        if not self.shaped:
+            return []
+        half = self.bandwidth / 2
+        low = math.sqrt(half ** 2 + self.fc ** 2) - half
+        return [low, low + self.bandwidth]
+
+    @property
+    def supported(self):
+        """Return list of supported categories."""
+        return BPF_SUPPORTED
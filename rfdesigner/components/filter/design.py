@@ -0,0 +1,174 @@
+"""Analog filter prototypes and frequency transformations."""
+import functools
+import math
+import numpy as np
+
+PROTOTYPES = ["butter", "cheby1", "ellip"]
+# Number of Landen transformations, enough for double precision
+LANDEN_STEPS = 7
+
+
+def landen(k):
+    """Get the descending Landen sequence of elliptic moduli starting at k."""
+    moduli = []
+    for _ in range(LANDEN_STEPS):
+        k = (k / (1 + math.sqrt(1 - k * k))) ** 2
+        moduli.append(k)
+    return moduli
+
+
+def ellipk(k):
+    """Get the complete elliptic integral of the first kind of modulus k."""
+    return math.pi / 2 * np.prod([1 + v for v in landen(k)])
+
+
+def cde(u, k):
+    """Get the Jacobi elliptic function cd(uK, k) for complex u."""
+    w = np.cos(np.asarray(u) * math.pi / 2)
+    for v in reversed(landen(k)):
+        w = (1 + v) * w / (1 + v * w ** 2)
+    return w
+
+
+def sne(u, k):
+    """Get the Jacobi elliptic function sn(uK, k) for complex u."""
+    w = np.sin(np.asarray(u) * math.pi / 2)
+    for v in reversed(landen(k)):
+        w = (1 + v) * w / (1 + v * w ** 2)
+    return w
+
+
+def acde(w, k):
+    """Get u such that cd(uK, k) = w (inverse of cde)."""
+    previous = k
+    w = np.asarray(w, dtype=complex)
+    for v in landen(k):
+        w = w / (1 + np.sqrt(1 - w ** 2 * previous ** 2)) * 2 / (1 + v)
+        previous = v
+    u = 2 / math.pi * np.arccos(w)
+    ratio = ellipk(math.sqrt(1 - k * k)) / ellipk(k)
+    return _symmetric_rem(u.real, 4) + 1j * _symmetric_rem(u.imag, 2 * ratio)
+
+
+def asne(w, k):
+    """Get u such that sn(uK, k) = w (inverse of sne)."""
+    return 1 - acde(w, k)
+
+
+def _symmetric_rem(x, y):
+    """Get the remainder of x / y in [-y/2, y/2]."""
+    z = x - y * np.round(x / y)
+    return np.where(np.abs(z) == y / 2, np.abs(z), z)
+
+
+def ellipdeg(order, k1):
+    """Get the selectivity modulus of an elliptic filter from its discrimination k1."""
+    u = (2 * np.arange(1, order // 2 + 1) - 1) / order
+    k1p = math.sqrt(1 - k1 * k1)
+    kp = k1p ** order * np.prod(sne(u, k1p)) ** 4
+    return math.sqrt(1 - kp * kp)
+
+
+@functools.lru_cache(maxsize=None)
+def lowpass_prototype(prototype="butter", order=3, ripple=0.5, attenuation=40):
+    """
+    Get the zeros, poles and gain of a lowpass prototype with a 1 rad/s cutoff.
+
+    The cutoff is the -3dB frequency of a Butterworth filter and the edge of
+    the ripple band of Chebyshev (cheby1) and elliptic (ellip) filters.
+
+    :param prototype: One of PROTOTYPES.
+    :param order: Filter order.
+    :param ripple: Passband ripple in dB (cheby1 and ellip).
+    :param attenuation: Minimum stopband attenuation in dB (ellip).
+    :return: tuple of (zeros, poles, gain) with zeros and poles as tuples.
+    """
+    angles = math.pi * (2 * np.arange(1, order + 1) - 1) / (2 * order)
+    zeros = np.array([])
+    passband = 1.0
+    if prototype == "cheby1":
+        epsilon = math.sqrt(10 ** (ripple / 10) - 1)
+        mu = math.asinh(1 / epsilon) / order
+        poles = -math.sinh(mu) * np.sin(angles) + 1j * math.cosh(mu) * np.cos(angles)
+        if order % 2 == 0:
+            passband = 1 / math.sqrt(1 + epsilon ** 2)
+    elif prototype == "ellip":
+        epsilon = math.sqrt(10 ** (ripple / 10) - 1)
+        k1 = epsilon / math.sqrt(10 ** (attenuation / 10) - 1)
+        k = ellipdeg(order, k1)
+        u = (2 * np.arange(1, order // 2 + 1) - 1) / order
+        zeta = cde(u, k)
+        zeros = 1j / (k * zeta)
+        v0 = -1j * asne(1j / epsilon, k1) / order
+        poles = 1j * cde(u - 1j * v0, k)
+        zeros = np.concatenate([zeros, zeros.conj()])
+        poles = np.concatenate([poles, poles.conj()])
+        if order % 2:
+            poles = np.append(poles, (1j * sne(1j * v0, k)).real)
+        else:
+            passband = 1 / math.sqrt(1 + epsilon ** 2)
+    else:
+        poles = -np.sin(angles) + 1j * np.cos(angles)
+    gain = passband * np.real(np.prod(-poles) / np.prod(-zeros))
+    return tuple(zeros), tuple(poles), float(gain)
+
+
+@functools.lru_cache(maxsize=256)
+def zpk(kind, prototype, order, ripple, attenuation, fc, bandwidth=math.nan):
+    """
+    Get the zeros, poles and gain of a filter with frequencies in MHz.
+
+    Evaluating the result at s = jf gives the response at frequency f.
+
+    :param kind: "lpf", "hpf" or "bpf".
+    :param prototype: One of PROTOTYPES.
+    :param order: Order of the lowpass prototype.
+    :param ripple: Passband ripple in dB (cheby1 and ellip).
+    :param attenuation: Minimum stopband attenuation in dB (ellip).
+    :param fc: Cutoff frequency (center frequency for bpf) in MHz.
+    :param bandwidth: Passband width in MHz (bpf).
+    :return: tuple of (zeros, poles, gain) as numpy arrays and a float.
+    """
+    zeros, poles, gain = lowpass_prototype(prototype, order, ripple, attenuation)
+    zeros = np.array(zeros, dtype=complex)
+    poles = np.array(poles, dtype=complex)
+    degree = len(poles) - len(zeros)
+    if kind == "hpf":
+        gain *= np.real(np.prod(-zeros) / np.prod(-poles))
+        zeros = np.append(fc / zeros, np.zeros(degree))
+        poles = fc / poles
+    elif kind == "bpf":
+        # Each prototype root maps to the two roots of s^2 - r*bw*s + fc^2
+        zeros = np.append(_bandpass_roots(zeros, fc, bandwidth), np.zeros(degree))
+        poles = _bandpass_roots(poles, fc, bandwidth)
+        gain *= bandwidth ** degree
+    else:
+        zeros = zeros * fc
+        poles = poles * fc
+        gain *= fc ** degree
+    return zeros, poles, float(gain)
+
+
+def _bandpass_roots(roots, fc, bandwidth):
+    """Map lowpass prototype roots to bandpass roots."""
+    half = roots * bandwidth / 2
+    offset = np.sqrt(half ** 2 - fc ** 2)
+    return np.concatenate([half + offset, half - offset])
+
+
+def evaluate(zeros, poles, gain, freqs):
+    """
+    Evaluate a zeros, poles and gain description at s = jf.
+
+    :param freqs: Array of frequencies in MHz.
+    :return: complex response at each frequency.
+    """
+    s = 1j * np.asarray(freqs, dtype=float)
+    response = np.full(s.shape, gain, dtype=complex)
+    # One root at a time keeps memory use at a few copies of the grid
+    for zero in zeros:
+        response *= s - zero
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for pole in poles:
+            response /= s - pole
+    return response
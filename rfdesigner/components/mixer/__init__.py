@@ -1,6 +1,122 @@
 """Initialize the mixer class."""
-from rfdesigner.components import Passive
+import math
+import numpy as np
+from rfdesigner import const
+from rfdesigner.components import Passive, SUPPORTED
+
+MIXER_SUPPORTED = [
+    const.ATTR_LO,
+    const.ATTR_LO_REJECTION,
+    const.ATTR_RF_REJECTION,
+    const.ATTR_EVEN_REJECTION,
+    const.ATTR_SPUR_PIN,
+] + SUPPORTED
 
 
 class Mixer(Passive):
     """Representation of a mixer object."""
+
+    def __init__(self, **kwargs):
+        """
+        Initialize a mixer object.
+
+        Extends the Passive class with the following optional inputs, which
+        estimate the level of a m*LO + n*RF product relative to the desired
+        output (see spur_levels).
+        :param lo: LO frequency in MHz
+        :param lo_rejection: Rejection in dB per LO harmonic above the first.  Default 10.
+        :param rf_rejection: Rejection in dB per RF harmonic above the first at spur_pin.  Default 15.
+        :param even_rejection: Extra rejection in dB of an even LO or RF order.  Default 0.
+        :param spur_pin: RF input power in dBm the rejections were measured at.  Default -10.
+        """
+        super().__init__(**kwargs)
+        self._lo = float(kwargs.get("lo", math.nan))
+        self._lo_rejection = float(kwargs.get("lo_rejection", 10))
+        self._rf_rejection = float(kwargs.get("rf_rejection", 15))
+        self._even_rejection = float(kwargs.get("even_rejection", 0))
+        self._spur_pin = float(kwargs.get("spur_pin", -10))
+
+    @property
+    def lo(self):
+        """Get LO frequency in MHz."""
+        return self._lo
+
+    @lo.setter
+    def lo(self, value):
+        """Set LO frequency in MHz."""
+        self._lo = float(value)
+        self._touch()
+
+    @property
+    def lo_rejection(self):
+        """Get rejection per LO harmonic in dB."""
+        return self._lo_rejection
+
+    @lo_rejection.setter
+    def lo_rejection(self, value):
+        """Set rejection per LO harmonic in dB."""
+        self._lo_rejection = float(value)
+        self._touch()
+
+    @property
+    def rf_rejection(self):
+        """Get rejection per RF harmonic in dB."""
+        return self._rf_rejection
+
+    @rf_rejection.setter
+    def rf_rejection(self, value):
+        """Set rejection per RF harmonic in dB."""
+        self._rf_rejection = float(value)
+        self._touch()
+
+    @property
+    def even_rejection(self):
+        """Get extra rejection of even orders in dB."""
+        return self._even_rejection
+
+    @even_rejection.setter
+    def even_rejection(self, value):
+        """Set extra rejection of even orders in dB."""
+        self._even_rejection = float(value)
+        self._touch()
+
+    @property
+    def spur_pin(self):
+        """Get RF input power of the spur rejections in dBm."""
+        return self._spur_pin
+
+    @spur_pin.setter
+    def spur_pin(self, value):
+        """Set RF input power of the spur rejections in dBm."""
+        self._spur_pin = float(value)
+        self._touch()
+
+    def spur_levels(self, m, n, pin=None):
+        """
+        Estimate the level of mixing products relative to the desired output.
+
+        Every LO harmonic above the first costs lo_rejection and every RF
+        harmonic above the first costs rf_rejection, plus even_rejection for
+        an even LO and for an even RF order.  An n-th order RF product moves
+        n dB per dB of RF drive while the desired output moves 1 dB, so the
+        level rises by (|n| - 1) dB per dB of input power above spur_pin.
+
+        :param m: Array of LO multiples.
+        :param n: Array of RF multiples (signed).
+        :param pin: RF input power in dBm (spur_pin by default).
+        :return: array of levels in dBc.
+        """
+        m = np.abs(np.asarray(m))
+        n = np.abs(np.asarray(n))
+        pin = self.spur_pin if pin is None else pin
+        even = (m % 2 == 0).astype(float) + (n % 2 == 0)
+        rejection = np.maximum(m - 1, 0) * self.lo_rejection
+        rejection = rejection + np.maximum(n - 1, 0) * self.rf_rejection
+        rejection = rejection + even * self.even_rejection
+        # Adding zero gives 0.0 rather than -0.0 for levels at the reference drive
+        return (n - 1) * (pin - self.spur_pin) - rejection + 0.0
+
+    @property
+    def supported(self):
+        """Return list of supported categories."""
+        return MIXER_SUPPORTED
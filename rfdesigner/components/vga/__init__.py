@@ -45,6 +45,7 @@ class VGA(Amplifier):
     def gain(self, value):
         """Set the gain value."""
         self._gain = RFSignal(value, units="dBW")
+        self._touch()
 
     @property
     def gain_min(self):
@@ -55,6 +56,7 @@ class VGA(Amplifier):
     def gain_min(self, value):
         """Set the gain_min value."""
         self._gain_min = RFSignal(value, units="dBW")
+        self._touch()
 
     @property
     def gain_max(self):
@@ -65,6 +67,7 @@ class VGA(Amplifier):
     def gain_max(self, value):
         """Set the gain_max value."""
         self._gain_max = RFSignal(value, units="dBW")
+        self._touch()
 
     @property
     def gain_step(self):
@@ -75,6 +78,7 @@ class VGA(Amplifier):
     def gain_step(self, value):
         """Set the gain_step value."""
         self._gain_step = RFSignal(value, units="dBW")
+        self._touch()
 
     @property
     def control(self):
@@ -85,6 +89,18 @@ class VGA(Amplifier):
     def control(self, value):
         """Set the vga control voltage."""
         self._control = RFSignal(value, units="V")
+        self._touch(control=True)
+
+    def _touch(self, control=False):
+        """
+        Record that a parameter of this block changed.
+
+        :param control: True if only the control voltage changed.
+        """
+        super()._touch()
+        if not control:
+            # Gain-state tables already cover every control code
+            self.table_revision = self.revision
 
     @property
     def supported(self):
@@ -10,7 +10,21 @@ KBOLTZMAN = 1.38e-23
 
 # General attributes
 # Property name, Description, Units
+ATTR_AM_PM = ["am_pm", "AM-PM phase shift at the 1dB compression point", "deg"]
+ATTR_ATTENUATION = ["attenuation", "Stopband attenuation of an elliptic filter", "dB"]
+ATTR_BANDWIDTH = ["bandwidth", "Passband width of a band pass filter", "MHz"]
+ATTR_COMPRESSION = [
+    "compression",
+    "AM-AM compression model (hard, rapp, tanh or polynomial)",
+    "",
+]
 ATTR_CONTROL = ["control", "Control voltage", "V"]
+ATTR_EVEN_REJECTION = [
+    "even_rejection",
+    "Extra spur rejection of even LO or RF orders (balanced mixer)",
+    "dB",
+]
+ATTR_FC = ["fc", "Cutoff frequency (center of a band pass) of the filter", "MHz"]
 ATTR_F3DB = ["f3db", "Dominant pole frequency of the block (3dB roll-off)", "MHz"]
 ATTR_FBW = ["fbw", "Cutoff frequency of the block", "MHz"]
 ATTR_GAIN = ["gain", "Gain of the block", "dB"]
@@ -19,13 +33,48 @@ ATTR_GAIN_MIN = ["gain_min", "Minimum block gain", "dB"]
 ATTR_GAIN_STEP = ["gain_step", "Gain control step/LSB", "dB"]
 ATTR_IIP3 = ["iip3", "Input 3rd-order intercept", "dBm"]
 ATTR_LAW = ["law", "Detector law", "log/square/rms"]
+ATTR_LO = ["lo", "LO frequency of the mixer", "MHz"]
+ATTR_LO_REJECTION = ["lo_rejection", "Spur rejection per LO harmonic order", "dB"]
 ATTR_MDS = ["mds", "Minimum detectable signal", "dBm"]
 ATTR_NAME = ["name", "Name of block (for example, a part name)", ""]
 ATTR_NF = ["nf", "Noise figure of the block", "dB"]
 ATTR_OIP3 = ["oip3", "Output 3rd-order intercept", "dBm"]
+ATTR_ORDER = ["order", "Order of the filter prototype", ""]
 ATTR_P1DB = ["p1db", "Output 1dB Compression point", "dBm"]
 ATTR_POWER = ["power", "Power consumption of the block", "W"]
+ATTR_PROTOTYPE = ["prototype", "Filter prototype (butter, cheby1 or ellip)", ""]
+ATTR_RIPPLE = ["ripple", "Passband ripple of a cheby1 or ellip filter", "dB"]
+ATTR_RF_REJECTION = [
+    "rf_rejection",
+    "Spur rejection per RF harmonic order at spur_pin",
+    "dB",
+]
 ATTR_SMAX = ["smax", "Maximum input signal", "dBm"]
+ATTR_SMOOTHNESS = ["smoothness", "Knee smoothness of the rapp compression model", ""]
+ATTR_SPUR_PIN = [
+    "spur_pin",
+    "Mixer RF input power the spur rejection applies at",
+    "dBm",
+]
+
+# Tolerance attributes for Monte Carlo analysis
+TOLERANCE_PROPS = ["gain", "nf", "iip3", "p1db"]
+ATTR_GAIN_SIGMA = ["gain_sigma", "Gain standard deviation", "dB"]
+ATTR_GAIN_RANGE = ["gain_range", "Gain uniform [min, max] range", "dB"]
+ATTR_NF_SIGMA = ["nf_sigma", "Noise figure standard deviation", "dB"]
+ATTR_NF_RANGE = ["nf_range", "Noise figure uniform [min, max] range", "dB"]
+ATTR_IIP3_SIGMA = ["iip3_sigma", "Input 3rd-order intercept standard deviation", "dB"]
+ATTR_IIP3_RANGE = [
+    "iip3_range",
+    "Input 3rd-order intercept uniform [min, max] range",
+    "dBm",
+]
+ATTR_P1DB_SIGMA = ["p1db_sigma", "1dB Compression point standard deviation", "dB"]
+ATTR_P1DB_RANGE = [
+    "p1db_range",
+    "1dB Compression point uniform [min, max] range",
+    "dBm",
+]
 
 # Project package variable
 REQUIRED_PYTHON_VER = (3, 5, 0)
@@ -1,52 +1,117 @@
 """Netlist utility for RFDesigner."""
+import mmap
+import re
 from os.path import isfile
 from collections import OrderedDict
+from collections.abc import Mapping
 import toml
-from rfdesigner.components import Generic, Passive
-from rfdesigner.components.amplifier import Amplifier, LNA, PowerAmp
-from rfdesigner.components.detector import Detector
-from rfdesigner.components.filter import LPF, BPF, HPF
-from rfdesigner.components.mixer import Mixer
-from rfdesigner.components.vga import VGA
-
-
-IMPLEMENTED_BLOCKS = {
-    "generic": Generic,
-    "passive": Passive,
-    "amplifier": Amplifier,
-    "amp": Amplifier,
-    "lna": LNA,
-    "poweramp": PowerAmp,
-    "pa": PowerAmp,
-    "power_amp": PowerAmp,
-    "detector": Detector,
-    "lpf": LPF,
-    "lowpass": LPF,
-    "bpf": BPF,
-    "bandpass": BPF,
-    "hpf": HPF,
-    "highpass": HPF,
-    "mixer": Mixer,
-    "demod": Mixer,
-    "demodulator": Mixer,
-    "modulator": Mixer,
-    "vga": VGA,
-}
-
-
-def parse_netlist(file_name):
-    """Parse a TOML formatted netlist file."""
+from rfdesigner import cache
+from rfdesigner.chaintable import ChainTable
+from rfdesigner.components import COMPRESSION_MODELS
+from rfdesigner.registry import IMPLEMENTED_BLOCKS
+
+SIM_NAMES = ["sim", "simulator", "simulation"]
+
+# Start of a table header line, and the bare first key of the header
+HEADER_LINE = re.compile(rb"^[ \t]*\[[^\r\n]*", re.MULTILINE)
+BARE_HEADER = re.compile(rb"\[\[?[ \t]*([A-Za-z0-9_-]+)[ \t]*[.\]]")
+
+
+def parse_netlist(
+    file_name, compact=False, use_cache=True, lazy=False, cache_report=None
+):
+    """
+    Parse a TOML formatted netlist file.
+
+    Fully valid netlists are stored in an on-disk cache keyed by the file
+    content and rfdesigner version, so parsing an unchanged file again only
+    memory-maps the stored block tables.  Unless compact is set, a cache hit
+    still builds a component object for every block from those tables.
+
+    :param file_name: Netlist file to parse.
+    :param compact: Store each signal chain as a ChainTable instead of a list of components.
+    :param use_cache: Load from and store to the netlist cache.
+    :param lazy: Return a SystemRegistry that only builds systems when they are accessed.
+    :param cache_report: Function called with True on a cache hit and False on a miss.
+    """
     if not isfile(file_name):
         print(f"Netlist file {file_name} not found!")
         return None
+    if use_cache:
+        entries = cache.load(file_name, IMPLEMENTED_BLOCKS)
+        if cache_report is not None:
+            cache_report(entries is not None)
+        if entries is not None:
+            if lazy:
+                return SystemRegistry.from_cache(entries, compact=compact)
+            return systems_from_cache(entries, compact=compact)
+    if lazy:
+        # Storing the cache needs every system, so lazy parsing only reads it
+        return SystemRegistry.from_file(file_name, compact=compact)
     netlist = OrderedDict(toml.load(file_name))
     system_list = {}
+    valid = True
     for name, system in netlist.items():
-        if name in ["sim", "simulator", "simulation"]:
+        if name in SIM_NAMES:
             system_list["sim"] = system
             continue
-        if validate_signal_chain(name, system):
-            system_list[name] = SignalChain(name, system)
+        system = build_system(name, system, compact=compact)
+        if system is None:
+            valid = False
+            continue
+        system_list[name] = system
+    if use_cache and valid:
+        # Invalid netlists are not cached so their errors are reported every time
+        cache.store(file_name, systems_to_cache(system_list))
+    return system_list
+
+
+def build_system(name, system, compact=False):
+    """
+    Validate a netlisted system and create its object.
+
+    :param name: Name of the system.
+    :param system: Netlisted blocks of the system.
+    :param compact: Store a signal chain as a ChainTable instead of a list of components.
+    :return: SignalChain or DesignSpace (if any block lists candidates), or None if invalid.
+    """
+    if not validate_signal_chain(name, system):
+        return None
+    if any(isinstance(value, list) for value in system.values()):
+        return DesignSpace(name, system)
+    return SignalChain(name, system, compact=compact)
+
+
+def systems_to_cache(system_list):
+    """Get the cache entries of parsed systems."""
+    entries = {}
+    for name, system in system_list.items():
+        if name == "sim":
+            entries[name] = system
+        elif isinstance(system, DesignSpace):
+            entries[name] = [ChainTable.from_blocks(slot) for slot in system.slots]
+        elif isinstance(system.system, ChainTable):
+            entries[name] = system.system
+        else:
+            entries[name] = ChainTable.from_blocks(system.system)
+    return entries
+
+
+def systems_from_cache(entries, compact=False):
+    """
+    Create parsed systems from cache entries.
+
+    :param entries: Dictionary of cache entries as returned by cache.load.
+    :param compact: Keep each signal chain as a ChainTable instead of a list of components.
+    """
+    system_list = {}
+    for name, entry in entries.items():
+        if name == "sim":
+            system_list[name] = entry
+        elif isinstance(entry, list):
+            system_list[name] = DesignSpace.from_tables(name, entry)
+        else:
+            system_list[name] = SignalChain.from_table(name, entry, compact=compact)
     return system_list
 
 
@@ -56,23 +121,199 @@ def validate_signal_chain(name, system):
         print("Cannot find first block in signal chain (missing key: 1)")
         return False
     for entry, value in system.items():
-        try:
-            if value["type"].lower() not in IMPLEMENTED_BLOCKS:
-                print(f"{value['type']} is not a valid block entry.")
+        candidates = value if isinstance(value, list) else [value]
+        for candidate in candidates:
+            try:
+                if candidate["type"].lower() not in IMPLEMENTED_BLOCKS:
+                    print(f"{candidate['type']} is not a valid block entry.")
+                    return False
+            except KeyError:
+                print(f"'type' not defined for block #{entry} in {name}")
+                return False
+            compression = str(candidate.get("compression", "hard")).lower()
+            if compression not in COMPRESSION_MODELS:
+                print(
+                    f"{candidate['compression']} is not a valid compression model "
+                    f"for block #{entry} in {name}."
+                )
                 return False
-        except KeyError:
-            print(f"'type' not defined for block #{entry} in {name}")
-            return False
     return True
 
 
+class SystemRegistry(Mapping):
+    """
+    Read-only mapping of system names to systems built on first access.
+
+    Systems are validated and created only when they are looked up, so the
+    cost of a session scales with the systems it uses.  Invalid systems are
+    reported when first accessed and then behave as missing keys.
+    """
+
+    def __init__(self, loaders):
+        """
+        Initialize the registry.
+
+        :param loaders: Dictionary of {name: function returning the system, or None if invalid}.
+        """
+        self._loaders = loaders
+        self._systems = {}
+
+    @classmethod
+    def from_file(cls, file_name, compact=False):
+        """
+        Index the top-level tables of a netlist file without parsing it.
+
+        Only table header lines are scanned; the byte ranges of every table
+        belonging to a system are parsed when the system is first accessed.
+
+        :param file_name: Netlist file to index.
+        :param compact: Store each signal chain as a ChainTable instead of a list of components.
+        """
+        spans = OrderedDict()
+        with open(file_name, "rb") as netlist_file:
+            size = netlist_file.seek(0, 2)
+            if size == 0:
+                return cls({})
+            with mmap.mmap(netlist_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                headers = []
+                for match in HEADER_LINE.finditer(data):
+                    name = cls._header_name(match.group())
+                    if name is not None:
+                        headers.append((match.start(), name))
+                preamble = data[: headers[0][0] if headers else size]
+        stops = [start for start, _ in headers[1:]] + [size]
+        for (start, name), stop in zip(headers, stops):
+            spans.setdefault(name, []).append((start, stop))
+
+        loaders = OrderedDict()
+        # Keys before the first header (such as inline tables) are parsed now
+        for name, system in toml.loads(preamble.decode()).items():
+            loader = cls._dict_loader(name, system, compact)
+            loaders["sim" if name in SIM_NAMES else name] = loader
+        for name, name_spans in spans.items():
+            loader = cls._span_loader(file_name, name, name_spans, compact)
+            loaders["sim" if name in SIM_NAMES else name] = loader
+        return cls(loaders)
+
+    @classmethod
+    def from_cache(cls, entries, compact=False):
+        """
+        Create a registry over cache entries.
+
+        :param entries: Dictionary of cache entries as returned by cache.load.
+        :param compact: Keep each signal chain as a ChainTable instead of a list of components.
+        """
+        loaders = OrderedDict(
+            (name, cls._cache_loader(name, entry, compact))
+            for name, entry in entries.items()
+        )
+        return cls(loaders)
+
+    @staticmethod
+    def _header_name(line):
+        """Get the top-level key of a table header line (None if not a header)."""
+        match = BARE_HEADER.match(line.lstrip())
+        if match:
+            return match.group(1).decode()
+        try:
+            # Quoted keys, or a line of a multi-line array that is not a header
+            parsed = toml.loads(line.decode())
+        except (toml.TomlDecodeError, UnicodeDecodeError):
+            return None
+        return next(iter(parsed), None)
+
+    @staticmethod
+    def _dict_loader(name, system, compact):
+        """Create a loader for an already parsed system."""
+        if name in SIM_NAMES:
+            return lambda: system
+        return lambda: build_system(name, system, compact=compact)
+
+    @staticmethod
+    def _cache_loader(name, entry, compact):
+        """Create a loader for a cache entry."""
+        return lambda: systems_from_cache({name: entry}, compact=compact)[name]
+
+    @staticmethod
+    def _span_loader(file_name, name, spans, compact):
+        """Create a loader parsing the byte ranges of a system."""
+
+        def load():
+            chunks = []
+            with open(file_name, "rb") as netlist_file:
+                for start, stop in spans:
+                    netlist_file.seek(start)
+                    chunks.append(netlist_file.read(stop - start))
+            system = toml.loads(b"".join(chunks).decode())[name]
+            return SystemRegistry._dict_loader(name, system, compact)()
+
+        return load
+
+    def is_loaded(self, name):
+        """Check if a system has already been built."""
+        return name in self._systems
+
+    def __getitem__(self, name):
+        """Get a system, building it on first access."""
+        if name not in self._systems:
+            self._systems[name] = self._loaders[name]()
+        system = self._systems[name]
+        if system is None:
+            raise KeyError(name)
+        return system
+
+    def __iter__(self):
+        """Iterate over indexed system names."""
+        return iter(self._loaders)
+
+    def __len__(self):
+        """Get number of indexed systems."""
+        return len(self._loaders)
+
+
 class SignalChain:
     """Object representing a signal chain."""
 
-    def __init__(self, name, system):
-        """Initialize the signal chain object."""
+    def __init__(self, name, system, compact=False):
+        """
+        Initialize the signal chain object.
+
+        :param name: Name of the signal chain.
+        :param system: Netlisted blocks of the signal chain.
+        :param compact: Store blocks as a ChainTable instead of a list of components.
+        """
         self.name = name
         self.system = self.generate_system_list(system)
+        if compact:
+            self.system = ChainTable.from_blocks(self.system)
+
+    @classmethod
+    def from_table(cls, name, table, compact=False):
+        """
+        Create a signal chain from a ChainTable.
+
+        :param name: Name of the signal chain.
+        :param table: ChainTable with the blocks of the signal chain.
+        :param compact: Keep the blocks as the ChainTable instead of a list of components.
+        """
+        chain = cls.__new__(cls)
+        chain.name = name
+        chain.system = table if compact else table.to_blocks()
+        return chain
+
+    def stream(self, chunks, sample_rate, **kwargs):
+        """
+        Pass a stream of sample chunks through the signal chain.
+
+        :param chunks: Iterable of arrays of samples (see waveform.iter_chunks).
+        :param sample_rate: Sample rate in MHz.
+        :param kwargs: Options of waveform.WaveformChain.
+        :return: generator of output chunks.
+        """
+        # Only streaming needs the waveform simulation
+        from rfdesigner.simulation import waveform
+
+        return waveform.WaveformChain(self.system, sample_rate, **kwargs).stream(chunks)
 
     def generate_system_list(self, system):
         """Create a list from netlisted system."""
@@ -81,3 +322,48 @@ class SignalChain:
             props = system[block_number]
             system_list.append(IMPLEMENTED_BLOCKS[props["type"].lower()](**props))
         return system_list
+
+
+class DesignSpace:
+    """Object representing a choice of candidate parts for every block."""
+
+    def __init__(self, name, system):
+        """
+        Initialize the design space object.
+
+        :param name: Name of the design space.
+        :param system: Netlisted blocks where each entry is a block or a list of candidate blocks.
+        """
+        self.name = name
+        self.slots = self.generate_slots(system)
+        self.system = [candidates[0] for candidates in self.slots]
+
+    @classmethod
+    def from_tables(cls, name, tables):
+        """
+        Create a design space from one ChainTable of candidates per slot.
+
+        :param name: Name of the design space.
+        :param tables: List of ChainTables, one per position in the signal chain.
+        """
+        space = cls.__new__(cls)
+        space.name = name
+        space.slots = [table.to_blocks() for table in tables]
+        space.system = [candidates[0] for candidates in space.slots]
+        return space
+
+    @staticmethod
+    def generate_slots(system):
+        """Create a list of candidate blocks per position in the signal chain."""
+        slots = []
+        for block_number in sorted(system, key=int):
+            entries = system[block_number]
+            if not isinstance(entries, list):
+                entries = [entries]
+            slots.append(
+                [
+                    IMPLEMENTED_BLOCKS[props["type"].lower()](**props)
+                    for props in entries
+                ]
+            )
+        return slots
@@ -1,13 +1,14 @@
 """Module to handle argument parsing."""
 import argparse
 from rfdesigner.const import __version__
-from rfdesigner.netlist import IMPLEMENTED_BLOCKS
+from rfdesigner.registry import IMPLEMENTED_BLOCKS
 
 
 def entry_arguments():
     """Get valid arguments to be used at CLI entry."""
     parser = argparse.ArgumentParser(
-        description="RFDesigner: RF system design, simplified."
+        description="RFDesigner: RF system design, simplified.",
+        parents=[cache_arguments()],
     )
     parser.add_argument("--version", action="version", version=__version__)
     parser.add_argument(
@@ -21,21 +22,442 @@ def entry_arguments():
         help="Dispaly list of properties that can be used for the given block type.",
     )
     parser.add_argument("--validate", type=str, help="Validate provided netlist file.")
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    commands.add_parser(
+        "run",
+        # Keep a --no-cache given before the subcommand
+        parents=[run_arguments(), cache_arguments(default=argparse.SUPPRESS)],
+        help="Run analyses on a netlist without entering the interactive session.",
+    )
+
+    return parser
+
 
+def cache_arguments(default=False):
+    """
+    Get a parent parser with the option to bypass the netlist cache.
+
+    :param default: Value when the option is not given (argparse.SUPPRESS keeps the value of an enclosing parser).
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=default,
+        help="Always parse the netlist file instead of using the netlist cache",
+    )
     return parser
 
 
+def netlist_arguments():
+    """Get valid arguments for netlisting."""
+    parser = argparse.ArgumentParser(parents=[cache_arguments()])
+    parser.add_argument("file", type=str, help="Netlist file to parse")
+    add_netlist_options(parser)
+
+    return parser
+
+
+def add_netlist_options(parser):
+    """Add the options controlling how a netlist file is parsed to a parser."""
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Store signal chains in a compact columnar table",
+    )
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help="Only parse and build a system when it is first used",
+    )
+
+
 def cascade_arguments():
     """Get valid arguments for cascade analysis."""
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "--name",
         type=str,
-        help="Name of system to perform cascade analysis on (from netlist)",
+        help="Name of system to perform cascade analysis on (from netlist), or a glob pattern such as 'rx_*'",
+    )
+    parser.add_argument(
+        "--all", action="store_true", help="Perform cascade analysis on every system"
     )
+    add_cascade_options(parser)
+
+    return parser
+
+
+def add_cascade_options(parser):
+    """Add the cascade analysis options (other than system selection) to a parser."""
     parser.add_argument("--pin", type=float, help="Input power in dBm")
+    parser.add_argument(
+        "--pin-start", type=float, help="Start of input power sweep in dBm"
+    )
+    parser.add_argument(
+        "--pin-stop", type=float, help="Stop of input power sweep in dBm (inclusive)"
+    )
+    parser.add_argument(
+        "--pin-step", type=float, default=1, help="Input power sweep step in dB"
+    )
     parser.add_argument("--bw", type=float, help="Signal bandwidth in MHz")
     parser.add_argument("--temp", type=int, help="Noise temperature in Kelvin")
+    parser.add_argument(
+        "--enbw",
+        action="store_true",
+        help="Use the equivalent noise bandwidth of the system response instead of --bw",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for several systems (0 for one per core)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=16,
+        help="Number of systems sent to a worker at a time",
+    )
+    parser.add_argument("--save", "-s", type=str, help="Location to store results")
+    parser.add_argument(
+        "--format",
+        choices=["csv", "columns"],
+        default="csv",
+        help="Format of saved results (columns is a compact binary format)",
+    )
+    parser.add_argument(
+        "--no-output", action="store_true", help="Supress results outputing to terminal"
+    )
+
+
+def frequency_arguments():
+    """Get valid arguments for frequency response analysis."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--name", type=str, help="Name of system to analyze (from netlist)"
+    )
+    parser.add_argument("--start", type=float, help="Start frequency in MHz")
+    parser.add_argument("--stop", type=float, help="Stop frequency in MHz (inclusive)")
+    parser.add_argument(
+        "--points", type=int, default=1001, help="Number of frequency points"
+    )
+    parser.add_argument(
+        "--log", action="store_true", help="Space frequency points logarithmically"
+    )
+    parser.add_argument("--save", "-s", type=str, help="Location to store results")
+    parser.add_argument(
+        "--format",
+        choices=["csv", "columns"],
+        default="csv",
+        help="Format of saved results (columns is a compact binary format)",
+    )
+    parser.add_argument(
+        "--no-output", action="store_true", help="Supress results outputing to terminal"
+    )
+
+    return parser
+
+
+def spurs_arguments():
+    """Get valid arguments for mixer spur analysis."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--name", type=str, help="Name of system containing the mixer (from netlist)"
+    )
+    parser.add_argument(
+        "--block",
+        type=str,
+        help="Mixer to analyze (netlist number or name, first mixer by default)",
+    )
+    parser.add_argument(
+        "--lo-start", type=float, help="LO frequency (or start of LO sweep) in MHz"
+    )
+    parser.add_argument("--lo-stop", type=float, help="Stop of LO sweep in MHz")
+    parser.add_argument(
+        "--rf-start", type=float, help="RF frequency (or start of RF sweep) in MHz"
+    )
+    parser.add_argument("--rf-stop", type=float, help="Stop of RF sweep in MHz")
+    parser.add_argument(
+        "--points", type=int, default=1001, help="Number of points of a sweep"
+    )
+    parser.add_argument("--if-low", type=float, help="Lower edge of the IF band in MHz")
+    parser.add_argument(
+        "--if-high", type=float, help="Upper edge of the IF band in MHz"
+    )
+    parser.add_argument(
+        "--order", type=int, default=5, help="Highest order of mixing products"
+    )
+    parser.add_argument("--pin", type=float, help="Input power of the system in dBm")
+    parser.add_argument("--save", "-s", type=str, help="Location to store results")
+    parser.add_argument(
+        "--no-output", action="store_true", help="Supress results outputing to terminal"
+    )
+
+    return parser
+
+
+def intermod_arguments():
+    """Get valid arguments for multi-tone intermodulation simulation."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--name", type=str, help="Name of system to simulate (from netlist)"
+    )
+    parser.add_argument(
+        "--tones", type=float, nargs="+", help="Tone frequencies in MHz"
+    )
+    parser.add_argument("--pin", type=float, help="Input power of each tone in dBm")
+    parser.add_argument(
+        "--sample-rate",
+        type=float,
+        help="Sample rate in MHz (10 times the highest tone by default)",
+    )
+    parser.add_argument(
+        "--samples", type=int, default=1 << 20, help="Number of samples simulated"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1 << 16,
+        help="Number of samples per FFT (sets the frequency resolution)",
+    )
+    parser.add_argument(
+        "--spectrum", action="store_true", help="Include the output spectrum in results"
+    )
+    parser.add_argument("--save", "-s", type=str, help="Location to store results")
+    parser.add_argument(
+        "--no-output", action="store_true", help="Supress results outputing to terminal"
+    )
+
+    return parser
+
+
+def sensitivity_arguments():
+    """Get valid arguments for sensitivity analysis."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--name", type=str, help="Name of system to analyze (from netlist)"
+    )
+    parser.add_argument("--save", "-s", type=str, help="Location to store results")
+    parser.add_argument(
+        "--no-output", action="store_true", help="Supress results outputing to terminal"
+    )
+
+    return parser
+
+
+def compression_arguments():
+    """Get valid arguments for AM-AM and AM-PM compression analysis."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--name", type=str, help="Name of system to analyze (from netlist)"
+    )
+    parser.add_argument(
+        "--pin-start",
+        type=float,
+        help="Start of input power sweep in dBm (30 dB below the first block to compress by default)",
+    )
+    parser.add_argument(
+        "--pin-stop",
+        type=float,
+        help="Stop of input power sweep in dBm (10 dB above the first block to compress by default)",
+    )
+    parser.add_argument(
+        "--pin-step", type=float, default=0.1, help="Input power sweep step in dB"
+    )
+    parser.add_argument(
+        "--level",
+        type=float,
+        default=1,
+        help="Compression in dB of the compression point",
+    )
+    parser.add_argument("--save", "-s", type=str, help="Location to store results")
+    parser.add_argument(
+        "--no-output", action="store_true", help="Supress results outputing to terminal"
+    )
+
+    return parser
+
+
+def detector_arguments():
+    """Get valid arguments for detector transfer curve analysis."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--name", type=str, help="Name of system with a detector (from netlist)"
+    )
+    parser.add_argument(
+        "--pin-start", type=float, help="Start of input power sweep in dBm"
+    )
+    parser.add_argument(
+        "--pin-stop", type=float, help="Stop of input power sweep in dBm (inclusive)"
+    )
+    parser.add_argument(
+        "--pin-step", type=float, default=1, help="Input power sweep step in dB"
+    )
+    parser.add_argument("--bw", type=float, help="Signal bandwidth in MHz")
+    parser.add_argument("--temp", type=int, help="Noise temperature in Kelvin")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1,
+        help="Largest linearity error in dB of the dynamic range",
+    )
+    parser.add_argument("--save", "-s", type=str, help="Location to store results")
+    parser.add_argument(
+        "--no-output", action="store_true", help="Supress results outputing to terminal"
+    )
+
+    return parser
+
+
+def waveform_arguments():
+    """Get valid arguments for passing a waveform through a system."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--name", type=str, help="Name of system to simulate (from netlist)"
+    )
+    parser.add_argument(
+        "--input", type=str, help="File of input samples in sqrt(W) (.npy or raw)"
+    )
+    parser.add_argument(
+        "--output", type=str, help="File to write output samples (.npy)"
+    )
+    parser.add_argument("--sample-rate", type=float, help="Sample rate in MHz")
+    parser.add_argument(
+        "--dtype",
+        choices=["complex64", "complex128", "float32", "float64"],
+        default="complex64",
+        help="Sample type of a raw input file (complex for baseband, real for passband)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1 << 16,
+        help="Number of samples processed at a time",
+    )
+    parser.add_argument(
+        "--temp", type=float, help="Temperature (K) of noise added at the input"
+    )
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible noise")
+    parser.add_argument(
+        "--no-noise", action="store_true", help="Do not add the noise of the blocks"
+    )
+    parser.add_argument(
+        "--no-output", action="store_true", help="Supress results outputing to terminal"
+    )
+
+    return parser
+
+
+def run_arguments():
+    """Get valid arguments for running commands without the interactive session."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("file", type=str, help="Netlist file to parse")
+    add_netlist_options(parser)
+    parser.add_argument(
+        "--script",
+        type=str,
+        help="File of interactive session commands to run (one per line)",
+    )
+    parser.add_argument(
+        "--cascade",
+        dest="name",
+        type=str,
+        metavar="NAME",
+        help="Name (or glob pattern) of system to perform cascade analysis on",
+    )
+    parser.add_argument(
+        "--all", action="store_true", help="Perform cascade analysis on every system"
+    )
+    add_cascade_options(parser)
+
+    return parser
+
+
+def montecarlo_arguments():
+    """Get valid arguments for Monte Carlo analysis."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--name",
+        type=str,
+        help="Name of system to perform Monte Carlo analysis on (from netlist)",
+    )
+    parser.add_argument(
+        "--samples", "-n", type=int, default=10000, help="Number of samples to draw"
+    )
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible runs")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (0 for one per core)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=100000,
+        help="Number of samples simulated at a time",
+    )
+    parser.add_argument("--min-gain", type=float, help="Minimum gain limit in dB")
+    parser.add_argument("--max-gain", type=float, help="Maximum gain limit in dB")
+    parser.add_argument("--max-nf", type=float, help="Maximum noise figure in dB")
+    parser.add_argument("--min-iip3", type=float, help="Minimum IIP3 limit in dBm")
+    parser.add_argument("--min-p1db", type=float, help="Minimum P1dB limit in dBm")
+    parser.add_argument("--pin", type=float, help="Input power in dBm")
+    parser.add_argument("--bw", type=float, help="Signal bandwidth in MHz")
+    parser.add_argument("--temp", type=int, help="Noise temperature in Kelvin")
+    parser.add_argument("--save", "-s", type=str, help="Location to store results")
+    parser.add_argument(
+        "--save-samples",
+        type=str,
+        help="File to store the results of every sample in (binary column format)",
+    )
+    parser.add_argument(
+        "--no-output", action="store_true", help="Supress results outputing to terminal"
+    )
+
+    return parser
+
+
+def optimize_order_arguments():
+    """Get valid arguments for block ordering optimization."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--name", type=str, help="Name of system to reorder (from netlist)"
+    )
+    parser.add_argument(
+        "--fix",
+        action="append",
+        default=[],
+        metavar="POSITION=BLOCK",
+        help="Keep a block (netlist number or name) at a position in the chain",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (0 for one per core)",
+    )
+    parser.add_argument("--save", "-s", type=str, help="Location to store results")
+    parser.add_argument(
+        "--no-output", action="store_true", help="Supress results outputing to terminal"
+    )
+
+    return parser
+
+
+def explore_arguments():
+    """Get valid arguments for design-space exploration."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--name", type=str, help="Name of design space to explore (from netlist)"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=100000,
+        help="Maximum number of chains evaluated at a time",
+    )
     parser.add_argument("--save", "-s", type=str, help="Location to store results")
     parser.add_argument(
         "--no-output", action="store_true", help="Supress results outputing to terminal"
@@ -0,0 +1,64 @@
+"""Registry of the block types usable in a netlist."""
+import importlib
+from collections.abc import Mapping
+
+# Netlist block type: (module, class name)
+BLOCK_PATHS = {
+    "generic": ("rfdesigner.components", "Generic"),
+    "passive": ("rfdesigner.components", "Passive"),
+    "amplifier": ("rfdesigner.components.amplifier", "Amplifier"),
+    "amp": ("rfdesigner.components.amplifier", "Amplifier"),
+    "lna": ("rfdesigner.components.amplifier", "LNA"),
+    "poweramp": ("rfdesigner.components.amplifier", "PowerAmp"),
+    "pa": ("rfdesigner.components.amplifier", "PowerAmp"),
+    "power_amp": ("rfdesigner.components.amplifier", "PowerAmp"),
+    "detector": ("rfdesigner.components.detector", "Detector"),
+    "lpf": ("rfdesigner.components.filter", "LPF"),
+    "lowpass": ("rfdesigner.components.filter", "LPF"),
+    "bpf": ("rfdesigner.components.filter", "BPF"),
+    "bandpass": ("rfdesigner.components.filter", "BPF"),
+    "hpf": ("rfdesigner.components.filter", "HPF"),
+    "highpass": ("rfdesigner.components.filter", "HPF"),
+    "mixer": ("rfdesigner.components.mixer", "Mixer"),
+    "demod": ("rfdesigner.components.mixer", "Mixer"),
+    "demodulator": ("rfdesigner.components.mixer", "Mixer"),
+    "modulator": ("rfdesigner.components.mixer", "Mixer"),
+    "vga": ("rfdesigner.components.vga", "VGA"),
+}
+
+
+class BlockRegistry(Mapping):
+    """
+    Read-only mapping of block type names to component classes.
+
+    Names are known up front, but a component module is only imported when
+    one of its classes is looked up.
+    """
+
+    def __init__(self, paths):
+        """
+        Initialize the registry.
+
+        :param paths: Dictionary of {block type: (module, class name)}.
+        """
+        self._paths = paths
+
+    def __getitem__(self, name):
+        """Get the component class of a block type, importing it if needed."""
+        module, class_name = self._paths[name]
+        return getattr(importlib.import_module(module), class_name)
+
+    def __contains__(self, name):
+        """Check if a block type exists without importing it."""
+        return name in self._paths
+
+    def __iter__(self):
+        """Iterate over block type names."""
+        return iter(self._paths)
+
+    def __len__(self):
+        """Get number of block types."""
+        return len(self._paths)
+
+
+IMPLEMENTED_BLOCKS = BlockRegistry(BLOCK_PATHS)
@@ -0,0 +1,145 @@
+"""Vectorized cascade analysis of many signal chains at once."""
+import numpy as np
+from rfdesigner.chaintable import ChainTable
+from rfdesigner.simulation import rfmath
+
+# Values that make a padded block transparent to every cascade formula
+PAD_VALUES = {"gain": 0.0, "nf": 0.0, "iip3": np.inf, "p1db": np.inf}
+
+
+def pack_systems(systems):
+    """
+    Pack a list of systems into padded arrays.
+
+    :param systems: List of systems (each a sequential list of RF objects or a ChainTable).
+    :return: dictionary of (n_chains x n_blocks) arrays for gain, nf, iip3 and p1db along with a boolean 'mask' array that is True wherever a block exists.
+    """
+    n_chains = len(systems)
+    n_blocks = max((len(system) for system in systems), default=0)
+    arrays = {
+        prop: np.full((n_chains, n_blocks), pad) for prop, pad in PAD_VALUES.items()
+    }
+    mask = np.zeros((n_chains, n_blocks), dtype=bool)
+    for row, system in enumerate(systems):
+        if isinstance(system, ChainTable):
+            for prop in PAD_VALUES:
+                arrays[prop][row, : len(system)] = system.column(prop)
+            mask[row, : len(system)] = True
+            continue
+        for col, block in enumerate(system):
+            arrays["gain"][row, col] = block.gain.dBW
+            arrays["nf"][row, col] = block.nf
+            arrays["iip3"][row, col] = block.iip3
+            arrays["p1db"][row, col] = block.p1db
+        mask[row, : len(system)] = True
+    arrays["mask"] = mask
+    return arrays
+
+
+def _round(values, decimals):
+    """Round values if requested."""
+    if decimals is None:
+        return values
+    return np.round(values, decimals)
+
+
+def _cascade_intercept(gain_before, values):
+    """Cascade input-referred intercept points given in dBm."""
+    terms = 10 ** ((gain_before - values + 30) / 10)
+    running_sum = np.cumsum(terms, axis=-1)
+    with np.errstate(divide="ignore"):
+        return 10 * np.log10(1 / running_sum) + 30
+
+
+def cascade(gain, nf, iip3, p1db, mask=None, decimals=2):
+    """
+    Perform cascade analysis on a batch of signal chains.
+
+    Each input is an (n_chains x n_blocks) array where the column indicates
+    position in the signal chain.  Chains of different lengths are handled by
+    padding and passing a mask; padded entries are treated as transparent
+    blocks and report NaN for their cumulative values.
+
+    :param gain: Block gains in dB.
+    :param nf: Block noise figures in dB.
+    :param iip3: Block input 3rd-order intercepts in dBm.
+    :param p1db: Block 1dB compression points in dBm.
+    :param mask: Optional boolean array, True where a block exists.
+    :param decimals: Number of decimals to round to (None to skip rounding).
+    """
+    gain, nf, iip3, p1db = (
+        np.atleast_2d(np.asarray(x, dtype=float)) for x in (gain, nf, iip3, p1db)
+    )
+    if mask is not None:
+        mask = np.atleast_2d(np.asarray(mask, dtype=bool))
+        gain = np.where(mask, gain, PAD_VALUES["gain"])
+        nf = np.where(mask, nf, PAD_VALUES["nf"])
+        iip3 = np.where(mask, iip3, PAD_VALUES["iip3"])
+        p1db = np.where(mask, p1db, PAD_VALUES["p1db"])
+
+    total_gain = np.cumsum(gain, axis=-1)
+    gain_before = total_gain - gain
+
+    nf_terms = (10 ** (nf / 10) - 1) / 10 ** (gain_before / 10)
+    nf_terms[..., 0] += 1
+    total_nf = 10 * np.log10(np.cumsum(nf_terms, axis=-1))
+
+    total_iip3 = _cascade_intercept(gain_before, iip3)
+    total_p1db = _cascade_intercept(gain_before, p1db)
+
+    total_nf = _round(total_nf, decimals)
+    total_iip3 = _round(total_iip3, decimals)
+    total_p1db = _round(total_p1db, decimals)
+
+    results = {
+        "gain": _round(total_gain[..., -1], decimals).copy(),
+        "nf": total_nf[..., -1].copy(),
+        "iip3": total_iip3[..., -1].copy(),
+        "p1db": total_p1db[..., -1].copy(),
+    }
+    if mask is not None:
+        for stage in (total_gain, total_nf, total_iip3, total_p1db):
+            stage[~mask] = np.nan
+    results["total_gain"] = total_gain
+    results["total_nf"] = total_nf
+    results["total_iip3"] = total_iip3
+    results["total_p1db"] = total_p1db
+    return results
+
+
+def run(
+    gain, nf, iip3, p1db, mask=None, pin=0, bandwidth=1, noise_temp=290, decimals=2
+):
+    """
+    Perform full cascade analysis on a batch of signal chains.
+
+    Returns the same keys as :func:`rfdesigner.simulation.cascade.run` with one
+    entry per chain, plus the per-stage cumulative arrays from :func:`cascade`.
+
+    :param pin: Input power of the systems in dBm.
+    :param bandwidth: Bandwidth of input signal in Hz.
+    :param noise_temp: Noise temperature in Kelvin.
+    :param decimals: Number of decimals to round to (None to skip rounding).
+    """
+    results = cascade(gain, nf, iip3, p1db, mask=mask, decimals=decimals)
+    total_gain = results["gain"]
+    total_nf = results["nf"]
+    total_iip3 = results["iip3"]
+    mds = rfmath.noise_floor(nf=total_nf, bandwidth=bandwidth, noise_temp=noise_temp)
+    results.update(
+        {
+            "pin": pin,
+            "pout": pin + total_gain,
+            "oip3": total_iip3 + total_gain,
+            "snr": rfmath.snr(pin=pin, mds=mds, nf=total_nf),
+            "sfdr": rfmath.sfdr(iip3=total_iip3, mds=mds),
+            "mds": mds,
+        }
+    )
+    return results
+
+
+def run_systems(systems, pin=0, bandwidth=1, noise_temp=290):
+    """Pack and run cascade analysis on a list of systems."""
+    arrays = pack_systems(systems)
+    return run(pin=pin, bandwidth=bandwidth, noise_temp=noise_temp, **arrays)
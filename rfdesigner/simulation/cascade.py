@@ -70,13 +70,16 @@ def run(system=None, pin=0, bandwidth=1, noise_temp=290):
     total_iip3 = cascade_property(system, iip3_array, prop="iip3")
     total_p1db = cascade_property(system, p1db_array, prop="p1db")
     total_oip3 = total_iip3 + total_gain
+    pout = pin
+    for block in system:
+        pout = block.output(pin=pout)
     mds = rfmath.noise_floor(nf=total_nf, bandwidth=bandwidth, noise_temp=noise_temp)
     snr = rfmath.snr(pin=pin, mds=mds, nf=total_nf)
     sfdr = rfmath.sfdr(iip3=total_iip3, mds=mds)
 
     results = {
         "pin": pin,
-        "pout": pin + total_gain,
+        "pout": float(pout),
         "gain": total_gain,
         "nf": total_nf,
         "iip3": total_iip3,
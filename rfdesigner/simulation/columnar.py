@@ -0,0 +1,154 @@
+"""Binary columnar storage for large simulation results."""
+import json
+import numpy as np
+
+MAGIC = b"RFDCOLS\x00"
+VERSION = 1
+# Column data starts at multiples of ALIGNMENT bytes
+ALIGNMENT = 64
+# Magic followed by the header length as a little-endian uint64
+PREFIX_SIZE = len(MAGIC) + 8
+
+
+def _align(offset):
+    """Round an offset up to the next column alignment."""
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def create(file_name, columns, rows, attrs=None):
+    """
+    Create a column file of a fixed number of rows to be filled in later.
+
+    The file holds a JSON header followed by every column as one contiguous
+    C-ordered block, so any range of rows of a column is a single read.
+
+    :param file_name: File to create (overwritten if it exists).
+    :param columns: Dictionary of {name: (dtype, shape of one row)}, for example {"pout": ("float32", (4,))}.
+    :param rows: Number of rows.
+    :param attrs: Dictionary of JSON serializable values stored with the columns.
+    :return: ColumnFile opened for writing.
+    """
+    layout = []
+    offset = 0
+    for name, (dtype, shape) in columns.items():
+        dtype = np.dtype(dtype)
+        layout.append(
+            {"name": name, "dtype": dtype.str, "shape": list(shape), "offset": offset}
+        )
+        offset = _align(offset + dtype.itemsize * rows * int(np.prod(shape)))
+    header = {"version": VERSION, "rows": rows, "columns": layout, "attrs": attrs or {}}
+    encoded = json.dumps(header).encode()
+    with open(file_name, "wb") as column_file:
+        column_file.write(MAGIC)
+        column_file.write(len(encoded).to_bytes(8, "little"))
+        column_file.write(encoded)
+        # Columns are left as zeros (sparse where supported) until written
+        column_file.truncate(_align(PREFIX_SIZE + len(encoded)) + offset)
+    return ColumnFile(file_name, mode="r+")
+
+
+def save(file_name, columns, attrs=None):
+    """
+    Save arrays as a column file.
+
+    :param file_name: File to create (overwritten if it exists).
+    :param columns: Dictionary of {name: array} where the first axis of every array is the row.
+    :param attrs: Dictionary of JSON serializable values stored with the columns.
+    :return: file_name.
+    """
+    columns = {name: np.asarray(values) for name, values in columns.items()}
+    rows = len(next(iter(columns.values()))) if columns else 0
+    if any(len(values) != rows for values in columns.values()):
+        raise ValueError("Every column must have the same number of rows.")
+    layout = {
+        name: (values.dtype, values.shape[1:]) for name, values in columns.items()
+    }
+    store = create(file_name, layout, rows, attrs)
+    store.write(0, **columns)
+    store.flush()
+    return file_name
+
+
+class ColumnFile:
+    """Column file with every column memory-mapped on demand."""
+
+    def __init__(self, file_name, mode="r"):
+        """
+        Open a column file.
+
+        :param file_name: File to open.
+        :param mode: "r" for read-only, "r+" to write into the rows, or "c" for copy-on-write.
+        """
+        self.file_name = file_name
+        self.mode = mode
+        with open(file_name, "rb") as column_file:
+            prefix = column_file.read(PREFIX_SIZE)
+            if len(prefix) != PREFIX_SIZE or prefix[: len(MAGIC)] != MAGIC:
+                raise ValueError(f"{file_name} is not an rfdesigner column file.")
+            header_size = int.from_bytes(prefix[len(MAGIC) :], "little")
+            header = json.loads(column_file.read(header_size).decode())
+        if header["version"] > VERSION:
+            raise ValueError(f"{file_name} was written by a newer rfdesigner.")
+        self.rows = header["rows"]
+        self.attrs = header["attrs"]
+        self.layout = {column["name"]: column for column in header["columns"]}
+        # Column offsets in the header count from the aligned end of the header
+        self.data_offset = _align(PREFIX_SIZE + header_size)
+        self._maps = {}
+
+    @property
+    def columns(self):
+        """Get list of column names."""
+        return list(self.layout)
+
+    def column(self, name):
+        """Get a column as a memory-mapped array (data is only read when used)."""
+        if name not in self._maps:
+            column = self.layout[name]
+            shape = (self.rows, *column["shape"])
+            if not np.prod(shape):
+                # Empty files cannot be memory-mapped
+                return np.empty(shape, dtype=np.dtype(column["dtype"]))
+            self._maps[name] = np.memmap(
+                self.file_name,
+                dtype=np.dtype(column["dtype"]),
+                mode=self.mode,
+                offset=self.data_offset + column["offset"],
+                shape=shape,
+            )
+        return self._maps[name]
+
+    def read(self, rows=slice(None), columns=None):
+        """
+        Read a range of rows into memory.
+
+        :param rows: Slice, index array or boolean mask of rows to read.
+        :param columns: List of column names to read (all columns by default).
+        :return: dictionary of {name: array}.
+        """
+        columns = self.columns if columns is None else columns
+        return {name: np.array(self.column(name)[rows]) for name in columns}
+
+    def write(self, start, **arrays):
+        """
+        Write consecutive rows of some columns.
+
+        :param start: First row to write.
+        :param arrays: Arrays of rows to write per column name.
+        """
+        for name, values in arrays.items():
+            values = np.asarray(values)
+            self.column(name)[start : start + len(values)] = values
+
+    def flush(self):
+        """Write changes of memory-mapped columns to disk."""
+        for values in self._maps.values():
+            values.flush()
+
+    def __getitem__(self, name):
+        """Get a memory-mapped column."""
+        return self.column(name)
+
+    def __len__(self):
+        """Get number of rows."""
+        return self.rows
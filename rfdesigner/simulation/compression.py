@@ -0,0 +1,103 @@
+"""Module for AM-AM and AM-PM compression analysis."""
+import math
+import numpy as np
+from rfdesigner.simulation import batch, sweep
+
+RESULT_KEYS = ["pin", "pout", "gain", "compression", "phase"]
+# Input powers below and above the estimated input 1dB compression point in the default sweep
+SPAN_BELOW = 30
+SPAN_ABOVE = 10
+
+
+def curves(system, pin):
+    """
+    Get the cascaded AM-AM and AM-PM curves of a signal chain.
+
+    Every block applies its compression model (see Generic.compress) to the
+    output power of the block before it, over all input powers at once, and
+    the phase shifts of the blocks add.
+
+    :param system: Sequential list of RF objects.
+    :param pin: Array of input powers in dBm (or an RFSignalArray).
+    :return: dictionary of arrays over the input powers (see RESULT_KEYS), with the compression in dB below the small-signal gain.
+    """
+    pin = sweep.as_dbm(pin).values
+    signal = pin
+    phase = np.zeros(pin.shape)
+    small_signal_gain = 0.0
+    for block in system:
+        signal, block_phase, _ = block.compress(signal)
+        phase += block_phase
+        small_signal_gain += float(block.gain)
+    gain = signal - pin
+    return {
+        "pin": pin,
+        "pout": signal,
+        "gain": gain,
+        "compression": small_signal_gain - gain,
+        "phase": phase,
+    }
+
+
+def compression_point(pin, compression, level=1.0):
+    """
+    Find the first input power where the compression reaches a level.
+
+    :param pin: Sorted array of input powers in dBm.
+    :param compression: Array of compression in dB at each input power.
+    :param level: Compression in dB.
+    :return: input power in dBm, interpolated between sweep points (nan if the level is not reached).
+    """
+    reached = compression >= level
+    if not reached.any():
+        return math.nan
+    index = int(np.argmax(reached))
+    if index == 0:
+        return float(pin[0])
+    low, high = compression[index - 1], compression[index]
+    fraction = (level - low) / (high - low)
+    return float(pin[index - 1] + fraction * (pin[index] - pin[index - 1]))
+
+
+def estimate_input_p1db(system):
+    """
+    Estimate the input power where the first block of a signal chain compresses.
+
+    :param system: Sequential list of RF objects.
+    :return: smallest input power in dBm that compresses a block by 1dB on its own (inf if no block compresses).
+    """
+    points = []
+    gain_before = 0.0
+    for block in system:
+        # Every compression model is compressed by 1dB at an input power of p1db
+        points.append(float(block.p1db) - gain_before)
+        gain_before += float(block.gain)
+    return min(points, default=math.inf)
+
+
+def run(system=None, pin=None, step=0.1, level=1.0):
+    """
+    Get the AM-AM and AM-PM curves and the compression point of a signal chain.
+
+    :param system: Sequential list of RF objects where position in list indicates position in signal chain.
+    :param pin: Sorted array of input powers in dBm (around estimate_input_p1db by default).
+    :param step: Input power step in dB of the default sweep.
+    :param level: Compression in dB of the compression point (1 for P1dB).
+    :return: dictionary of arrays over the input powers (see RESULT_KEYS) with the input and output compression points ("p1db_in" and "p1db_out") and the cascade estimate of the input P1dB ("estimate").
+    """
+    if not system:
+        return {}
+    if hasattr(system, "to_blocks"):
+        system = system.to_blocks()
+    totals = batch.cascade(**batch.pack_systems([system]))
+    if pin is None:
+        start = estimate_input_p1db(system)
+        if not math.isfinite(start):
+            start = 0.0
+        pin = sweep.pin_range(start - SPAN_BELOW, start + SPAN_ABOVE, step)
+    result = curves(system, pin)
+    p1db_in = compression_point(result["pin"], result["compression"], level)
+    result["p1db_in"] = p1db_in
+    result["p1db_out"] = p1db_in + float(totals["gain"][0]) - level
+    result["estimate"] = float(totals["p1db"][0])
+    return result
@@ -0,0 +1,233 @@
+"""Module for design-space exploration over part catalogs."""
+import numpy as np
+from rfdesigner.simulation import batch, rfmath
+
+OBJECTIVES = ["nf", "iip3", "gain", "power"]
+
+
+def pack_slots(slots):
+    """
+    Get cascade parameters of every candidate of every slot.
+
+    :param slots: List of candidate lists (RF objects), one per position in the signal chain.
+    :return: list of dictionaries of arrays per slot with gain in dB, linear gain, excess noise factor (F - 1), inverse IIP3 in 1/W and DC power in W.
+    """
+    packed = []
+    for candidates in slots:
+        arrays = batch.pack_systems([candidates])
+        gain = arrays["gain"][0]
+        packed.append(
+            {
+                "gain": gain,
+                "linear_gain": 10 ** (gain / 10),
+                "excess": 10 ** (arrays["nf"][0] / 10) - 1,
+                "inverse": 10 ** ((30 - arrays["iip3"][0]) / 10),
+                "power": np.array([float(block.power) for block in candidates]),
+            }
+        )
+    return packed
+
+
+def prune_candidates(packed):
+    """
+    Get candidates of every slot that are not dominated within their slot.
+
+    Replacing a part by one with the same gain, lower noise, higher IIP3 and
+    lower power never makes a chain worse.  In the last slot nothing follows
+    the part, so a higher gain is also always better.
+
+    :param packed: Slot parameters from :func:`pack_slots`.
+    :return: list of arrays with indices of the remaining candidates per slot.
+    """
+    kept = []
+    for depth, slot in enumerate(packed):
+        costs = [slot["excess"], slot["inverse"], slot["power"], -slot["gain"]]
+        if depth < len(packed) - 1:
+            # Requiring gain to be both <= and >= means only equal gains compare
+            costs.append(slot["gain"])
+        kept.append(np.flatnonzero(rfmath.pareto_mask(np.stack(costs, axis=1))))
+    return kept
+
+
+def _suffix_bounds(packed):
+    """
+    Get optimistic contributions of the slots from every depth to the end.
+
+    :return: tuple of arrays with lower bounds on the Friis noise sum (before dividing by the gain in front of the slots) and IIP3 sum (before multiplying by that gain), upper bound on the gain in dB and lower bound on the power.
+    """
+    size = len(packed) + 1
+    nf_sum, iip3_sum = np.zeros(size), np.zeros(size)
+    gain, power = np.zeros(size), np.zeros(size)
+    for depth in reversed(range(len(packed))):
+        slot = packed[depth]
+        after = nf_sum[depth + 1]
+        after /= slot["linear_gain"].max() if after >= 0 else slot["linear_gain"].min()
+        nf_sum[depth] = slot["excess"].min() + after
+        iip3_sum[depth] = (
+            slot["inverse"].min() + slot["linear_gain"].min() * iip3_sum[depth + 1]
+        )
+        gain[depth] = slot["gain"].max() + gain[depth + 1]
+        power[depth] = slot["power"].min() + power[depth + 1]
+    return nf_sum, iip3_sum, gain, power
+
+
+class ParetoFront:
+    """Non-dominated complete chains found so far."""
+
+    def __init__(self, n_slots):
+        """
+        Initialize an empty front.
+
+        :param n_slots: Number of slots in the signal chain.
+        """
+        self.costs = np.empty((0, len(OBJECTIVES)))
+        self.parts = np.empty((0, n_slots), dtype=int)
+
+    def __len__(self):
+        """Get number of chains on the front."""
+        return len(self.costs)
+
+    def dominated(self, costs):
+        """Get mask of chains (or chain bounds) no better than a chain on the front."""
+        return rfmath.dominated_mask(costs, self.costs)
+
+    def merge(self, costs, parts):
+        """
+        Add complete chains to the front.
+
+        :param costs: (n_chains x 4) array of Friis noise sum, IIP3 sum, negative gain and power.
+        :param parts: (n_chains x n_slots) array of candidate index per slot.
+        """
+        keep = rfmath.pareto_mask(costs)
+        costs, parts = costs[keep], parts[keep]
+        keep = ~self.dominated(costs)
+        costs = np.concatenate([self.costs, costs[keep]])
+        parts = np.concatenate([self.parts, parts[keep]])
+        mask = rfmath.pareto_mask(costs)
+        self.costs, self.parts = costs[mask], parts[mask]
+
+    def results(self, decimals=2):
+        """Get list of result dictionaries sorted by noise figure."""
+        with np.errstate(divide="ignore"):
+            values = {
+                "nf": 10 * np.log10(self.costs[:, 0]),
+                "iip3": 10 * np.log10(1 / self.costs[:, 1]) + 30,
+                "gain": -self.costs[:, 2],
+            }
+        values = {key: np.round(value, decimals) for key, value in values.items()}
+        values["power"] = np.round(self.costs[:, 3], 3)  # mW resolution
+        results = [
+            {
+                "parts": self.parts[row].tolist(),
+                **{key: float(values[key][row]) for key in OBJECTIVES},
+            }
+            for row in range(len(self))
+        ]
+        return sorted(results, key=lambda result: (result["nf"], -result["iip3"]))
+
+
+def explore(slots, chunk_size=100000):
+    """
+    Explore every combination of one candidate per slot.
+
+    Partial chains are extended one slot at a time in vectorized chunks of at
+    most chunk_size chains.  Any partial chain whose best possible completion
+    is dominated by the current front is dropped together with all of its
+    completions, so memory use only depends on chunk_size and the number of
+    slots.
+
+    :param slots: List of candidate lists (RF objects), one per position in the signal chain.
+    :param chunk_size: Maximum number of chains evaluated at a time.
+    :return: generator yielding (covered, total, front) after every chunk of complete chains, where covered counts the combinations evaluated or pruned so far.
+    """
+    if not slots or not all(slots):
+        return
+    packed = pack_slots(slots)
+    kept = prune_candidates(packed)
+    packed = [
+        {key: values[indices] for key, values in slot.items()}
+        for slot, indices in zip(packed, kept)
+    ]
+    sizes = [len(indices) for indices in kept]
+    # Number of complete chains below one partial chain at every depth
+    below = np.cumprod([1] + sizes[::-1])[::-1]
+    bounds = _suffix_bounds(packed)
+    front = ParetoFront(len(slots))
+    progress = {"covered": 0}
+
+    def bound_costs(state, depth):
+        nf_sum, iip3_sum, gain, power = (bound[depth] for bound in bounds)
+        return np.stack(
+            [
+                state["nf_sum"] + nf_sum / state["linear_gain"],
+                state["iip3_sum"] + iip3_sum * state["linear_gain"],
+                -(state["gain"] + gain),
+                state["power"] + power,
+            ],
+            axis=1,
+        )
+
+    def extend(state, depth):
+        slot = packed[depth]
+        count = len(state["parts"])
+        size = sizes[depth]
+        prefix_gain = np.repeat(state["linear_gain"], size)
+        extended = {
+            "parts": np.column_stack(
+                [np.repeat(state["parts"], size, axis=0), np.tile(kept[depth], count),]
+            ),
+            "linear_gain": prefix_gain * np.tile(slot["linear_gain"], count),
+            "nf_sum": np.repeat(state["nf_sum"], size)
+            + np.tile(slot["excess"], count) / prefix_gain,
+            "iip3_sum": np.repeat(state["iip3_sum"], size)
+            + np.tile(slot["inverse"], count) * prefix_gain,
+            "gain": np.repeat(state["gain"], size) + np.tile(slot["gain"], count),
+            "power": np.repeat(state["power"], size) + np.tile(slot["power"], count),
+        }
+        return extended
+
+    def descend(state, depth):
+        if depth == len(slots):
+            costs = np.stack(
+                [state["nf_sum"], state["iip3_sum"], -state["gain"], state["power"]],
+                axis=1,
+            )
+            front.merge(costs, state["parts"])
+            progress["covered"] += len(costs)
+            yield progress["covered"], int(below[0]), front
+            return
+        step = max(1, chunk_size // sizes[depth])
+        for start in range(0, len(state["parts"]), step):
+            chunk = {key: values[start : start + step] for key, values in state.items()}
+            extended = extend(chunk, depth)
+            if depth + 1 < len(slots):
+                keep = ~front.dominated(bound_costs(extended, depth + 1))
+                progress["covered"] += int((~keep).sum()) * int(below[depth + 1])
+                extended = {key: values[keep] for key, values in extended.items()}
+            yield from descend(extended, depth + 1)
+
+    start = {
+        "parts": np.empty((1, 0), dtype=int),
+        "linear_gain": np.ones(1),
+        "nf_sum": np.ones(1),
+        "iip3_sum": np.zeros(1),
+        "gain": np.zeros(1),
+        "power": np.zeros(1),
+    }
+    yield from descend(start, 0)
+
+
+def run(slots, chunk_size=100000):
+    """
+    Find the non-dominated chains (NF, IIP3, gain and power) of a design space.
+
+    :param slots: List of candidate lists (RF objects), one per position in the signal chain.
+    :param chunk_size: Maximum number of chains evaluated at a time.
+    :return: list of result dictionaries sorted by noise figure, each with the chosen candidate index per slot.
+    """
+    front = None
+    for _, _, front in explore(slots, chunk_size=chunk_size):
+        pass
+    if front is None:
+        return []
+    return front.results()
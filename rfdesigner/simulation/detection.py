@@ -0,0 +1,110 @@
+"""Module for detector transfer curve analysis."""
+import numpy as np
+from rfdesigner.components import RFSignalArray
+from rfdesigner.simulation import batch, rfmath, sweep
+
+RESULT_KEYS = ["pin", "reading", "slope", "error"]
+
+
+def detector_index(system):
+    """
+    Get the position of the detector in a signal chain.
+
+    :param system: Sequential list of RF objects.
+    :return: position of the last detector (None if there is none).
+    """
+    positions = [
+        index for index, block in enumerate(system) if hasattr(block, "transfer")
+    ]
+    return positions[-1] if positions else None
+
+
+def dynamic_range(pin, error, tolerance=1.0):
+    """
+    Find the widest span of input powers with a small linearity error.
+
+    :param pin: Sorted array of input powers in dBm.
+    :param error: Array of linearity errors in dB at each input power.
+    :param tolerance: Largest allowed absolute error in dB.
+    :return: tuple of (lowest, highest) input power in dBm (nan if no input power is within tolerance).
+    """
+    within = np.abs(error) <= tolerance
+    if not within.any():
+        return np.nan, np.nan
+    # Runs of consecutive points within tolerance start and stop where the mask changes
+    edges = np.flatnonzero(np.diff(np.concatenate([[0], within.view(np.int8), [0]])))
+    starts, stops = edges[::2], edges[1::2] - 1
+    widest = np.argmax(pin[stops] - pin[starts])
+    return float(pin[starts[widest]]), float(pin[stops[widest]])
+
+
+def derivative(y, x):
+    """
+    Get the derivative of y with respect to x by central differences.
+
+    :param y: Array of values.
+    :param x: Sorted array of the points of the values.
+    :return: array of derivatives at each point (zero for a single point).
+    """
+    slope = np.zeros(np.shape(y))
+    if len(y) > 1:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope[1:-1] = (y[2:] - y[:-2]) / (x[2:] - x[:-2])
+            slope[0] = (y[1] - y[0]) / (x[1] - x[0])
+            slope[-1] = (y[-1] - y[-2]) / (x[-1] - x[-2])
+    return slope
+
+
+def run(system=None, pin=0, bandwidth=1, noise_temp=290, tolerance=1.0):
+    """
+    Get the transfer curve of the detector of a signal chain.
+
+    The front end (the blocks before the detector) sets the input power of
+    the detector, including compression, and adds its output noise.  The
+    linearity error is the reading in dB against the small-signal gain of
+    the chain, and the slope is the derivative of the reading in the units of
+    its law (dB/dB for log, W/W for square and V/V for rms).
+
+    :param system: Sequential list of RF objects with a detector (see detector_index).
+    :param pin: Sorted array of input powers of the system in dBm (or an RFSignalArray).
+    :param bandwidth: Bandwidth of input signal in Hz.
+    :param noise_temp: Noise temperature in Kelvin.
+    :param tolerance: Largest linearity error in dB of the dynamic range.
+    :return: dictionary of arrays over the input powers (see RESULT_KEYS) with the units of the reading and the dynamic range.
+    """
+    if not system:
+        return {}
+    index = detector_index(system)
+    if index is None:
+        raise ValueError("No detector found in the system.")
+    detector = system[index]
+    front_end = system[:index]
+
+    pin = sweep.as_dbm(pin).values
+    gain = nf = 0.0
+    detector_pin = pin
+    if front_end:
+        totals = batch.cascade(**batch.pack_systems([front_end]), decimals=None)
+        gain = totals["gain"][0]
+        nf = totals["nf"][0]
+        # Only the last stage is needed, so the stages of sweep.propagate are skipped
+        for block in front_end:
+            detector_pin, _ = block.output_array(detector_pin)
+    noise = rfmath.noise_floor(nf=nf, bandwidth=bandwidth, noise_temp=noise_temp)
+    # Signal and noise powers add at the detector
+    detected = RFSignalArray(detector_pin, units="dBm").W
+    detected += 10 ** ((noise + gain - 30) / 10)
+    reading = detector.transfer(RFSignalArray(detected, units="W"))
+
+    input_power = RFSignalArray(pin, units="dBm")
+    input_power = getattr(input_power, reading.units).values
+    error = reading.dBm.values - (pin + gain + float(detector.gain))
+    low, high = dynamic_range(pin, error, tolerance)
+    return {
+        "pin": pin,
+        "reading": reading.values,
+        "units": reading.units,
+        "slope": derivative(reading.values, input_power),
+        "error": error,
+        "dynamic_range": (low, high),
+    }
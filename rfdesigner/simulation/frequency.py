@@ -0,0 +1,173 @@
+"""Module for cascade analysis versus frequency."""
+import math
+import numpy as np
+
+RESULT_KEYS = ["freq", "gain", "nf", "iip3", "oip3", "phase", "group_delay"]
+
+
+def frequency_grid(start, stop, points=1001, log=False):
+    """
+    Return frequency points from start to stop (inclusive) in MHz.
+
+    :param start: First frequency in MHz.
+    :param stop: Last frequency in MHz.
+    :param points: Number of frequencies.
+    :param log: Space frequencies logarithmically instead of linearly.
+    """
+    if log:
+        return np.geomspace(start, stop, points)
+    return np.linspace(start, stop, points)
+
+
+class FrequencyResponse:
+    """
+    Cascade analysis of a signal chain at every frequency of a grid.
+
+    The complex response of every block is kept along with running sums of
+    the cascade formulas (as in incremental.CascadeState), so after editing a
+    block only that block is re-evaluated and only the sums from it to the
+    end of the chain are recomputed.
+    """
+
+    def __init__(self, system, freqs):
+        """
+        Initialize the frequency response.
+
+        :param system: Sequential list of RF objects (or a ChainTable).
+        :param freqs: Array of frequencies in MHz.
+        """
+        if hasattr(system, "to_blocks"):
+            # Block views of a compact table are rebuilt on every access
+            system = system.to_blocks()
+        self.system = system
+        self.freqs = np.asarray(freqs, dtype=float)
+        shape = (len(system), self.freqs.size)
+        self.gain = np.empty(shape)
+        self.phase = np.empty(shape)
+        self.nf = np.empty(shape)
+        self.iip3 = np.empty(len(system))
+        self.total_gain = np.empty(shape)
+        self.total_phase = np.empty(shape)
+        self.nf_sum = np.empty(shape)
+        self.iip3_sum = np.empty(shape)
+        self._block_revisions = [None] * len(system)
+
+    def update(self):
+        """
+        Re-evaluate the blocks changed since the last update.
+
+        :return: list of the re-evaluated block positions.
+        """
+        changed = [
+            index
+            for index, block in enumerate(self.system)
+            if block.revision != self._block_revisions[index]
+        ]
+        for index in changed:
+            block = self.system[index]
+            response = block.response(self.freqs)
+            with np.errstate(divide="ignore"):
+                self.gain[index] = 20 * np.log10(np.abs(response))
+            self.phase[index] = np.unwrap(np.angle(response))
+            self.nf[index] = block.nf_response(self.gain[index])
+            self.iip3[index] = block.iip3
+            self._block_revisions[index] = block.revision
+        if changed:
+            # Transmission zeros (0 V/V) give infinite noise figures
+            with np.errstate(divide="ignore", invalid="ignore"):
+                self._recompute(changed[0])
+        return changed
+
+    def _recompute(self, start):
+        """Recompute running sums from block start to the end of the chain."""
+        previous_gain = self.total_gain[start - 1] if start else 0.0
+        previous_phase = self.total_phase[start - 1] if start else 0.0
+        gain = self.gain[start:]
+        total_gain = previous_gain + np.cumsum(gain, axis=0)
+        gain_before = 10 ** ((total_gain - gain) / 10)
+        self.total_gain[start:] = total_gain
+        self.total_phase[start:] = previous_phase + np.cumsum(
+            self.phase[start:], axis=0
+        )
+
+        nf_terms = (10 ** (self.nf[start:] / 10) - 1) / gain_before
+        iip3_terms = gain_before / 10 ** ((self.iip3[start:, np.newaxis] - 30) / 10)
+        if start:
+            nf_terms[0] += self.nf_sum[start - 1]
+            iip3_terms[0] += self.iip3_sum[start - 1]
+        else:
+            nf_terms[0] += 1
+        self.nf_sum[start:] = np.cumsum(nf_terms, axis=0)
+        self.iip3_sum[start:] = np.cumsum(iip3_terms, axis=0)
+
+    def noise_bandwidth(self):
+        """
+        Get the equivalent noise bandwidth over the frequency grid.
+
+        This is the width of an ideal rectangular filter with the peak gain of
+        the chain that passes the same noise power.
+
+        :return: noise bandwidth in Hz.
+        """
+        self.update()
+        power = 10 ** (self.total_gain[-1] / 10)
+        integral = np.sum((power[1:] + power[:-1]) / 2 * np.diff(self.freqs))
+        return float(integral / power.max() * 1e6)
+
+    def run(self):
+        """
+        Get cascade results at every frequency, re-evaluating changed blocks.
+
+        :return: dictionary of arrays over the frequency grid (see RESULT_KEYS).
+        """
+        if not self.system:
+            return {}
+        self.update()
+        total_gain = np.round(self.total_gain[-1], 2)
+        with np.errstate(divide="ignore"):
+            total_iip3 = np.round(10 * np.log10(1 / self.iip3_sum[-1]) + 30, 2)
+        phase = self.total_phase[-1]
+        group_delay = np.zeros(self.freqs.shape)
+        if self.freqs.size > 1:
+            # Phase in radians per MHz of frequency gives a delay in microseconds
+            group_delay = -np.gradient(phase, self.freqs) / (2 * math.pi) * 1e3
+        return {
+            "freq": self.freqs,
+            "gain": total_gain,
+            "nf": np.round(10 * np.log10(self.nf_sum[-1]), 2),
+            "iip3": total_iip3,
+            "oip3": total_iip3 + total_gain,
+            "phase": np.degrees(phase),
+            "group_delay": group_delay,
+        }
+
+
+def noise_bandwidth(system, points=100001):
+    """
+    Get the equivalent noise bandwidth of a signal chain.
+
+    The response is integrated on a grid from 0 to three decades on either
+    side of the corner frequencies of the blocks.
+
+    :param system: Sequential list of RF objects.
+    :param points: Number of frequencies integrated.
+    :return: noise bandwidth in Hz (inf if no block limits the bandwidth).
+    """
+    corners = [corner for block in system for corner in block.corner_frequencies()]
+    if not corners:
+        return math.inf
+    freqs = frequency_grid(min(corners) / 1e3, max(corners) * 1e3, points - 1, log=True)
+    return FrequencyResponse(system, np.append(0, freqs)).noise_bandwidth()
+
+
+def run(system=None, freqs=None):
+    """
+    Perform cascade analysis of gain, NF and IIP3 versus frequency.
+
+    :param system: Sequential list of RF objects where position in list indicates position in signal chain.
+    :param freqs: Array of frequencies in MHz.
+    :return: dictionary with the frequencies (MHz), cascaded gain (dB), NF (dB), IIP3 and OIP3 (dBm), phase (degrees) and group delay (ns) at every frequency.
+    """
+    if not system:
+        return {}
+    return FrequencyResponse(system, freqs).run()
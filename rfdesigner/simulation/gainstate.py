@@ -0,0 +1,116 @@
+"""Module for VGA gain-state lookup tables."""
+import math
+import numpy as np
+from rfdesigner.components import Generic
+from rfdesigner.components.vga import VGA
+from rfdesigner.simulation import batch
+
+TABLE_KEYS = ["gain", "nf", "iip3", "oip3", "p1db", "snr", "sfdr", "mds"]
+
+
+def control_gains(vga):
+    """
+    Get the gain of a VGA at every control code.
+
+    Codes run from 0 up to the first code that reaches the maximum gain, so
+    the last entry also covers any larger control value.
+    """
+    gain_min = float(vga.gain_min)
+    gain_max = float(vga.gain_max)
+    gain_step = float(vga.gain_step)
+    n_codes = 1
+    if gain_step > 0 and gain_max > gain_min:
+        n_codes = math.ceil((gain_max - gain_min) / gain_step) + 1
+    codes = np.arange(n_codes)
+    return np.clip(codes * gain_step + gain_min, gain_min, max(gain_min, gain_max))
+
+
+def _table_revision(block):
+    """Get the revision of the block parameters a gain-state table depends on."""
+    return getattr(block, "table_revision", block.revision)
+
+
+class GainStateTable:
+    """Cascade results for every combination of VGA control codes in a chain."""
+
+    def __init__(self, system, pin=0, bandwidth=1, noise_temp=290):
+        """
+        Initialize the gain-state table.
+
+        :param system: Sequential list of RF objects or a ChainTable containing
+            one or more VGAs.
+        :param pin: Input power of the system in dBm.
+        :param bandwidth: Bandwidth of input signal in Hz.
+        :param noise_temp: Noise temperature in Kelvin.
+        """
+        self.system = system
+        self.pin = pin
+        self.bandwidth = bandwidth
+        self.noise_temp = noise_temp
+        self.vga_index = []
+        self.shape = ()
+        self.results = {}
+        self._revision = None
+        self._block_revisions = []
+        self.build()
+
+    def build(self):
+        """Evaluate the chain at every gain state."""
+        # block_type also identifies VGAs in the views of a ChainTable
+        self.vga_index = [
+            index
+            for index, block in enumerate(self.system)
+            if issubclass(block.block_type, VGA)
+        ]
+        gains = [control_gains(self.system[index]) for index in self.vga_index]
+        self.shape = tuple(len(gain) for gain in gains)
+        states = [grid.ravel() for grid in np.meshgrid(*gains, indexing="ij")]
+        n_states = int(np.prod(self.shape))
+
+        arrays = batch.pack_systems([self.system])
+        for key in ["gain", "nf", "iip3", "p1db", "mask"]:
+            arrays[key] = np.repeat(arrays[key], n_states, axis=0)
+        for index, state_gains in zip(self.vga_index, states):
+            arrays["gain"][:, index] = state_gains
+
+        results = batch.run(
+            pin=self.pin,
+            bandwidth=self.bandwidth,
+            noise_temp=self.noise_temp,
+            **arrays,
+        )
+        self.results = {
+            key: np.broadcast_to(results[key], (n_states,)).reshape(self.shape)
+            for key in TABLE_KEYS
+        }
+        self._revision = Generic.last_revision
+        self._block_revisions = [_table_revision(block) for block in self.system]
+
+    @property
+    def stale(self):
+        """Return True if a block parameter changed since the table was built."""
+        if self._revision == Generic.last_revision:
+            return False
+        if [_table_revision(block) for block in self.system] != self._block_revisions:
+            return True
+        # Only unrelated blocks or VGA control codes changed
+        self._revision = Generic.last_revision
+        return False
+
+    def lookup(self, *codes):
+        """
+        Get cascade results for the given VGA control codes.
+
+        :param codes: One control code per VGA in signal chain order.
+        """
+        if len(codes) != len(self.shape):
+            raise ValueError(f"Expected {len(self.shape)} control codes.")
+        if self.stale:
+            self.build()
+        index = tuple(
+            min(max(int(code), 0), size - 1)
+            if np.isscalar(code)
+            else np.clip(code, 0, size - 1)
+            for code, size in zip(codes, self.shape)
+        )
+        return {key: self.results[key][index] for key in TABLE_KEYS}
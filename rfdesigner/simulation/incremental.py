@@ -0,0 +1,165 @@
+"""Module for incremental cascade analysis."""
+import numpy as np
+from rfdesigner.simulation import batch, rfmath
+
+CASCADE_PROPS = ["gain", "nf", "iip3", "p1db"]
+
+
+class CascadeState:
+    """
+    Cascade analysis kept as prefix sums of the cascade formulas.
+
+    Editing block k only recomputes the running sums of blocks k..N, and
+    "what if" queries on a single block are answered in constant time by
+    rescaling the sums of the blocks following it.
+    """
+
+    def __init__(self, system, pin=0, bandwidth=1, noise_temp=290):
+        """
+        Initialize the cascade state.
+
+        :param system: Sequential list of RF objects (or a ChainTable).
+        :param pin: Input power of the system in dBm.
+        :param bandwidth: Bandwidth of input signal in Hz.
+        :param noise_temp: Noise temperature in Kelvin.
+        """
+        self.system = system
+        self.pin = pin
+        self.bandwidth = bandwidth
+        self.noise_temp = noise_temp
+        arrays = batch.pack_systems([system])
+        self.values = {prop: arrays[prop][0] for prop in CASCADE_PROPS}
+        size = len(system)
+        self.total_gain = np.empty(size)
+        self.nf_sum = np.empty(size)
+        self.iip3_sum = np.empty(size)
+        self.p1db_sum = np.empty(size)
+        self._recompute(0)
+
+    def _recompute(self, start):
+        """Recompute running sums from block start to the end of the chain."""
+        if start >= self.total_gain.size:
+            return
+        previous_gain = self.total_gain[start - 1] if start else 0.0
+        gain = self.values["gain"][start:]
+        total_gain = previous_gain + np.cumsum(gain)
+        gain_before = 10 ** ((total_gain - gain) / 10)
+        self.total_gain[start:] = total_gain
+
+        nf_terms = (10 ** (self.values["nf"][start:] / 10) - 1) / gain_before
+        iip3_terms = gain_before / 10 ** ((self.values["iip3"][start:] - 30) / 10)
+        p1db_terms = gain_before / 10 ** ((self.values["p1db"][start:] - 30) / 10)
+        if start:
+            nf_terms[0] += self.nf_sum[start - 1]
+            iip3_terms[0] += self.iip3_sum[start - 1]
+            p1db_terms[0] += self.p1db_sum[start - 1]
+        else:
+            nf_terms[0] += 1
+        self.nf_sum[start:] = np.cumsum(nf_terms)
+        self.iip3_sum[start:] = np.cumsum(iip3_terms)
+        self.p1db_sum[start:] = np.cumsum(p1db_terms)
+
+    def update(self, index, **props):
+        """
+        Change parameters of a block and update the cascade state.
+
+        :param index: Position of the block in the signal chain.
+        :param props: Block parameters to set (for example gain=10, or control=3 for a VGA).
+        """
+        block = self.system[index]
+        for prop, value in props.items():
+            setattr(block, prop, value)
+        self.values["gain"][index] = block.gain.dBW
+        self.values["nf"][index] = block.nf
+        self.values["iip3"][index] = block.iip3
+        self.values["p1db"][index] = block.p1db
+        self._recompute(index)
+        return self.totals()
+
+    def what_if(self, index, **props):
+        """
+        Get cascade totals for a changed block without modifying the chain.
+
+        :param index: Position of the block in the signal chain.
+        :param props: Any of gain, nf, iip3 or p1db for the block.
+        """
+        unknown = set(props) - set(CASCADE_PROPS)
+        if unknown:
+            raise ValueError(f"Cannot evaluate {', '.join(sorted(unknown))}.")
+        if not self.total_gain.size:
+            return {}
+        values = {
+            prop: props.get(prop, self.values[prop][index]) for prop in CASCADE_PROPS
+        }
+        delta_gain = values["gain"] - self.values["gain"][index]
+        gain_before = self.total_gain[index] - self.values["gain"][index]
+        scale = 10 ** (delta_gain / 10)
+
+        # Later NF terms are divided by the gain, later intercept terms multiplied
+        nf_term = (10 ** (values["nf"] / 10) - 1) / 10 ** (gain_before / 10)
+        sums = {"nf": self._changed_sum(self.nf_sum, index, nf_term, 1 / scale)}
+        if index == 0:
+            sums["nf"] += 1
+        for prop, running_sum in [("iip3", self.iip3_sum), ("p1db", self.p1db_sum)]:
+            term = 10 ** ((gain_before - values[prop] + 30) / 10)
+            sums[prop] = self._changed_sum(running_sum, index, term, scale)
+        return self._totals(self.total_gain[-1] + delta_gain, sums)
+
+    @staticmethod
+    def _changed_sum(running_sum, index, term, scale):
+        """Get a total sum with the term of one block replaced."""
+        before = running_sum[index - 1] if index else 0.0
+        after = running_sum[-1] - running_sum[index]
+        return before + term + after * scale
+
+    def totals(self):
+        """
+        Get cascade totals of the chain.
+
+        As in batch.run, pout is the small-signal output power (pin plus the
+        total gain).  Returns an empty dictionary for an empty chain, as
+        cascade.run does.
+        """
+        if not self.total_gain.size:
+            return {}
+        sums = {
+            "nf": self.nf_sum[-1],
+            "iip3": self.iip3_sum[-1],
+            "p1db": self.p1db_sum[-1],
+        }
+        return self._totals(self.total_gain[-1], sums)
+
+    def _totals(self, total_gain, sums):
+        """Convert running sums to cascade results."""
+        total_nf = round(10 * np.log10(sums["nf"]), 2)
+        with np.errstate(divide="ignore"):
+            total_iip3 = round(10 * np.log10(1 / sums["iip3"]) + 30, 2)
+            total_p1db = round(10 * np.log10(1 / sums["p1db"]) + 30, 2)
+        total_gain = round(total_gain, 2)
+        mds = rfmath.noise_floor(
+            nf=total_nf, bandwidth=self.bandwidth, noise_temp=self.noise_temp
+        )
+        return {
+            "pin": self.pin,
+            "pout": self.pin + total_gain,
+            "gain": total_gain,
+            "nf": total_nf,
+            "iip3": total_iip3,
+            "oip3": total_iip3 + total_gain,
+            "p1db": total_p1db,
+            "snr": rfmath.snr(pin=self.pin, mds=mds, nf=total_nf),
+            "sfdr": rfmath.sfdr(iip3=total_iip3, mds=mds),
+            "mds": mds,
+        }
+
+    def write_totals(self):
+        """Store cumulative results on every block as cascade.run does."""
+        with np.errstate(divide="ignore"):
+            total_iip3 = np.round(10 * np.log10(1 / self.iip3_sum) + 30, 2)
+            total_p1db = np.round(10 * np.log10(1 / self.p1db_sum) + 30, 2)
+        total_nf = np.round(10 * np.log10(self.nf_sum), 2)
+        for index, block in enumerate(self.system):
+            block.total_gain = self.total_gain[index]
+            block.total_nf = total_nf[index]
+            block.total_iip3 = total_iip3[index]
+            block.total_p1db = total_p1db[index]
@@ -0,0 +1,237 @@
+"""Module for multi-tone intermodulation simulation."""
+import math
+import numpy as np
+
+RESULT_KEYS = [
+    "pin",
+    "pout",
+    "gain",
+    "im3",
+    "im5",
+    "im3_dbc",
+    "im5_dbc",
+    "oip3",
+    "iip3",
+]
+# Number of samples generated and transformed at a time
+CHUNK_SIZE = 1 << 16
+# Half width in bins of the main lobe of the window
+WINDOW_BINS = 4
+
+
+def amplitude(power):
+    """Get the amplitude in sqrt(W) of a tone with a power in dBm."""
+    return np.sqrt(2 * 10 ** ((np.asarray(power, dtype=float) - 30) / 10))
+
+
+def blackman_harris(size):
+    """Get a four term Blackman-Harris window (sidelobes below -92 dB)."""
+    angle = 2 * math.pi * np.arange(size) / size
+    return (
+        0.35875
+        - 0.48829 * np.cos(angle)
+        + 0.14128 * np.cos(2 * angle)
+        - 0.01168 * np.cos(3 * angle)
+    )
+
+
+def intermod_products(tones, order):
+    """
+    Get the frequencies of the intermodulation products of an order.
+
+    Products are sum(k_i * f_i) with sum(k_i) = 1 and sum(|k_i|) = order,
+    which are the products that fall close to the tones.
+
+    :param tones: Sequence of tone frequencies.
+    :param order: Product order (3 for IM3, 5 for IM5).
+    :return: sorted array of the distinct positive product frequencies.
+    """
+    tones = np.asarray(tones, dtype=float)
+    coefficients = np.array(list(_coefficients(len(tones), order, 1)), dtype=float)
+    if not coefficients.size:
+        return np.array([])
+    freqs = np.unique(coefficients @ tones)
+    return freqs[freqs > 0]
+
+
+def _coefficients(count, order, total):
+    """Generate integer vectors with a sum of total and an absolute sum of order."""
+    if count == 1:
+        if abs(total) == order:
+            yield (total,)
+        return
+    for k in range(-order, order + 1):
+        rest = order - abs(k)
+        if abs(total - k) <= rest:
+            for tail in _coefficients(count - 1, rest, total - k):
+                yield (k,) + tail
+
+
+def tone_bins(tones, sample_rate, chunk_size=CHUNK_SIZE):
+    """
+    Get the FFT bins nearest to tone frequencies.
+
+    :param tones: Sequence of tone frequencies in MHz.
+    :param sample_rate: Sample rate in MHz.
+    :param chunk_size: Number of samples per FFT.
+    :return: integer array of bins.
+    :raises ValueError: if the tones are not separated by the main lobe of the window.
+    """
+    bin_width = sample_rate / chunk_size
+    bins = np.round(np.asarray(tones, dtype=float) / bin_width).astype(int)
+    edges = np.sort(np.concatenate([[0, chunk_size // 2], bins]))
+    if np.any(np.diff(edges) < WINDOW_BINS):
+        raise ValueError(
+            f"Tones must be at least {WINDOW_BINS * bin_width:.6g} MHz apart and "
+            f"away from 0 and {sample_rate / 2:.6g} MHz."
+        )
+    return bins
+
+
+class MultiToneTest:
+    """
+    Simulation of equal power tones through the polynomials of a signal chain.
+
+    The record is generated, distorted and transformed one chunk at a time
+    into buffers allocated once, so memory use depends on the chunk size and
+    not on the length of the record.  Tones are moved to the nearest FFT bin
+    of a chunk, so every tone and mixing product falls on a bin.
+    """
+
+    def __init__(self, system, tones, pin, sample_rate, chunk_size=CHUNK_SIZE):
+        """
+        Initialize the test.
+
+        :param system: Sequential list of RF objects (or a ChainTable).
+        :param tones: Sequence of tone frequencies in MHz.
+        :param pin: Input power of each tone in dBm.
+        :param sample_rate: Sample rate in MHz.
+        :param chunk_size: Number of samples per FFT.
+        """
+        if hasattr(system, "to_blocks"):
+            system = system.to_blocks()
+        self.system = system
+        self.pin = float(pin)
+        self.sample_rate = float(sample_rate)
+        self.chunk_size = int(chunk_size)
+        self.bins = tone_bins(tones, self.sample_rate, self.chunk_size)
+        self.tones = self.bins * self.bin_width
+        # Schroeder phases keep the peak to average ratio of many tones low
+        count = len(self.bins)
+        self.phases = math.pi * np.arange(1, count + 1) ** 2 / count
+        self.window = blackman_harris(self.chunk_size)
+        self._index = np.arange(self.chunk_size, dtype=float)
+        self._signal = np.empty(self.chunk_size)
+        self._work = np.empty(self.chunk_size)
+
+    @property
+    def bin_width(self):
+        """Get the frequency spacing of the FFT bins in MHz."""
+        return self.sample_rate / self.chunk_size
+
+    def _generate(self, offset):
+        """Write the input tones of the chunk starting at sample offset."""
+        signal, work = self._signal, self._work
+        signal.fill(0)
+        tone_amplitude = amplitude(self.pin)
+        for tone_bin, phase in zip(self.bins, self.phases):
+            # Only the fractional cycles at the chunk start matter for the phase
+            start = 2 * math.pi * ((tone_bin * offset / self.chunk_size) % 1) + phase
+            np.multiply(self._index, 2 * math.pi * tone_bin / self.chunk_size, out=work)
+            work += start
+            np.cos(work, out=work)
+            work *= tone_amplitude
+            signal += work
+
+    def _distort(self):
+        """Pass the chunk through the polynomial of every block in place."""
+        for block in self.system:
+            block.process(self._signal, out=self._signal)
+
+    def chunks(self, samples):
+        """
+        Generate the output of the chain one chunk at a time.
+
+        The same buffer is yielded every time, so a chunk must be used (or
+        copied) before the next one is requested.
+
+        :param samples: Record length, rounded down to whole chunks (at least one).
+        """
+        for number in range(max(1, int(samples) // self.chunk_size)):
+            self._generate(number * self.chunk_size)
+            self._distort()
+            yield self._signal
+
+    def spectrum(self, samples):
+        """
+        Get the average power spectrum of the output over a record.
+
+        :param samples: Record length, rounded down to whole chunks (at least one).
+        :return: array of the power in W of each bin from 0 to half the sample rate.
+        """
+        power = np.zeros(self.chunk_size // 2 + 1)
+        count = 0
+        for chunk in self.chunks(samples):
+            chunk *= self.window
+            transform = np.fft.rfft(chunk)
+            power += transform.real ** 2
+            power += transform.imag ** 2
+            count += 1
+        # A tone of amplitude A peaks at A * sum(window) / 2 and carries A**2 / 2 W
+        return power * 2 / (count * self.window.sum() ** 2)
+
+    def run(self, samples=1 << 20):
+        """
+        Measure tone and intermodulation levels at the output of the chain.
+
+        :param samples: Record length, rounded down to whole chunks (at least one).
+        :return: dictionary with the spectrum and the measured levels (see RESULT_KEYS).
+        """
+        power = self.spectrum(samples)
+        with np.errstate(divide="ignore"):
+            spectrum = 10 * np.log10(power) + 30
+        pout = 10 * math.log10(power[self.bins].mean()) + 30
+        # Products on (or next to) a tone or a lower order product cannot be
+        # told apart from it, as with equally spaced tones
+        occupied = self.bins
+        levels = {}
+        for order in (3, 5):
+            products = intermod_products(self.bins, order)
+            products = products[products < len(power)].astype(int)
+            distance = np.abs(products[:, np.newaxis] - occupied).min(axis=1)
+            occupied = np.concatenate([occupied, products])
+            products = products[distance >= WINDOW_BINS]
+            levels[order] = (
+                float(spectrum[products].max()) if products.size else -math.inf
+            )
+        im3_dbc = pout - levels[3]
+        oip3 = pout + im3_dbc / 2
+        return {
+            "freqs": np.arange(len(power)) * self.bin_width,
+            "spectrum": spectrum,
+            "tones": self.tones,
+            "pin": self.pin,
+            "pout": round(pout, 2),
+            "gain": round(pout - self.pin, 2),
+            "im3": round(levels[3], 2),
+            "im5": round(levels[5], 2),
+            "im3_dbc": round(im3_dbc, 2),
+            "im5_dbc": round(pout - levels[5], 2),
+            "oip3": round(oip3, 2),
+            "iip3": round(oip3 - pout + self.pin, 2),
+        }
+
+
+def run(system=None, tones=None, pin=-30, sample_rate=None, samples=1 << 20):
+    """
+    Simulate a multi-tone test of a signal chain.
+
+    :param system: Sequential list of RF objects where position in list indicates position in signal chain.
+    :param tones: Sequence of tone frequencies in MHz.
+    :param pin: Input power of each tone in dBm.
+    :param sample_rate: Sample rate in MHz.
+    :param samples: Record length, rounded down to whole chunks of CHUNK_SIZE.
+    """
+    if not system:
+        return {}
+    return MultiToneTest(system, tones, pin, sample_rate).run(samples)
@@ -0,0 +1,232 @@
+"""Module for Monte Carlo tolerance analysis."""
+import numpy as np
+from rfdesigner.components import RFSignalArray
+from rfdesigner.const import TOLERANCE_PROPS
+from rfdesigner.simulation import batch, columnar, pool
+
+PROP_UNITS = {"gain": "dBW", "nf": "dBW", "iip3": "dBm", "p1db": "dBm"}
+RESULT_KEYS = ["gain", "nf", "iip3", "oip3", "p1db", "snr", "sfdr"]
+PERCENTILES = [1, 5, 50, 95, 99]
+STAGE_KEYS = ["total_gain", "total_nf", "total_iip3", "total_p1db"]
+# Sample results are stored in single precision (well below 0.01 dB error)
+SAMPLE_DTYPE = np.float32
+
+# Distributions are accumulated as histograms around the nominal result so
+# memory use does not grow with the number of samples.
+HIST_RESOLUTION = 0.01
+HIST_SPAN = 100
+
+
+def pack_tolerances(system):
+    """
+    Get nominal values and spreads of every block property.
+
+    :param system: Sequential list of RF objects.
+    :return: dictionary of {prop: (nominal, sigma, low, high)} arrays where low/high are NaN for blocks without a uniform range.
+    """
+    arrays = batch.pack_systems([system])
+    spec = {}
+    for prop in TOLERANCE_PROPS:
+        nominal = arrays[prop][0]
+        sigma = np.zeros_like(nominal)
+        low = np.full_like(nominal, np.nan)
+        high = np.full_like(nominal, np.nan)
+        for index, block in enumerate(system):
+            tolerance = block.tolerances.get(prop)
+            if tolerance is None:
+                continue
+            if tolerance[0] == "normal":
+                sigma[index] = tolerance[1]
+            else:
+                low[index], high[index] = tolerance[1:]
+        spec[prop] = (nominal, sigma, low, high)
+    return spec
+
+
+def draw_samples(spec, samples, rng):
+    """
+    Draw block property samples.
+
+    :param spec: Tolerance specification from :func:`pack_tolerances`.
+    :param samples: Number of samples to draw.
+    :param rng: numpy random Generator.
+    :return: dictionary of (samples x n_blocks) RFSignalArrays per property.
+    """
+    arrays = {}
+    for prop in TOLERANCE_PROPS:
+        nominal, sigma, low, high = spec[prop]
+        values = np.broadcast_to(nominal, (samples, nominal.size))
+        if sigma.any():
+            values = values + rng.standard_normal(values.shape) * sigma
+        uniform = ~np.isnan(low)
+        if uniform.any():
+            values = np.array(values)
+            values[:, uniform] = rng.uniform(
+                low[uniform], high[uniform], size=(samples, int(uniform.sum()))
+            )
+        arrays[prop] = RFSignalArray(values, units=PROP_UNITS[prop])
+    return arrays
+
+
+def passes_limits(results, limits):
+    """
+    Get mask of samples meeting every limit.
+
+    :param results: Dictionary of result arrays.
+    :param limits: Dictionary of {key: (minimum, maximum)}, either bound may be None.
+    """
+    mask = np.ones(np.shape(results["gain"]), dtype=bool)
+    for key, (minimum, maximum) in limits.items():
+        if minimum is not None:
+            mask &= results[key] >= minimum
+        if maximum is not None:
+            mask &= results[key] <= maximum
+    return mask
+
+
+def _histogram(values, center):
+    """Bin values around the nominal result."""
+    half = int(HIST_SPAN / HIST_RESOLUTION)
+    bins = np.rint((values - center) / HIST_RESOLUTION)
+    bins = np.clip(np.nan_to_num(bins), -half, half).astype(np.int64) + half
+    return np.bincount(bins, minlength=2 * half + 1)
+
+
+def _run_chunk(task):
+    """Simulate one chunk of samples."""
+    spec, samples, seed, nominal, limits, kwargs, samples_file, start = task
+    rng = np.random.default_rng(seed)
+    results = batch.run(decimals=None, **draw_samples(spec, samples, rng), **kwargs)
+    if samples_file is not None:
+        # Chunks write disjoint rows, so workers can share the file
+        store = columnar.ColumnFile(samples_file, mode="r+")
+        store.write(start, **{key: results[key] for key in RESULT_KEYS + STAGE_KEYS})
+        store.flush()
+    summary = {"samples": samples, "passed": None}
+    if limits:
+        summary["passed"] = int(passes_limits(results, limits).sum())
+    for key in RESULT_KEYS:
+        values = results[key]
+        summary[key] = {
+            "sum": float(values.sum()),
+            "sumsq": float((values ** 2).sum()),
+            "min": float(values.min()),
+            "max": float(values.max()),
+            "hist": None,
+        }
+        if np.isfinite(nominal[key]):
+            summary[key]["hist"] = _histogram(values, nominal[key])
+    return summary
+
+
+def _merge(summaries):
+    """Combine chunk summaries as they arrive, keeping only the running total."""
+    summaries = iter(summaries)
+    merged = next(summaries)
+    for summary in summaries:
+        merged["samples"] += summary["samples"]
+        if merged["passed"] is not None:
+            merged["passed"] += summary["passed"]
+        for key in RESULT_KEYS:
+            stats = merged[key]
+            stats["sum"] += summary[key]["sum"]
+            stats["sumsq"] += summary[key]["sumsq"]
+            stats["min"] = min(stats["min"], summary[key]["min"])
+            stats["max"] = max(stats["max"], summary[key]["max"])
+            if stats["hist"] is not None:
+                stats["hist"] += summary[key]["hist"]
+    return merged
+
+
+def _percentile(hist, center, samples, percentile):
+    """Get a percentile from a histogram."""
+    half = int(HIST_SPAN / HIST_RESOLUTION)
+    index = np.searchsorted(np.cumsum(hist), percentile / 100 * samples)
+    return round(center + (int(index) - half) * HIST_RESOLUTION, 2)
+
+
+def run(
+    system=None,
+    samples=1000,
+    seed=None,
+    limits=None,
+    pin=0,
+    bandwidth=1,
+    noise_temp=290,
+    workers=1,
+    chunk_size=100000,
+    percentiles=None,
+    samples_file=None,
+):
+    """
+    Perform Monte Carlo analysis over the netlisted block tolerances.
+
+    Samples are drawn in fixed-size chunks, each seeded from the root seed,
+    so results only depend on seed and chunk_size and not on the number of
+    workers.
+
+    :param system: Sequential list of RF objects.
+    :param samples: Number of samples to draw.
+    :param seed: Seed for reproducible runs.
+    :param limits: Dictionary of {key: (minimum, maximum)} to calculate yield against.
+    :param pin: Input power of the system in dBm.
+    :param bandwidth: Bandwidth of input signal in Hz.
+    :param noise_temp: Noise temperature in Kelvin.
+    :param workers: Number of worker processes (None or 0 for one per core).
+    :param chunk_size: Number of samples simulated at a time.
+    :param percentiles: List of percentiles to report.
+    :param samples_file: File to store the results of every sample in (binary column format).
+    :raises ValueError: if chunk_size is not positive.
+    """
+    if not system or samples <= 0:
+        return {}
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive.")
+    if percentiles is None:
+        percentiles = PERCENTILES
+    kwargs = {"pin": pin, "bandwidth": bandwidth, "noise_temp": noise_temp}
+    spec = pack_tolerances(system)
+    nominal = batch.run(decimals=None, **batch.pack_systems([system]), **kwargs)
+    nominal = {key: float(np.ravel(nominal[key])[0]) for key in RESULT_KEYS}
+
+    sizes = [chunk_size] * (samples // chunk_size)
+    if samples % chunk_size:
+        sizes.append(samples % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    starts = np.cumsum([0] + sizes[:-1])
+    if samples_file is not None:
+        layout = {key: (SAMPLE_DTYPE, ()) for key in RESULT_KEYS}
+        layout.update({key: (SAMPLE_DTYPE, (len(system),)) for key in STAGE_KEYS})
+        attrs = {"names": [str(block.name) for block in system], "seed": seed}
+        columnar.create(samples_file, layout, samples, attrs)
+    tasks = [
+        (spec, size, chunk_seed, nominal, limits, kwargs, samples_file, int(start))
+        for size, chunk_seed, start in zip(sizes, seeds, starts)
+    ]
+    summary = _merge(pool.imap_tasks(_run_chunk, tasks, workers=workers))
+
+    results = {"samples": samples, "yield": None}
+    if limits:
+        results["yield"] = summary["passed"] / samples
+    for key in RESULT_KEYS:
+        stats = summary[key]
+        if stats["hist"] is None:
+            # Property is not defined anywhere in the chain (infinite)
+            mean, std = nominal[key], 0.0
+            values = {p: nominal[key] for p in percentiles}
+        else:
+            mean = stats["sum"] / samples
+            std = np.sqrt(max(stats["sumsq"] / samples - mean ** 2, 0))
+            values = {
+                p: _percentile(stats["hist"], nominal[key], samples, p)
+                for p in percentiles
+            }
+        results[key] = {
+            "nominal": round(nominal[key], 2),
+            "mean": round(mean, 2),
+            "std": round(float(std), 3),
+            "min": round(stats["min"], 2),
+            "max": round(stats["max"], 2),
+            "percentiles": values,
+        }
+    return results
@@ -0,0 +1,67 @@
+"""Module to run cascade analysis over many signal chains."""
+from rfdesigner.simulation import cascade, pool, results, sweep
+
+
+def _run_chain(task):
+    """Analyze one signal chain and get its csv lines."""
+    system, pin, pin_sweep, bandwidth, noise_temp = task
+    if pin_sweep is not None:
+        result = sweep.run(
+            system=system, pin=pin_sweep, bandwidth=bandwidth, noise_temp=noise_temp
+        )
+        return results.csv_sweep(system, result)
+    result = cascade.run(
+        system=system, pin=pin, bandwidth=bandwidth, noise_temp=noise_temp
+    )
+    # Totals are stored on the blocks of this process, so format them here
+    return results.csv_cascade(system, result)
+
+
+def iter_run(
+    systems, pin=0, pin_sweep=None, bandwidth=1, noise_temp=290, workers=1, chunksize=1
+):
+    """
+    Perform cascade analysis (or an input power sweep) on several signal chains.
+
+    :param systems: Dictionary of {name: sequential list of RF objects}.
+    :param pin: Input power of the systems in dBm.
+    :param pin_sweep: Array of input powers in dBm to sweep instead of a single pin.
+    :param bandwidth: Bandwidth of input signal in Hz.
+    :param noise_temp: Noise temperature in Kelvin.
+    :param workers: Number of worker processes (None or 0 for one per core).
+    :param chunksize: Number of chains sent to a worker at a time.
+    :return: generator of (name, csv lines) in the order of systems, yielded as soon as available.
+    """
+    tasks = [
+        (system, pin, pin_sweep, bandwidth, noise_temp) for system in systems.values()
+    ]
+    lines = pool.imap_tasks(_run_chain, tasks, workers=workers, chunksize=chunksize)
+    yield from zip(systems, lines)
+
+
+def run(
+    systems, pin=0, pin_sweep=None, bandwidth=1, noise_temp=290, workers=1, chunksize=1
+):
+    """
+    Perform cascade analysis (or an input power sweep) on several signal chains.
+
+    :param systems: Dictionary of {name: sequential list of RF objects}.
+    :param pin: Input power of the systems in dBm.
+    :param pin_sweep: Array of input powers in dBm to sweep instead of a single pin.
+    :param bandwidth: Bandwidth of input signal in Hz.
+    :param noise_temp: Noise temperature in Kelvin.
+    :param workers: Number of worker processes (None or 0 for one per core).
+    :param chunksize: Number of chains sent to a worker at a time.
+    :return: dictionary of {name: csv lines} in the order of systems.
+    """
+    return dict(
+        iter_run(
+            systems,
+            pin=pin,
+            pin_sweep=pin_sweep,
+            bandwidth=bandwidth,
+            noise_temp=noise_temp,
+            workers=workers,
+            chunksize=chunksize,
+        )
+    )
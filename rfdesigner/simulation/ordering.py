@@ -0,0 +1,253 @@
+"""Module to search for the best ordering of blocks in a signal chain."""
+import bisect
+import itertools
+import numpy as np
+from rfdesigner.simulation import batch, pool, rfmath
+
+CASCADE_PROPS = ["gain", "nf", "iip3", "p1db"]
+
+# Number of blocks at the end of the chain whose orderings are all evaluated
+# at once instead of being searched one position at a time.
+TAIL_BLOCKS = 4
+
+
+def pack_blocks(system):
+    """Get linear gain, noise factor and IIP3 (in W) of every block."""
+    arrays = batch.pack_systems([system])
+    # Noise figures below 0 dB (such as the default of Generic) add no noise
+    # rather than removing it, as in Generic.noise_power.  Only the search
+    # bounds need this; reported totals use the netlisted noise figures.
+    return (
+        10 ** (arrays["gain"][0] / 10),
+        10 ** (np.maximum(arrays["nf"][0], 0) / 10),
+        10 ** ((arrays["iip3"][0] - 30) / 10),
+    )
+
+
+class _Front:
+    """Pareto front of complete orderings kept sorted by noise factor sum."""
+
+    def __init__(self):
+        """Initialize an empty front."""
+        self.nf_sums = []
+        self.iip3_sums = []
+        self.orders = []
+
+    def dominates(self, nf_sum, iip3_sum):
+        """Check if a point is dominated by (or equal to) a point on the front."""
+        # Along the front the IIP3 sum decreases as the noise sum increases
+        index = bisect.bisect_right(self.nf_sums, nf_sum)
+        return index > 0 and self.iip3_sums[index - 1] <= iip3_sum
+
+    def add(self, nf_sum, iip3_sum, order):
+        """Add a non-dominated ordering, removing the points it dominates."""
+        start = bisect.bisect_left(self.nf_sums, nf_sum)
+        stop = start
+        while stop < len(self.nf_sums) and self.iip3_sums[stop] >= iip3_sum:
+            stop += 1
+        self.nf_sums[start:stop] = [nf_sum]
+        self.iip3_sums[start:stop] = [iip3_sum]
+        self.orders[start:stop] = [order]
+
+    def points(self):
+        """Get list of (nf sum, iip3 sum, order) points."""
+        return list(zip(self.nf_sums, self.iip3_sums, self.orders))
+
+
+def _tail_orders(slots, blocks):
+    """
+    Get the allowed orderings of blocks at the end of the chain.
+
+    :param slots: Block index fixed at every position (None for free positions).
+    :param blocks: Sorted tuple of the block indices at the end of the chain.
+    :return: (n_orders x n_blocks) array of positions into blocks.
+    """
+    count = len(blocks)
+    fixed = {
+        position: block
+        for position, block in enumerate(slots[len(slots) - count :])
+        if block is not None
+    }
+    allowed = [
+        order
+        for order in itertools.permutations(range(count))
+        if all(blocks[order[pos]] == block for pos, block in fixed.items())
+    ]
+    return np.array(allowed, dtype=int).reshape(-1, count)
+
+
+def _search(task):
+    """Depth-first branch-and-bound search below a partial ordering."""
+    gains, factors, intercepts, slots, prefix, duplicates = task
+    size = len(slots)
+    front = _Front()
+    inverse = [1 / intercept for intercept in intercepts]
+    excess = [factor - 1 for factor in factors]
+    tail_orders = {}
+    by_gain = sorted(range(size), key=lambda index: gains[index])
+    by_excess = sorted(range(size), key=lambda index: -excess[index])
+    by_inverse = sorted(range(size), key=lambda index: -inverse[index])
+    free = sorted(
+        (index for index in range(size) if index not in slots),
+        key=lambda index: factors[index],
+    )
+
+    def bounds(remaining, prefix_gain, nf_sum, iip3_sum):
+        # The k-th remaining block sees at most the prefix gain times the k-1
+        # largest remaining gains and at least the prefix gain times the k-1
+        # smallest, so pairing the sorted terms against these products bounds
+        # the Friis and IIP3 sums from below (rearrangement inequality).
+        ordered = [gains[index] for index in by_gain if index in remaining]
+        least, most = [prefix_gain], [prefix_gain]
+        for small, large in zip(ordered[:-1], ordered[:0:-1]):
+            least.append(least[-1] * small)
+            most.append(most[-1] * large)
+        most.sort(reverse=True)
+        least.sort()
+        position = 0
+        for index in by_excess:
+            if index in remaining:
+                nf_sum += excess[index] / most[position]
+                position += 1
+        position = 0
+        for index in by_inverse:
+            if index in remaining:
+                iip3_sum += inverse[index] * least[position]
+                position += 1
+        return nf_sum, iip3_sum
+
+    def finish(order, remaining, prefix_gain, nf_sum, iip3_sum):
+        # Evaluate every ordering of the last few blocks at once
+        blocks = tuple(sorted(remaining))
+        if blocks not in tail_orders:
+            tail_orders[blocks] = _tail_orders(slots, blocks)
+        tail = np.array(blocks)[tail_orders[blocks]]
+        tail_gains = np.asarray(gains)[tail]
+        before = prefix_gain * np.cumprod(tail_gains, axis=1) / tail_gains
+        nf_sums = nf_sum + np.sum(np.asarray(excess)[tail] / before, axis=1)
+        iip3_sums = iip3_sum + np.sum(np.asarray(inverse)[tail] * before, axis=1)
+        costs = np.stack([nf_sums, iip3_sums], axis=1)
+        for row in np.flatnonzero(rfmath.pareto_mask(costs)):
+            if not front.dominates(nf_sums[row], iip3_sums[row]):
+                front.add(nf_sums[row], iip3_sums[row], order + tail[row].tolist())
+
+    def descend(order, remaining, prefix_gain, nf_sum, iip3_sum):
+        if front.dominates(*bounds(remaining, prefix_gain, nf_sum, iip3_sum)):
+            return
+        depth = len(order)
+        if size - depth <= TAIL_BLOCKS:
+            finish(order, remaining, prefix_gain, nf_sum, iip3_sum)
+            return
+        if slots[depth] is not None:
+            candidates = [slots[depth]]
+        else:
+            candidates = [index for index in free if index in remaining]
+        tried = set()
+        for index in candidates:
+            if duplicates[index] in tried:
+                continue
+            tried.add(duplicates[index])
+            order.append(index)
+            descend(
+                order,
+                remaining - {index},
+                prefix_gain * gains[index],
+                nf_sum + excess[index] / prefix_gain,
+                iip3_sum + inverse[index] * prefix_gain,
+            )
+            order.pop()
+
+    prefix_gain, nf_sum, iip3_sum = 1.0, 1.0, 0.0
+    for index in prefix:
+        nf_sum += excess[index] / prefix_gain
+        iip3_sum += inverse[index] * prefix_gain
+        prefix_gain *= gains[index]
+    remaining = set(range(size)) - set(prefix)
+    descend(list(prefix), remaining, prefix_gain, nf_sum, iip3_sum)
+    return front.points()
+
+
+def _duplicate_ids(system):
+    """Map every block to the first block with identical cascade properties."""
+    arrays = batch.pack_systems([system])
+    keys = list(zip(*(arrays[prop][0] for prop in CASCADE_PROPS)))
+    return [keys.index(key) for key in keys]
+
+
+def _prefixes(slots, duplicates, depth):
+    """Enumerate distinct partial orderings used to split the search."""
+    prefixes = [[]]
+    for position in range(min(depth, len(slots))):
+        expanded = []
+        for prefix in prefixes:
+            if slots[position] is not None:
+                expanded.append(prefix + [slots[position]])
+                continue
+            tried = set()
+            for index in range(len(slots)):
+                if index in prefix or index in slots or duplicates[index] in tried:
+                    continue
+                tried.add(duplicates[index])
+                expanded.append(prefix + [index])
+        prefixes = expanded
+    return prefixes
+
+
+def run(system=None, fixed=None, workers=1, split_depth=1, decimals=2):
+    """
+    Find the Pareto-optimal block orderings trading off NF against IIP3.
+
+    :param system: Sequential list of RF objects.
+    :param fixed: Dictionary of {position: block index} (0-based) of blocks that may not move.
+    :param workers: Number of worker processes (None or 0 for one per core).
+    :param split_depth: Number of leading positions used to split the search into independent subtrees.
+    :param decimals: Number of decimals to round results to (None to disable rounding).
+    :return: list of result dictionaries sorted by noise figure, each with the ordering as a list of block indices.
+    """
+    if not system:
+        return []
+    fixed = fixed or {}
+    size = len(system)
+    if any(not 0 <= pos < size or not 0 <= blk < size for pos, blk in fixed.items()):
+        raise ValueError("Fixed positions and blocks must be within the chain.")
+    if len(set(fixed.values())) != len(fixed):
+        raise ValueError("A block can only be fixed to one position.")
+
+    gains, factors, intercepts = pack_blocks(system)
+    slots = [fixed.get(position) for position in range(size)]
+    duplicates = _duplicate_ids(system)
+    if pool.resolve_workers(workers) == 1:
+        # Subtrees do not share their fronts, so only split for parallel runs
+        split_depth = 0
+    tasks = [
+        (gains, factors, intercepts, slots, prefix, duplicates)
+        for prefix in _prefixes(slots, duplicates, split_depth)
+    ]
+    fronts = pool.map_tasks(_search, tasks, workers=workers)
+    points = [point for front in fronts for point in front]
+    costs = np.array([point[:2] for point in points]).reshape(-1, 2)
+    points = [point for point, keep in zip(points, rfmath.pareto_mask(costs)) if keep]
+
+    orders = np.array([point[2] for point in points])
+    arrays = batch.pack_systems([system])
+    totals = batch.cascade(
+        *(arrays[prop][0][orders] for prop in CASCADE_PROPS), decimals=decimals
+    )
+    # Drop orderings that only differ beyond the reported precision, comparing
+    # the noise figures the search used
+    arrays["nf"] = np.maximum(arrays["nf"], 0)
+    searched = batch.cascade(
+        *(arrays[prop][0][orders] for prop in CASCADE_PROPS), decimals=decimals
+    )
+    keep = rfmath.pareto_mask(np.stack([searched["nf"], -searched["iip3"]], axis=1))
+    orderings = [
+        {
+            "order": orders[row].tolist(),
+            "gain": float(totals["gain"][row]),
+            "nf": float(totals["nf"][row]),
+            "iip3": float(totals["iip3"][row]),
+            "p1db": float(totals["p1db"][row]),
+        }
+        for row in np.flatnonzero(keep)
+    ]
+    return sorted(orderings, key=lambda result: (result["nf"], -result["iip3"]))
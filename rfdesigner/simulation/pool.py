@@ -0,0 +1,45 @@
+"""Helpers to spread simulation work across processes."""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+def resolve_workers(workers=None):
+    """Get number of worker processes to use (None means one per core)."""
+    if workers is None or workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def imap_tasks(func, tasks, workers=1, chunksize=1):
+    """
+    Map a function over tasks and yield results in task order as they finish.
+
+    Runs in the current process when a single worker is requested.
+
+    :param func: Module-level (picklable) function to call on each task.
+    :param tasks: Iterable of task arguments.
+    :param workers: Number of worker processes (None or 0 for one per core).
+    :param chunksize: Number of tasks sent to a worker at a time.
+    """
+    tasks = list(tasks)
+    workers = min(resolve_workers(workers), len(tasks))
+    if workers <= 1:
+        for task in tasks:
+            yield func(task)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(func, tasks, chunksize=chunksize)
+
+
+def map_tasks(func, tasks, workers=1, chunksize=1):
+    """
+    Map a function over tasks and return results in task order.
+
+    Runs in the current process when a single worker is requested.
+
+    :param func: Module-level (picklable) function to call on each task.
+    :param tasks: Iterable of task arguments.
+    :param workers: Number of worker processes (None or 0 for one per core).
+    :param chunksize: Number of tasks sent to a worker at a time.
+    """
+    return list(imap_tasks(func, tasks, workers=workers, chunksize=chunksize))
@@ -1,13 +1,30 @@
 """Results handler."""
+import numpy as np
+from rfdesigner.simulation import (
+    columnar,
+    compression,
+    detection,
+    frequency,
+    intermod,
+    montecarlo,
+    sensitivity,
+    spurs,
+)
 
+# Results are rounded to 0.01 dB, well within float32 precision
+COLUMN_DTYPE = np.float32
+# Number of rows formatted at a time by the streaming csv generators
+BLOCK_ROWS = 4096
+# Size of the csv file write buffer in bytes
+WRITE_BUFFER = 1 << 20
 
-def csv_cascade(system, sim_result):
-    """Generate a csv results structure."""
-    csv_lines = []
-    csv_lines.append("Total Results")
+
+def iter_csv_cascade(system, sim_result):
+    """Generate the lines of a csv results structure one at a time."""
+    yield "Total Results"
     for key, value in sorted(sim_result.items()):
-        csv_lines.append(f"{key},{value}")
-    csv_lines.append("")
+        yield f"{key},{value}"
+    yield ""
     header_props = [
         "Block Name",
         "Gain (dB)",
@@ -20,7 +37,7 @@ def csv_cascade(system, sim_result):
         "Total P1dB (dB)",
     ]
 
-    csv_lines.append(",".join(header_props))
+    yield ",".join(header_props)
 
     for block in system:
         props = [
@@ -34,12 +51,297 @@ def csv_cascade(system, sim_result):
             block.total_p1db,
         ]
         value_props = ",".join(str(round(x, 2)) for x in props)
-        prop_string = f"{block.name},{value_props}"
-        csv_lines.append(prop_string)
+        yield f"{block.name},{value_props}"
+
+
+def csv_cascade(system, sim_result):
+    """Generate a csv results structure."""
+    return list(iter_csv_cascade(system, sim_result))
+
+
+def iter_csv_sweep(system, sim_results):
+    """
+    Generate the lines of an input power sweep csv one at a time.
+
+    :param system: Sequential list of RF objects.
+    :param sim_results: Iterable of sweep results over consecutive blocks of input powers (see sweep.iter_run).
+    """
+    header_props = ["Pin (dBm)", "Pout (dBm)", "SNR (dB)", "SFDR (dB)"]
+    header_props += [
+        f"{block.name or index + 1} Pout (dBm)" for index, block in enumerate(system)
+    ]
+    header_props.append("Compressed Stages")
+    yield ",".join(header_props)
+
+    for sim_result in sim_results:
+        columns = [
+            sim_result["pin"],
+            sim_result["pout"],
+            sim_result["snr"],
+            sim_result["sfdr"],
+            sim_result["stage_pout"],
+        ]
+        columns = [np.asarray(column).view(np.ndarray) for column in columns]
+        values = np.round(np.column_stack(columns), 2)
+        compressed = sim_result["compressed"]
+        for start in range(0, len(values), BLOCK_ROWS):
+            rows = values[start : start + BLOCK_ROWS].tolist()
+            for row, stages in zip(rows, compressed[start : start + BLOCK_ROWS]):
+                stages = " ".join(str(index + 1) for index in np.flatnonzero(stages))
+                yield f"{','.join(map(str, row))},{stages}"
+
+
+def csv_sweep(system, sim_result):
+    """Generate a csv results structure for an input power sweep."""
+    return list(iter_csv_sweep(system, [sim_result]))
+
+
+def iter_csv_frequency(sim_result):
+    """Generate the lines of a frequency response csv one at a time."""
+    header_props = [
+        "Freq (MHz)",
+        "Gain (dB)",
+        "NF (dB)",
+        "IIP3 (dBm)",
+        "OIP3 (dBm)",
+        "Phase (deg)",
+        "Group Delay (ns)",
+    ]
+    yield ",".join(header_props)
+    if not sim_result:
+        return
+
+    values = np.column_stack([sim_result[key] for key in frequency.RESULT_KEYS])
+    # Adding zero prints flat responses as 0.0 instead of -0.0
+    values[:, -2:] = np.round(values[:, -2:], 4) + 0.0
+    for start in range(0, len(values), BLOCK_ROWS):
+        for row in values[start : start + BLOCK_ROWS].tolist():
+            yield ",".join(map(str, row))
+
+
+def csv_frequency(sim_result):
+    """Generate a csv results structure for a frequency response."""
+    return list(iter_csv_frequency(sim_result))
+
+
+def iter_csv_combined(chain_lines):
+    """
+    Generate the lines of one csv for the results of several systems.
+
+    :param chain_lines: Iterable of (name, csv lines) pairs.
+    """
+    for name, lines in chain_lines:
+        yield f"System,{name}"
+        yield from lines
+        yield ""
+
+
+def csv_combined(chain_lines):
+    """Generate one csv results structure from the results of several systems."""
+    return list(iter_csv_combined(chain_lines.items()))
+
+
+def columns_cascade(system, sim_result):
+    """Generate a column results structure with one row per block."""
+    props = ["gain", "nf", "iip3", "p1db"]
+    props += ["total_gain", "total_nf", "total_iip3", "total_p1db"]
+    columns = {
+        prop: np.array([float(getattr(block, prop)) for block in system])
+        for prop in props
+    }
+    attrs = {key: float(value) for key, value in sim_result.items()}
+    attrs["names"] = [str(block.name) for block in system]
+    return columns, attrs
+
+
+def columns_sweep(system, sim_result):
+    """
+    Generate a column results structure with one row per input power.
+
+    Output power is the last column of stage_pout and SFDR does not depend on
+    the input power, so neither is stored as a column.
+    """
+    columns = {
+        key: np.asarray(sim_result[key], dtype=COLUMN_DTYPE)
+        for key in ["pin", "snr", "stage_pout"]
+    }
+    columns["compressed"] = np.asarray(sim_result["compressed"])
+    attrs = {
+        key: float(sim_result[key])
+        for key in ["gain", "nf", "iip3", "oip3", "p1db", "mds"]
+    }
+    attrs["sfdr"] = float(np.ravel(sim_result["sfdr"])[0])
+    attrs["names"] = [str(block.name) for block in system]
+    return columns, attrs
+
+
+def columns_frequency(system, sim_result):
+    """Generate a column results structure with one row per frequency."""
+    columns = {
+        key: np.asarray(sim_result[key], dtype=COLUMN_DTYPE)
+        for key in frequency.RESULT_KEYS
+    }
+    # Frequencies need more precision than single precision gives above ~100 MHz
+    columns["freq"] = np.asarray(sim_result["freq"], dtype=float)
+    attrs = {"names": [str(block.name) for block in system]}
+    return columns, attrs
+
+
+def csv_spur_chart(chart):
+    """Generate a csv results structure for a mixer spur chart."""
+    header_props = ["Spur Chart (dBc)"] + [f"m={m}" for m in range(chart.shape[1])]
+    csv_lines = [",".join(header_props)]
+    for n, row in enumerate(chart.tolist()):
+        props = ["" if np.isnan(x) else str(round(x, 2)) for x in row]
+        csv_lines.append(",".join([f"n={n}"] + props))
+    return csv_lines
+
+
+def iter_csv_spurs(sim_result):
+    """Generate the lines of an in-band spur csv one at a time."""
+    header_props = ["LO (MHz)", "RF (MHz)", "m", "n", "Spur (MHz)", "Level (dBc)"]
+    yield ",".join(header_props)
+    columns = [sim_result[key] for key in spurs.RESULT_KEYS]
+    for start in range(0, len(columns[0]), BLOCK_ROWS):
+        rows = zip(*[column[start : start + BLOCK_ROWS].tolist() for column in columns])
+        for lo, rf, m, n, freq, level in rows:
+            props = [round(lo, 4), round(rf, 4), m, n, round(freq, 4), round(level, 2)]
+            yield ",".join(map(str, props))
+
+
+def iter_csv_intermod(sim_result, estimate=None, spectrum=False):
+    """
+    Generate the lines of a multi-tone simulation csv one at a time.
+
+    :param sim_result: Result of a multi-tone test (see intermod.MultiToneTest.run).
+    :param estimate: Dictionary of cascade estimates of the same results to compare with.
+    :param spectrum: Add the output power of every FFT bin.
+    """
+    estimate = estimate or {}
+    tones = ",".join(str(round(tone, 6)) for tone in sim_result["tones"].tolist())
+    yield f"Tones (MHz),{tones}"
+    yield ""
+    yield "Result,Simulated,Estimated"
+    for key in intermod.RESULT_KEYS:
+        yield f"{key},{sim_result[key]},{estimate.get(key, '')}"
+    if not spectrum:
+        return
+
+    yield ""
+    yield "Freq (MHz),Power (dBm)"
+    freqs = sim_result["freqs"]
+    power = np.round(sim_result["spectrum"], 2)
+    for start in range(0, len(freqs), BLOCK_ROWS):
+        rows = zip(
+            freqs[start : start + BLOCK_ROWS].tolist(),
+            power[start : start + BLOCK_ROWS].tolist(),
+        )
+        for freq, level in rows:
+            yield f"{round(freq, 6)},{level}"
+
+
+def iter_csv_compression(sim_result):
+    """Generate the lines of an AM-AM and AM-PM curve csv one at a time."""
+    yield f"P1dB In (dBm),{round(sim_result['p1db_in'], 2)}"
+    yield f"P1dB Out (dBm),{round(sim_result['p1db_out'], 2)}"
+    yield f"Cascade P1dB In (dBm),{sim_result['estimate']}"
+    yield ""
+    yield "Pin (dBm),Pout (dBm),Gain (dB),Compression (dB),Phase (deg)"
+    columns = [sim_result[key] for key in compression.RESULT_KEYS]
+    for start in range(0, len(columns[0]), BLOCK_ROWS):
+        rows = zip(*[column[start : start + BLOCK_ROWS].tolist() for column in columns])
+        for pin, *values in rows:
+            yield ",".join(map(str, [round(pin, 4)] + [round(x, 3) for x in values]))
+
+
+def iter_csv_sensitivity(system, sim_result):
+    """Generate the lines of a sensitivity csv, one per block parameter."""
+    yield "Derivatives of the totals (dB) by each block parameter (dB)"
+    yield ""
+    totals = ["Gain", "NF", "IIP3", "P1dB", "SNR", "SFDR"]
+    yield ",".join(["Block", "Parameter"] + totals)
+    for index, block in enumerate(system):
+        label = block.name or str(index + 1)
+        for param in sensitivity.PARAMS:
+            values = [sim_result[total][param][index] for total in sensitivity.TOTALS]
+            props = [round(float(value), 4) for value in values]
+            yield ",".join(map(str, [label, param] + props))
+
+
+def iter_csv_detector(sim_result):
+    """Generate the lines of a detector transfer curve csv one at a time."""
+    low, high = sim_result["dynamic_range"]
+    yield f"Dynamic Range Low (dBm),{round(low, 2)}"
+    yield f"Dynamic Range High (dBm),{round(high, 2)}"
+    yield f"Dynamic Range (dB),{round(high - low, 2)}"
+    yield ""
+    units = sim_result["units"]
+    slope_units = "dB/dB" if units == "dBm" else f"{units}/{units}"
+    yield f"Pin (dBm),Reading ({units}),Slope ({slope_units}),Error (dB)"
+    columns = [sim_result[key] for key in detection.RESULT_KEYS]
+    for start in range(0, len(columns[0]), BLOCK_ROWS):
+        rows = zip(*[column[start : start + BLOCK_ROWS].tolist() for column in columns])
+        for pin, reading, slope, error in rows:
+            props = [round(pin, 4), f"{reading:.6g}", f"{slope:.6g}", round(error, 2)]
+            yield ",".join(map(str, props))
+
+
+def csv_montecarlo(mc_result):
+    """Generate a csv results structure for Monte Carlo analysis."""
+    csv_lines = [f"Samples,{mc_result['samples']}"]
+    if mc_result["yield"] is not None:
+        csv_lines.append(f"Yield (%),{round(100 * mc_result['yield'], 2)}")
+    csv_lines.append("")
+
+    percentiles = list(mc_result["gain"]["percentiles"])
+    header_props = ["Property", "Nominal", "Mean", "Std", "Min"]
+    header_props += [f"P{p}" for p in percentiles]
+    header_props.append("Max")
+    csv_lines.append(",".join(header_props))
+
+    for key in montecarlo.RESULT_KEYS:
+        stats = mc_result[key]
+        props = [stats["nominal"], stats["mean"], stats["std"], stats["min"]]
+        props += [stats["percentiles"][p] for p in percentiles]
+        props.append(stats["max"])
+        value_props = ",".join(str(x) for x in props)
+        csv_lines.append(f"{key},{value_props}")
 
     return csv_lines
 
 
+def csv_ordering(system, orderings):
+    """Generate a csv results structure for block ordering optimization."""
+    header_props = ["NF (dB)", "IIP3 (dBm)", "Gain (dB)", "P1dB (dBm)", "Order"]
+    csv_lines = [",".join(header_props)]
+    for result in orderings:
+        names = [str(system[index].name or index + 1) for index in result["order"]]
+        props = [result["nf"], result["iip3"], result["gain"], result["p1db"]]
+        value_props = ",".join(str(x) for x in props)
+        csv_lines.append(f"{value_props},{' > '.join(names)}")
+    return csv_lines
+
+
+def csv_explore(slots, front):
+    """Generate a csv results structure for design-space exploration."""
+    header_props = ["NF (dB)", "IIP3 (dBm)", "Gain (dB)", "Power (W)"]
+    header_props += [f"Block {index + 1}" for index in range(len(slots))]
+    csv_lines = [",".join(header_props)]
+    for result in front:
+        props = [result["nf"], result["iip3"], result["gain"], result["power"]]
+        props += [
+            slots[slot][part].name or part + 1
+            for slot, part in enumerate(result["parts"])
+        ]
+        csv_lines.append(",".join(str(x) for x in props))
+    return csv_lines
+
+
+def table_line(line):
+    """Format a csv line as a row of fixed-width columns for printing."""
+    return "".join(f"{element:<16}" for element in line.split(","))
+
+
 def print_cascade(system, sim_result, return_lines=False):
     """
     Print the results of cascade analysis.
@@ -48,26 +350,29 @@ def print_cascade(system, sim_result, return_lines=False):
     :param sim_result: results from cascade analysis
     :param return_lines: set to TRUE to supress printing and return lines to be printed instead
     """
-    lines = csv_cascade(system, sim_result)
-    print_lines = []
-    for line in lines:
-        print_lines.append(line.split(","))
+    lines = iter_csv_cascade(system, sim_result)
     if return_lines:
-        return print_lines
+        return [line.split(",") for line in lines]
 
-    for line in print_lines:
-        print_string = ""
-        for element in line:
-            print_string += f"{element:<16}"
-        print(print_string)
+    for line in lines:
+        print(table_line(line))
     return []
 
 
+def save_columns(save_file, columns, attrs=None):
+    """Save results in the binary column format."""
+    return columnar.save(save_file, columns, attrs)
+
+
 def save_csv(save_file, results):
-    """Save results as csv."""
-    new_results = []
-    for line in results:
-        new_results.append(line + "\n")
-    with open(save_file, "w") as csvfile:
-        csvfile.writelines(new_results)
+    """
+    Save results as csv.
+
+    Lines are written as they are generated through a buffered file, so
+    results can be any iterable (such as a generator) of csv lines.
+    """
+    with open(save_file, "w", buffering=WRITE_BUFFER) as csvfile:
+        for line in results:
+            csvfile.write(line)
+            csvfile.write("\n")
     return save_file
@@ -1,5 +1,6 @@
 """Init file for simulation."""
 import math
+import numpy as np
 from rfdesigner.const import KBOLTZMAN
 
 
@@ -35,3 +36,56 @@ def sfdr(iip3=0, mds=0):
     :param mds: Minimum detectable signal in dBm.
     """
     return 2 / 3 * (iip3 - mds)
+
+
+def pareto_mask(costs):
+    """
+    Get mask of non-dominated points.
+
+    Points with identical costs are reduced to the first occurrence.
+
+    :param costs: (n_points x n_objectives) array where every objective is minimized.
+    """
+    costs = np.asarray(costs, dtype=float)
+    mask = np.zeros(len(costs), dtype=bool)
+    if costs.ndim == 2 and costs.shape[1] == 2:
+        # Sorted by the first objective a point is efficient when it improves
+        # on the best second objective seen so far
+        order = np.lexsort((costs[:, 1], costs[:, 0]))
+        second = costs[order, 1]
+        best = np.minimum.accumulate(second)
+        mask[order] = np.concatenate([[True], second[1:] < best[:-1]])[: len(costs)]
+        return mask
+    # Visiting points with a low cost sum first removes most dominated points
+    # early (a point can only be dominated by points with a lower sum)
+    efficient = np.argsort(costs.sum(axis=1), kind="stable")
+    costs = costs[efficient]
+    index = 0
+    while index < len(costs):
+        nondominated = np.any(costs < costs[index], axis=1)
+        nondominated[index] = True
+        efficient = efficient[nondominated]
+        costs = costs[nondominated]
+        index = int(np.sum(nondominated[:index])) + 1
+    mask[efficient] = True
+    return mask
+
+
+def dominated_mask(costs, reference, block_size=1000000):
+    """
+    Get mask of points that are no better than some reference point.
+
+    :param costs: (n_points x n_objectives) array where every objective is minimized.
+    :param reference: (n_reference x n_objectives) array of reference points.
+    :param block_size: Maximum number of point pairs compared at a time.
+    """
+    costs = np.asarray(costs, dtype=float)
+    reference = np.asarray(reference, dtype=float)
+    mask = np.zeros(len(costs), dtype=bool)
+    if not len(reference):
+        return mask
+    step = max(1, block_size // len(reference))
+    for start in range(0, len(costs), step):
+        block = costs[start : start + step, np.newaxis, :]
+        mask[start : start + step] = np.all(reference <= block, axis=2).any(axis=1)
+    return mask
@@ -0,0 +1,136 @@
+"""Module for the sensitivity of cascade totals to block parameters."""
+import numpy as np
+from rfdesigner.simulation import batch
+
+# Cascade totals and the block parameters they are differentiated by
+TOTALS = ["gain", "nf", "iip3", "p1db", "snr", "sfdr"]
+PARAMS = ["gain", "nf", "iip3", "p1db"]
+
+
+def _suffix_sum(terms):
+    """Get the sum of the terms after every position along the last axis."""
+    after = np.zeros(terms.shape)
+    # Summing from the end of the chain (rather than subtracting running sums
+    # from the total) keeps small terms after large ones exact
+    after[..., :-1] = np.cumsum(terms[..., :0:-1], axis=-1)[..., ::-1]
+    return after
+
+
+def _intercept_derivatives(gain_before, values):
+    """
+    Get derivatives of a cascaded intercept point.
+
+    The intercept is -10*log10(sum(u_k)) + 30 with
+    u_k = 10**((gain_before_k - value_k + 30) / 10), so its derivative by
+    value_k is u_k / sum(u) and by gain_k is -sum(u_j for j > k) / sum(u).
+
+    :return: tuple of (derivative by each value, derivative by each gain).
+    """
+    terms = 10 ** ((gain_before - values + 30) / 10)
+    total = terms.sum(axis=-1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        by_value = np.where(total > 0, terms / total, 0.0)
+        by_gain = np.where(total > 0, -_suffix_sum(terms) / total, 0.0)
+    return by_value, by_gain
+
+
+def jacobian(gain, nf, iip3, p1db, mask=None):
+    """
+    Get the derivatives of the cascade totals of a batch of signal chains.
+
+    Every derivative comes from the terms of the Friis and intercept formulas
+    (see batch.cascade) and their running sums from either end of the chain,
+    so the whole Jacobian of a chain takes O(n_blocks) work.  Derivatives are
+    in dB per dB.  The noise floor follows the NF, so the SNR moves by
+    -2 dB and the SFDR by -2/3 dB per dB of NF (see rfmath.snr and
+    rfmath.sfdr).
+
+    :param gain: (n_chains x n_blocks) block gains in dB.
+    :param nf: Block noise figures in dB.
+    :param iip3: Block input 3rd-order intercepts in dBm.
+    :param p1db: Block 1dB compression points in dBm.
+    :param mask: Optional boolean array, True where a block exists.
+    :return: nested dictionary of (n_chains x n_blocks) arrays, where jacobian[total][param] is the derivative of a total (see TOTALS) by a block parameter (see PARAMS) and padded blocks are NaN.
+    """
+    gain, nf, iip3, p1db = (
+        np.atleast_2d(np.asarray(x, dtype=float)) for x in (gain, nf, iip3, p1db)
+    )
+    if mask is not None:
+        mask = np.atleast_2d(np.asarray(mask, dtype=bool))
+        gain = np.where(mask, gain, batch.PAD_VALUES["gain"])
+        nf = np.where(mask, nf, batch.PAD_VALUES["nf"])
+        iip3 = np.where(mask, iip3, batch.PAD_VALUES["iip3"])
+        p1db = np.where(mask, p1db, batch.PAD_VALUES["p1db"])
+
+    gain_before = np.cumsum(gain, axis=-1) - gain
+    gain_before_linear = 10 ** (gain_before / 10)
+    factor = 10 ** (nf / 10)
+    nf_terms = (factor - 1) / gain_before_linear
+    total_factor = 1 + nf_terms.sum(axis=-1, keepdims=True)
+    nf_by_nf = factor / gain_before_linear / total_factor
+    nf_by_gain = -_suffix_sum(nf_terms) / total_factor
+
+    iip3_by_iip3, iip3_by_gain = _intercept_derivatives(gain_before, iip3)
+    p1db_by_p1db, p1db_by_gain = _intercept_derivatives(gain_before, p1db)
+
+    zeros = np.zeros(gain.shape)
+    result = {
+        "gain": {
+            "gain": np.ones(gain.shape),
+            "nf": zeros,
+            "iip3": zeros,
+            "p1db": zeros,
+        },
+        "nf": {"gain": nf_by_gain, "nf": nf_by_nf, "iip3": zeros, "p1db": zeros},
+        "iip3": {
+            "gain": iip3_by_gain,
+            "nf": zeros,
+            "iip3": iip3_by_iip3,
+            "p1db": zeros,
+        },
+        "p1db": {
+            "gain": p1db_by_gain,
+            "nf": zeros,
+            "iip3": zeros,
+            "p1db": p1db_by_p1db,
+        },
+    }
+    # mds = noise_floor(nf), snr = pin - mds - nf and sfdr = 2/3 * (iip3 - mds)
+    result["snr"] = {param: -2 * result["nf"][param] for param in PARAMS}
+    result["sfdr"] = {
+        param: 2 / 3 * (result["iip3"][param] - result["nf"][param]) for param in PARAMS
+    }
+    for total in TOTALS:
+        for param in PARAMS:
+            # Every entry gets its own array, so results can be edited safely
+            values = np.array(result[total][param], dtype=float)
+            if mask is not None:
+                values[~mask] = np.nan
+            result[total][param] = values
+    return result
+
+
+def run(system=None):
+    """
+    Get the derivatives of the cascade totals of a signal chain.
+
+    :param system: Sequential list of RF objects (or a ChainTable).
+    :return: nested dictionary of arrays over the blocks (see jacobian).
+    """
+    if not system:
+        return {}
+    derivatives = jacobian(**batch.pack_systems([system]))
+    return {
+        total: {param: values[0] for param, values in by_param.items()}
+        for total, by_param in derivatives.items()
+    }
+
+
+def run_systems(systems):
+    """
+    Get the derivatives of the cascade totals of many signal chains at once.
+
+    :param systems: List of systems (each a sequential list of RF objects or a ChainTable).
+    :return: nested dictionary of (n_chains x n_blocks) arrays (see jacobian).
+    """
+    return jacobian(**batch.pack_systems(systems))
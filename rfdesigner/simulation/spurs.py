@@ -0,0 +1,113 @@
+"""Module for mixer spur analysis."""
+import numpy as np
+
+RESULT_KEYS = ["lo", "rf", "m", "n", "freq", "level"]
+
+
+def spur_orders(order=5):
+    """
+    Get the LO and RF multiples of every mixing product up to an order.
+
+    Products are |m*LO + n*RF| with m >= 0 and |m| + |n| <= order.  Products
+    of the RF alone (m = 0) only appear once, with n > 0.
+
+    :param order: Highest product order.
+    :return: tuple of (m, n) integer arrays.
+    """
+    m, n = np.meshgrid(
+        np.arange(order + 1), np.arange(-order, order + 1), indexing="ij"
+    )
+    m = m.ravel()
+    n = n.ravel()
+    keep = (m + np.abs(n) <= order) & ((m > 0) | (n > 0))
+    return m[keep], n[keep]
+
+
+def spur_chart(mixer, order=5, pin=None):
+    """
+    Get the spur chart of a mixer.
+
+    :param mixer: Mixer object.
+    :param order: Highest product order.
+    :param pin: RF input power in dBm (the mixer's spur_pin by default).
+    :return: (order + 1 x order + 1) array of levels in dBc indexed by [n, m] (nan for m = n = 0 and above the order).
+    """
+    n, m = np.meshgrid(np.arange(order + 1), np.arange(order + 1), indexing="ij")
+    chart = mixer.spur_levels(m, n, pin)
+    return np.where((m + n <= order) & (m + n > 0), chart, np.nan)
+
+
+class SpurTable:
+    """
+    Frequencies of every mixing product over a sweep of LO and RF frequencies.
+
+    All (sweep point, product) frequencies are computed at once by
+    broadcasting and sorted once, so finding the products inside any band is
+    a binary search followed by a slice.
+    """
+
+    def __init__(self, lo, rf, order=5):
+        """
+        Initialize the spur table.
+
+        :param lo: LO frequency (or array of LO frequencies) in MHz.
+        :param rf: RF frequency (or array of RF frequencies) in MHz, broadcast against lo.
+        :param order: Highest product order.
+        """
+        lo, rf = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(lo, dtype=float)),
+            np.atleast_1d(np.asarray(rf, dtype=float)),
+        )
+        self.lo = lo.ravel()
+        self.rf = rf.ravel()
+        self.m, self.n = spur_orders(order)
+        self.freqs = np.abs(
+            self.lo[:, np.newaxis] * self.m + self.rf[:, np.newaxis] * self.n
+        )
+        self._index = np.argsort(self.freqs, axis=None)
+        self._sorted = self.freqs.ravel()[self._index]
+
+    def in_band(self, low, high):
+        """
+        Find every product between two frequencies.
+
+        :param low: Lower band edge in MHz.
+        :param high: Upper band edge in MHz (inclusive).
+        :return: tuple of (sweep point, product) index arrays, ordered by frequency.
+        """
+        start = np.searchsorted(self._sorted, low, side="left")
+        stop = np.searchsorted(self._sorted, high, side="right")
+        return np.divmod(self._index[start:stop], len(self.m))
+
+
+def find_spurs(mixer, lo, rf, if_low, if_high, order=5, pin=None, desired=(1, -1)):
+    """
+    Find the mixing products of a mixer that land in the IF passband.
+
+    :param mixer: Mixer object.
+    :param lo: LO frequency (or array of LO frequencies) in MHz.
+    :param rf: RF frequency (or array of RF frequencies) in MHz, broadcast against lo.
+    :param if_low: Lower edge of the IF passband in MHz.
+    :param if_high: Upper edge of the IF passband in MHz (inclusive).
+    :param order: Highest product order.
+    :param pin: RF input power of the mixer in dBm (the mixer's spur_pin by default).
+    :param desired: (m, n) of the wanted product, which is not reported.
+    :return: dictionary of arrays (see RESULT_KEYS) with one entry per in-band spur, ordered by sweep point and then level.
+    """
+    table = SpurTable(lo, rf, order)
+    points, products = table.in_band(if_low, if_high)
+    wanted = (table.m[products] == desired[0]) & (table.n[products] == desired[1])
+    points = points[~wanted]
+    products = products[~wanted]
+    levels = mixer.spur_levels(table.m, table.n, pin)
+    order_by = np.lexsort((-levels[products], points))
+    points = points[order_by]
+    products = products[order_by]
+    return {
+        "lo": table.lo[points],
+        "rf": table.rf[points],
+        "m": table.m[products],
+        "n": table.n[products],
+        "freq": table.freqs[points, products],
+        "level": levels[products],
+    }
@@ -0,0 +1,96 @@
+"""Module for input power sweep analysis."""
+import numpy as np
+from rfdesigner.components import RFSignalArray
+from rfdesigner.simulation import batch, rfmath
+
+
+def pin_range(start, stop, step=1):
+    """Return input power points from start to stop (inclusive) in dBm."""
+    return np.arange(start, stop + step / 2, step, dtype=float)
+
+
+def as_dbm(pin):
+    """Get input powers as a one-dimensional RFSignalArray in dBm."""
+    if not isinstance(pin, RFSignalArray):
+        pin = RFSignalArray(pin, units="dBm")
+    return np.atleast_1d(pin.dBm)
+
+
+def propagate(system, pin):
+    """
+    Push an array of input powers through a signal chain.
+
+    :param system: Sequential list of RF objects.
+    :param pin: Array of input powers in dBm (or an RFSignalArray).
+    :return: tuple of (n_points x n_blocks) output power and compression arrays.
+    """
+    pin = as_dbm(pin)
+    stage_pout = RFSignalArray(np.empty((pin.size, len(system))), units="dBm")
+    compressed = np.empty((pin.size, len(system)), dtype=bool)
+    signal = pin
+    for col, block in enumerate(system):
+        signal, stage_compressed = block.output_array(signal)
+        stage_pout[:, col] = signal
+        compressed[:, col] = stage_compressed
+    return stage_pout, compressed
+
+
+def run(system=None, pin=0, bandwidth=1, noise_temp=290):
+    """
+    Perform cascade analysis over a sweep of input powers.
+
+    :param system: Sequential list of RF objects where position in list indicates position in signal chain.
+    :param pin: Array of input powers of the system in dBm (or an RFSignalArray).
+    :param bandwidth: Bandwidth of input signal in Hz.
+    :param noise_temp: Noise temperature in Kelvin.
+    """
+    if not system:
+        return {}
+
+    pin = as_dbm(pin)
+    arrays = batch.pack_systems([system])
+    totals = batch.cascade(**arrays)
+    total_gain = totals["gain"][0]
+    total_nf = totals["nf"][0]
+    total_iip3 = totals["iip3"][0]
+    mds = rfmath.noise_floor(nf=total_nf, bandwidth=bandwidth, noise_temp=noise_temp)
+    stage_pout, compressed = propagate(system, pin)
+
+    results = {
+        "pin": pin,
+        "pout": stage_pout[:, -1],
+        "stage_pout": stage_pout,
+        "compressed": compressed,
+        "gain": total_gain,
+        "nf": total_nf,
+        "iip3": total_iip3,
+        "oip3": total_iip3 + total_gain,
+        "p1db": totals["p1db"][0],
+        "snr": rfmath.snr(pin=pin.values, mds=mds, nf=total_nf),
+        "sfdr": np.full(pin.shape, rfmath.sfdr(iip3=total_iip3, mds=mds)),
+        "mds": mds,
+    }
+    return results
+
+
+def iter_run(system=None, pin=0, bandwidth=1, noise_temp=290, block_size=65536):
+    """
+    Perform cascade analysis over a sweep of input powers one block at a time.
+
+    Memory use only depends on block_size, however many input powers are swept.
+
+    :param system: Sequential list of RF objects where position in list indicates position in signal chain.
+    :param pin: Array of input powers of the system in dBm (or an RFSignalArray).
+    :param bandwidth: Bandwidth of input signal in Hz.
+    :param noise_temp: Noise temperature in Kelvin.
+    :param block_size: Number of input powers analyzed at a time.
+    :return: generator of results as returned by :func:`run` for consecutive blocks of input powers.
+    """
+    pin = as_dbm(pin)
+    for start in range(0, len(pin), block_size):
+        yield run(
+            system=system,
+            pin=pin[start : start + block_size],
+            bandwidth=bandwidth,
+            noise_temp=noise_temp,
+        )
@@ -0,0 +1,159 @@
+"""Module for time-domain simulation of waveforms through a signal chain."""
+import math
+import numpy as np
+from rfdesigner.components import Generic, ProcessState, add_noise
+
+# Number of samples processed at a time
+CHUNK_SIZE = 1 << 16
+
+
+def iter_chunks(samples, chunk_size=CHUNK_SIZE):
+    """
+    Generate consecutive chunks of an array of samples.
+
+    Chunks are views, so only the chunk being processed of a memory-mapped
+    array is read from disk.
+
+    :param samples: Array (or memory-mapped array) of samples.
+    :param chunk_size: Number of samples per chunk (the last chunk may be shorter).
+    """
+    for start in range(0, len(samples), chunk_size):
+        yield samples[start : start + chunk_size]
+
+
+def load_samples(file_name, dtype=np.complex64):
+    """
+    Memory-map a file of samples.
+
+    :param file_name: A .npy file, or a raw file of samples.
+    :param dtype: Sample type of a raw file.
+    :return: read-only memory-mapped array.
+    """
+    if str(file_name).endswith(".npy"):
+        return np.load(file_name, mmap_mode="r")
+    return np.memmap(file_name, dtype=dtype, mode="r")
+
+
+def open_output(file_name, samples):
+    """
+    Create a memory-mapped .npy file for the output of a record of samples.
+
+    :param file_name: Name of the .npy file.
+    :param samples: Array of input samples, which sets the length and type.
+    :return: writable memory-mapped array.
+    """
+    dtype = samples.dtype if samples.dtype.kind in "fc" else float
+    return np.lib.format.open_memmap(
+        file_name, mode="w+", dtype=dtype, shape=(len(samples),)
+    )
+
+
+class WaveformChain:
+    """
+    Time-domain model of a signal chain.
+
+    Every block applies its gain, compression and noise to the samples (see
+    Generic.process).  Noise is drawn from random streams carried between
+    chunks, so the output does not depend on how the input is split into
+    chunks.  Blocks are memoryless: frequency responses
+    are not applied (see the frequency module).
+    """
+
+    def __init__(self, system, sample_rate, noise_temp=None, seed=None, noise=True):
+        """
+        Initialize the chain.
+
+        :param system: Sequential list of RF objects (or a ChainTable).
+        :param sample_rate: Sample rate in MHz.
+        :param noise_temp: Temperature in Kelvin of thermal noise added at the input (None for none).
+        :param seed: Seed of the noise.
+        :param noise: Add the noise of the blocks.
+        """
+        if hasattr(system, "to_blocks"):
+            system = system.to_blocks()
+        self.system = system
+        self.sample_rate = float(sample_rate)
+        blocks = list(system)
+        if noise_temp is not None:
+            # A noiseless source at noise_temp adds noise like a block with
+            # a noise factor of 1 + noise_temp / 290
+            nf = 10 * math.log10(1 + noise_temp / 290)
+            blocks.insert(0, Generic(name="source", gain=0, nf=nf))
+        seeds = np.random.SeedSequence(seed).spawn(len(blocks))
+        states = [ProcessState(sample_rate, block_seed, noise) for block_seed in seeds]
+        self.stages = list(zip(blocks, states))
+
+    def process(self, samples, out=None):
+        """
+        Pass a chunk of samples through every block.
+
+        :param samples: Array of real (passband) or complex (baseband) samples in sqrt(W).
+        :param out: Array to write the output to (may be samples).
+        :return: array of output samples.
+        """
+        samples = np.asarray(samples)
+        if out is None:
+            dtype = samples.dtype if samples.dtype.kind in "fc" else float
+            out = np.array(samples, dtype=dtype)
+        elif out is not samples:
+            out[...] = samples
+        # Noise of linear blocks is carried forward (scaled by their gain) and
+        # drawn once at the input of the next nonlinear block, since a sum of
+        # independent Gaussian noises is Gaussian noise of the summed power
+        pending = 0.0
+        for block, state in self.stages:
+            if state.rng is not None:
+                pending += block.noise_power(self.sample_rate)
+            a1, a3, a5 = block.polynomial()
+            if a3 == 0 and a5 == 0:
+                pending *= a1 ** 2
+            elif pending:
+                add_noise(out, pending, state.rng)
+                pending = 0.0
+            block.process(out, out=out)
+        if pending:
+            add_noise(out, pending, state.rng)
+        return out
+
+    def stream(self, chunks):
+        """
+        Generate the output of the chain for every chunk of an input stream.
+
+        :param chunks: Iterable of arrays of samples (see iter_chunks).
+        """
+        for chunk in chunks:
+            yield self.process(chunk)
+
+    def run(self, samples, out=None, chunk_size=CHUNK_SIZE):
+        """
+        Pass a whole record through the chain one chunk at a time.
+
+        :param samples: Array (or memory-mapped array) of samples.
+        :param out: Array (or memory-mapped array) to write the output to (new array by default).
+        :param chunk_size: Number of samples per chunk.
+        :return: array of output samples.
+        """
+        samples = np.asarray(samples)
+        if out is None:
+            dtype = samples.dtype if samples.dtype.kind in "fc" else float
+            out = np.empty(len(samples), dtype=dtype)
+        for output, chunk in zip(
+            iter_chunks(out, chunk_size), iter_chunks(samples, chunk_size)
+        ):
+            self.process(chunk, out=output)
+        return out
+
+
+def run(system=None, samples=None, sample_rate=None, **kwargs):
+    """
+    Simulate a waveform through a signal chain.
+
+    :param system: Sequential list of RF objects where position in list indicates position in signal chain.
+    :param samples: Array (or memory-mapped array) of real (passband) or complex (baseband) samples in sqrt(W).
+    :param sample_rate: Sample rate in MHz.
+    :param kwargs: Options of WaveformChain.
+    :return: array of output samples.
+    """
+    if not system:
+        return np.array(samples)
+    return WaveformChain(system, sample_rate, **kwargs).run(samples)
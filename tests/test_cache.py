@@ -0,0 +1,148 @@
+"""Test the on-disk netlist cache."""
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+import numpy as np
+import toml
+from rfdesigner import cache, netlist
+from rfdesigner.chaintable import ChainTable
+from rfdesigner.components.amplifier import LNA
+
+NETLIST = """
+[simulation]
+pin = -30
+
+[rx]
+  [rx.1]
+  type = "lna"
+  name = "front end"
+  gain = 15
+  nf = 2
+  gain_sigma = 0.5
+  [rx.2]
+  type = "detector"
+  law = "square"
+  mds = 1e-6
+  [rx.3]
+  type = "vga"
+  gain_min = 0
+  gain_max = 20
+  control = 4
+
+[space]
+  [[space.1]]
+  type = "amp"
+  gain = 10
+  [[space.1]]
+  type = "amp"
+  gain = 20
+  [space.2]
+  type = "passive"
+  gain = -3
+"""
+
+
+class TestCache(unittest.TestCase):
+    """Object to test the netlist cache."""
+
+    def setUp(self):
+        """Set up a netlist file and an empty cache directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.tmp.name, "netlist.toml")
+        with open(self.file_name, "w") as netlist_file:
+            netlist_file.write(NETLIST)
+        environ = {cache.CACHE_ENV: os.path.join(self.tmp.name, "cache")}
+        patcher = mock.patch.dict(os.environ, environ)
+        patcher.start()
+        self.printed = ""
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def parse(self, **kwargs):
+        """Parse the netlist and get the systems and whether the cache was hit."""
+        output = io.StringIO()
+        with redirect_stdout(output), mock.patch(
+            "rfdesigner.netlist.toml.load", wraps=toml.load
+        ) as load:
+            systems = netlist.parse_netlist(self.file_name, **kwargs)
+        self.printed = output.getvalue()
+        return systems, not load.called
+
+    def test_store_load(self):
+        """Test chain tables round trip through the cache as memory maps."""
+        table = ChainTable.from_blocks([LNA(name="lna", gain=15, nf=2)])
+        self.assertIsNone(cache.load(self.file_name, netlist.IMPLEMENTED_BLOCKS))
+        cache.store(self.file_name, {"rx": table, "space": [table], "sim": {"a": 1}})
+        entries = cache.load(self.file_name, netlist.IMPLEMENTED_BLOCKS)
+        self.assertIsInstance(entries["rx"].data, np.memmap)
+        np.testing.assert_array_equal(entries["rx"].data, table.data)
+        self.assertEqual(entries["rx"].block_types, [LNA])
+        self.assertEqual(entries["rx"].names, ["lna"])
+        self.assertEqual(len(entries["space"]), 1)
+        self.assertDictEqual(entries["sim"], {"a": 1})
+        cache.clear()
+        self.assertIsNone(cache.load(self.file_name, netlist.IMPLEMENTED_BLOCKS))
+
+    def test_parse_hit_miss(self):
+        """Test parsing reports cache misses and hits with identical systems."""
+        parsed, hit = self.parse()
+        self.assertFalse(hit)
+        self.assertEqual(self.printed, "")
+        cached, hit = self.parse()
+        self.assertTrue(hit)
+        self.assertEqual(self.printed, "")
+        self.assertDictEqual(cached["sim"], parsed["sim"])
+        reports = []
+        self.parse(cache_report=reports.append)
+        self.parse(use_cache=False, cache_report=reports.append)
+        self.assertListEqual(reports, [True])
+        for block, cached_block in zip(parsed["rx"].system, cached["rx"].system):
+            self.assertEqual(cached_block.__class__, block.__class__)
+            self.assertEqual(cached_block.name, block.name)
+            for prop in ["gain", "nf", "iip3", "p1db", "tolerances"]:
+                self.assertEqual(getattr(cached_block, prop), getattr(block, prop))
+        self.assertEqual(cached["rx"].system[1].law, "square")
+        self.assertEqual(cached["rx"].system[2].control, 4)
+        self.assertListEqual(
+            [block.gain for block in cached["space"].slots[0]], [10, 20]
+        )
+        compact, _ = self.parse(compact=True)
+        self.assertIsInstance(compact["rx"].system, ChainTable)
+        _, hit = self.parse(use_cache=False)
+        self.assertFalse(hit)
+
+    def test_invalidation(self):
+        """Test the cache is invalidated by file, version and format changes."""
+        self.parse()
+        with open(self.file_name, "a") as netlist_file:
+            netlist_file.write("\n# changed\n")
+        _, hit = self.parse()
+        self.assertFalse(hit)
+        with mock.patch("rfdesigner.cache.__version__", "0.0.0"):
+            _, hit = self.parse()
+        self.assertFalse(hit)
+        with mock.patch("rfdesigner.cache.FORMAT_VERSION", 0):
+            _, hit = self.parse()
+        self.assertFalse(hit)
+
+    def test_failed_store_cleaned_up(self):
+        """Test a cache entry that fails to be written leaves nothing behind."""
+        table = ChainTable.from_blocks([LNA(name="lna", gain=15, nf=2)])
+        with mock.patch("rfdesigner.cache.np.save", side_effect=OSError):
+            self.assertIsNone(cache.store(self.file_name, {"rx": table}))
+        self.assertListEqual(os.listdir(cache.cache_dir()), [])
+        path = cache.store(self.file_name, {"rx": table})
+        self.assertEqual(cache.store(self.file_name, {"rx": table}), path)
+        self.assertListEqual(os.listdir(cache.cache_dir()), [os.path.basename(path)])
+
+    def test_invalid_not_cached(self):
+        """Test netlists with invalid systems are parsed every time."""
+        with open(self.file_name, "a") as netlist_file:
+            netlist_file.write('\n[bad]\n  [bad.1]\n  type = "foobar"\n')
+        self.parse()
+        systems, hit = self.parse()
+        self.assertFalse(hit)
+        self.assertNotIn("bad", systems)
@@ -0,0 +1,154 @@
+"""Test compact chain table."""
+import unittest
+import rfdesigner.simulation.cascade as sim
+from rfdesigner import netlist
+from rfdesigner.chaintable import ChainTable, BlockView
+from rfdesigner.components import Generic, RFSignal
+from rfdesigner.components.amplifier import LNA
+from rfdesigner.components.detector import Detector
+from rfdesigner.components.filter import BPF
+from rfdesigner.components.vga import VGA
+from rfdesigner.simulation import batch, results
+
+
+class TestChainTable(unittest.TestCase):
+    """Object to test the chain table."""
+
+    def setUp(self):
+        """Set up chain table testing."""
+        self.blocks = [
+            LNA(name="lna", gain=15, nf=3, p1db=10, iip3=20, f3db=100, gain_sigma=1),
+            Generic(gain=-3, nf_range=[2, 4]),
+            VGA(gain_min=0, gain_max=20, gain_step=2, control=3, nf=6),
+            Detector(gain=10, law="square", mds=1e-6, smax=1),
+        ]
+        self.table = ChainTable.from_blocks(self.blocks)
+
+    def test_columns(self):
+        """Test that columns are contiguous float arrays."""
+        gain = self.table.column("gain")
+        self.assertTrue(gain.flags["C_CONTIGUOUS"])
+        self.assertListEqual(gain.tolist(), [15, -3, 6, 10])
+        self.assertEqual(len(self.table), 4)
+
+    def test_block_view(self):
+        """Test block views read and write the table."""
+        view = self.table[0]
+        self.assertIsInstance(view, BlockView)
+        with self.assertRaises(AttributeError):
+            view.foo = "bar"
+        self.assertEqual(view.name, "lna")
+        self.assertEqual(view.gain.__class__, RFSignal)
+        self.assertEqual(view.gain.units, "dBW")
+        self.assertEqual(view.f3db, 100)
+        self.assertEqual(self.table[-1].mds.units, "W")
+        self.assertEqual(self.table[-1].block_type, Detector)
+        view.gain = 12
+        self.assertEqual(self.table.column("gain")[0], 12)
+        with self.assertRaises(IndexError):
+            self.table[4]  # pylint: disable=pointless-statement
+
+    def test_lossless_conversion(self):
+        """Test round trip back to component objects."""
+        blocks = self.table.to_blocks()
+        for original, block in zip(self.blocks, blocks):
+            self.assertEqual(original.__class__, block.__class__)
+            self.assertEqual(original.name, block.name)
+            for prop in ["gain", "nf", "iip3", "oip3", "p1db", "power"]:
+                self.assertEqual(getattr(original, prop), getattr(block, prop))
+            self.assertDictEqual(original.tolerances, block.tolerances)
+        self.assertEqual(blocks[0].f3db, 100)
+        self.assertEqual(blocks[2].control, 3)
+        self.assertEqual(blocks[3].law, "square")
+        self.assertEqual(blocks[3].mds, 1e-6)
+
+    def test_vga_control(self):
+        """Test editing VGA controls through a view updates the gain column."""
+        table = ChainTable.from_blocks(
+            [
+                Generic(gain=10, nf=2, p1db=0),
+                VGA(gain_min=0, gain_max=20, gain_step=1, control=5),
+            ]
+        )
+        table[1].control = 15
+        self.assertEqual(table[1].gain, 15)
+        self.assertEqual(table[1].to_block().gain, 15)
+        table[1].gain_max = 12
+        self.assertEqual(table[1].gain, 12)
+        result = sim.run(table, pin=-50)
+        self.assertEqual(result["gain"], 22)
+        self.assertEqual(result["pout"], -28)
+
+    def test_revisions(self):
+        """Test views keep table-backed revisions like component objects."""
+        table = ChainTable.from_blocks([Generic(gain=10, nf=2), VGA(gain_max=20)])
+        self.assertIs(table[1].block_type, VGA)
+        self.assertIs(Generic().block_type, Generic)
+        first, second = table[0].revision, table[1].revision
+        table_revision = table[1].table_revision
+        table[1].control = 0.5
+        self.assertGreater(table[1].revision, second)
+        self.assertEqual(table[1].table_revision, table_revision)
+        self.assertLessEqual(table[1].revision, Generic.last_revision)
+        table[1].gain_max = 10
+        self.assertEqual(table[1].table_revision, table[1].revision)
+        table[0].output(pin=-30)
+        self.assertEqual(table[0].revision, first)
+        table[0].nf = 3
+        self.assertGreater(table[0].revision, first)
+
+    def test_output(self):
+        """Test block outputs are stored in the table."""
+        self.assertTrue(self.table[0].output(pin=20) < 35)
+        self.assertTrue(self.table[0].is_compressed)
+        sim.run(self.table, pin=-40)
+        self.assertFalse(self.table[0].is_compressed)
+        self.assertEqual(self.table[0].pout, -25)
+        sim.run(self.table, pin=20)
+        self.assertEqual(self.table[-1].pout, sim.run(self.blocks, pin=20)["pout"])
+        self.assertTrue(self.table[0].is_compressed)
+        self.assertTrue(self.table.to_block(0).is_compressed)
+
+    def test_filter(self):
+        """Test filter parameters survive conversion to and from a table."""
+        bpf = BPF(fc=100, bandwidth=10, order=4, prototype="ellip", attenuation=50)
+        table = ChainTable.from_blocks([bpf, Generic()])
+        self.assertEqual(table[0].prototype, "ellip")
+        self.assertIsNone(table[1].prototype)
+        block = table.to_block(0)
+        self.assertEqual(block.design_key(), bpf.design_key())
+
+    def test_compression(self):
+        """Test compression models survive conversion to and from a table."""
+        rf = Generic(gain=10, p1db=5, compression="rapp", smoothness=3, am_pm=4)
+        table = ChainTable.from_blocks([rf, Generic()])
+        self.assertEqual(table[0].compression, "rapp")
+        self.assertEqual(table[1].compression, "hard")
+        block = table.to_block(0)
+        self.assertEqual(block.compression, "rapp")
+        self.assertEqual(block.smoothness, 3)
+        self.assertEqual(block.am_pm, 4)
+
+    def test_cascade_run(self):
+        """Test cascade analysis consumes the table directly."""
+        expected = sim.run(self.blocks, pin=-40)
+        result = sim.run(self.table, pin=-40)
+        self.assertDictEqual(result, expected)
+        self.assertEqual(self.table.column("total_nf")[-1], expected["nf"])
+        self.assertListEqual(
+            results.csv_cascade(self.table, result),
+            results.csv_cascade(self.blocks, expected),
+        )
+
+    def test_batch_pack(self):
+        """Test batch packing uses the table columns."""
+        arrays = batch.pack_systems([self.table, self.blocks[:2]])
+        self.assertListEqual(arrays["gain"][0].tolist(), [15, -3, 6, 10])
+        self.assertListEqual(arrays["mask"][1].tolist(), [True, True, False, False])
+
+    def test_compact_signal_chain(self):
+        """Test SignalChain can store a chain table."""
+        system = {"1": {"type": "lna", "gain": 10}, "2": {"type": "passive"}}
+        chain = netlist.SignalChain("foobar", system, compact=True)
+        self.assertIsInstance(chain.system, ChainTable)
+        self.assertEqual(chain.system[1].block_type.__name__, "Passive")
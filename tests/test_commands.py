@@ -0,0 +1,315 @@
+"""Test analysis commands run without the interactive shell."""
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from rfdesigner import cache, commands
+from rfdesigner.options import entry_arguments
+
+NETLIST = """
+[simulation]
+pin = -30
+
+[rx_1]
+  [rx_1.1]
+  type = "lna"
+  name = "lna"
+  gain = 15
+  nf = 2
+  [rx_1.2]
+  type = "passive"
+  gain = -3
+  [rx_1.3]
+  type = "lpf"
+  fc = 10
+  order = 3
+
+[rx_2]
+  [rx_2.1]
+  type = "amp"
+  gain = 10
+
+[rx_3]
+  [rx_3.1]
+  type = "lna"
+  gain = 20
+  iip3 = -10
+  [rx_3.2]
+  type = "mixer"
+  name = "mix"
+  gain = -7
+  lo = 1000
+  spur_pin = -10
+
+[rx_4]
+  [rx_4.1]
+  type = "amp"
+  gain = 20
+  nf = 3
+  [rx_4.2]
+  type = "detector"
+  mds = -60
+  smax = 0
+
+[rx_5]
+  [rx_5.1]
+  type = "amp"
+  gain = 10
+  p1db = 10
+  compression = "rapp"
+  am_pm = 2
+"""
+
+
+class TestCommands(unittest.TestCase):
+    """Object to test the command session and batch runs."""
+
+    def setUp(self):
+        """Set up a netlist file, an empty cache and a session."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.file_name = self.path("netlist.toml")
+        with open(self.file_name, "w") as netlist_file:
+            netlist_file.write(NETLIST)
+        patcher = mock.patch.dict(os.environ, {cache.CACHE_ENV: self.path("cache")})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.lines = []
+        self.session = commands.Session(output=self.lines.append)
+
+    def path(self, name):
+        """Get a path in the temporary directory."""
+        return os.path.join(self.tmp.name, name)
+
+    def test_execute(self):
+        """Test running command lines on a session."""
+        self.assertFalse(self.session.execute("cascade --name rx_1"))
+        self.assertIn("Please run netlister first.", self.lines)
+        self.assertTrue(self.session.execute(f"netlist {self.file_name} --no-cache"))
+        self.assertNotIn("Netlist cache miss.", self.lines)
+        self.assertTrue(self.session.execute(f"netlist {self.file_name}"))
+        self.assertTrue(self.session.execute(f"netlist {self.file_name}"))
+        self.assertListEqual(
+            self.lines[-2:], ["Netlist cache miss.", "Netlist cache hit."]
+        )
+        self.assertTrue(self.session.execute("  # comment only"))
+        self.assertTrue(self.session.execute("cascade --name rx_1 --pin -20"))
+        self.assertIn("pin             -20.0           ", self.lines)
+        self.assertTrue(self.session.execute("show_systems"))
+        self.assertFalse(self.session.execute("cascade --name foo"))
+        self.assertIn("foo not found in system list.", self.lines)
+        self.assertFalse(self.session.execute("foo --bar"))
+        with mock.patch("sys.stderr"):
+            self.assertFalse(self.session.execute("cascade --pin abc"))
+
+    def test_run_script(self):
+        """Test script files stop at the first failing command."""
+        script = self.path("script.rf")
+        save = self.path("rx_2.csv")
+        open(save, "w").close()
+        with open(script, "w") as script_file:
+            script_file.write(
+                f"netlist {self.file_name}\n"
+                "\n"
+                "cascade --name rx_1 --no-output\n"
+                f"cascade --name rx_2 --no-output --save {save}\n"
+            )
+        self.assertTrue(self.session.run_script(script))
+        with open(save) as results_file:
+            self.assertIn("pin,-30", results_file.read())
+        with open(script, "a") as script_file:
+            script_file.write("cascade --name foo\ncascade --name rx_1\n")
+        self.lines.clear()
+        self.assertFalse(self.session.run_script(script))
+        self.assertIn(f"{script}:5: command failed: cascade --name foo", self.lines)
+        self.assertNotIn("Total Results", self.lines)
+        self.assertFalse(self.session.run_script(self.path("missing.rf")))
+
+    def test_run(self):
+        """Test exit codes of the run entry point."""
+        parser = entry_arguments()
+        args = parser.parse_args(
+            ["run", self.file_name, "--cascade", "rx_*", "--no-output"]
+        )
+        self.assertEqual(args.name, "rx_*")
+        self.assertFalse(args.no_cache)
+        for line in [["--no-cache", "run", "foo"], ["run", "foo", "--no-cache"]]:
+            self.assertTrue(parser.parse_args(line).no_cache)
+        with mock.patch("builtins.print") as printed:
+            self.assertEqual(commands.run(args), 0)
+            self.assertNotIn(mock.call("Netlist cache miss."), printed.mock_calls)
+            args = parser.parse_args(["run", self.file_name, "--cascade", "foo"])
+            self.assertEqual(commands.run(args), 1)
+            args = parser.parse_args(["run", self.path("missing.toml")])
+            self.assertEqual(commands.run(args), 1)
+            args = parser.parse_args(["run", self.file_name, "--script", "missing"])
+            self.assertEqual(commands.run(args), 1)
+
+    def test_cascade_many_directory(self):
+        """Test every chain is saved to its own file while streaming."""
+        self.session.execute(f"netlist {self.file_name} --no-cache")
+        self.assertTrue(
+            self.session.execute(f"cascade --name rx_* --save {self.tmp.name}")
+        )
+        self.assertIn("System          rx_2            ", self.lines)
+        for name in ["rx_1", "rx_2"]:
+            save_file = self.path(f"rf_cascade_results_{name}.csv")
+            with open(save_file) as results_file:
+                self.assertIn("pin,-30", results_file.read())
+
+    def test_frequency(self):
+        """Test the frequency response command."""
+        self.session.execute(f"netlist {self.file_name} --no-cache")
+        save = self.path("frequency.rfcol")
+        open(save, "w").close()
+        self.assertTrue(
+            self.session.execute(
+                f"frequency --name rx_1 --start 1 --stop 100 --points 5 "
+                f"--format columns --save {save}"
+            )
+        )
+        self.assertTrue(self.lines[1].startswith("1.0             12.0            "))
+        self.assertFalse(self.session.execute("frequency --name rx_1 --start 1"))
+        self.assertIn("Both --start and --stop frequencies required.", self.lines)
+        self.assertFalse(
+            self.session.execute("frequency --name rx_1 --start 0 --stop 1 --log")
+        )
+
+    def test_cascade_enbw(self):
+        """Test cascade analysis with the equivalent noise bandwidth."""
+        self.session.execute(f"netlist {self.file_name} --no-cache")
+        self.assertTrue(self.session.execute("cascade --name rx_1 --enbw"))
+        self.assertIn("Equivalent noise bandwidth: 1.0472e+07 Hz", self.lines)
+        self.assertFalse(self.session.execute("cascade --name rx_2 --enbw"))
+        self.assertIn("rx_2 has no blocks limiting its bandwidth.", self.lines)
+        self.assertFalse(self.session.execute("cascade --all --enbw"))
+
+    def test_intermod(self):
+        """Test the multi-tone intermodulation command."""
+        self.session.execute(f"netlist {self.file_name} --no-cache")
+        self.assertTrue(
+            self.session.execute(
+                "intermod --name rx_3 --tones 100 110 --pin -40 --sample-rate 1024 "
+                "--chunk-size 1024 --samples 4096"
+            )
+        )
+        self.assertIn("iip3            -10.01          -10.0           ", self.lines)
+        self.assertFalse(
+            self.session.execute("intermod --name rx_3 --tones 100 100.01")
+        )
+        self.assertIn(
+            "Tones must be at least 0.0610413 MHz apart and away from 0 and 500.05 MHz.",
+            self.lines,
+        )
+        self.assertFalse(
+            self.session.execute("intermod --name rx_3 --tones 100 --sample-rate 150")
+        )
+        self.assertIn("--sample-rate must be above twice the highest tone.", self.lines)
+
+    def test_montecarlo(self):
+        """Test the Monte Carlo command rejects empty runs and chunks."""
+        self.session.execute(f"netlist {self.file_name} --no-cache")
+        self.assertTrue(
+            self.session.execute("montecarlo --name rx_1 --samples 10 --no-output")
+        )
+        self.assertFalse(self.session.execute("montecarlo --name rx_1 --samples 0"))
+        self.assertIn("--samples must be positive.", self.lines)
+        self.assertFalse(self.session.execute("montecarlo --name rx_1 --chunk-size 0"))
+        self.assertIn("--chunk-size must be positive.", self.lines)
+
+    def test_waveform(self):
+        """Test passing a sample file through a system."""
+        self.session.execute(f"netlist {self.file_name} --no-cache")
+        np.save(self.path("in.npy"), np.full(1000, 1e-6))
+        self.assertTrue(
+            self.session.execute(
+                f"waveform --name rx_2 --input {self.path('in.npy')} "
+                f"--output {self.tmp.name} --sample-rate 10 --no-noise"
+            )
+        )
+        save = self.path("rf_waveform_rx_2.npy")
+        self.assertIn(f"Results saved to {save}", self.lines)
+        self.assertTrue(np.allclose(np.load(save), 10 ** 0.5 * 1e-6))
+        self.assertFalse(self.session.execute("waveform --name rx_2 --input nowhere"))
+        self.assertIn("A positive --sample-rate required.", self.lines)
+        self.assertIn("Output file required (--output).", self.lines)
+
+    def test_compression(self):
+        """Test the compression curve command."""
+        self.session.execute(f"netlist {self.file_name} --no-cache")
+        self.assertTrue(self.session.execute("compression --name rx_5 --pin-step 0.01"))
+        self.assertIn("P1dB In (dBm)   10.0            ", self.lines)
+        self.assertIn("P1dB Out (dBm)  19.0            ", self.lines)
+        self.assertIn("Cascade P1dB In (dBm)10.0            ", self.lines)
+        self.assertTrue(
+            self.session.execute(
+                "compression --name rx_5 --pin-start -10 --pin-stop 10 --no-output"
+            )
+        )
+        self.assertFalse(self.session.execute("compression --name rx_5 --pin-start 0"))
+        self.assertIn(
+            "Both --pin-start and --pin-stop required for a sweep.", self.lines
+        )
+
+    def test_sensitivity(self):
+        """Test the sensitivity analysis command."""
+        self.session.execute(f"netlist {self.file_name} --no-cache")
+        save = self.path("rf_sensitivity_results_rx_1.csv")
+        self.assertTrue(
+            self.session.execute(
+                f"sensitivity --name rx_1 --no-output --save {self.tmp.name}"
+            )
+        )
+        with open(save) as csv_file:
+            lines = csv_file.read().splitlines()
+        self.assertEqual(lines[2], "Block,Parameter,Gain,NF,IIP3,P1dB,SNR,SFDR")
+        self.assertTrue(lines[3].startswith("lna,gain,1.0,"))
+        self.assertEqual(len(lines), 15)
+        self.assertFalse(self.session.execute("sensitivity --name foo"))
+        self.assertIn("foo not found in system list.", self.lines)
+
+    def test_detector(self):
+        """Test the detector transfer curve command."""
+        self.session.execute(f"netlist {self.file_name} --no-cache")
+        save = self.path("rf_detector_results_rx_4.csv")
+        self.assertTrue(
+            self.session.execute(
+                "detector --name rx_4 --pin-start -100 --pin-stop 0 --bw 1e6 "
+                f"--no-output --save {self.tmp.name}"
+            )
+        )
+        with open(save) as csv_file:
+            lines = csv_file.read().splitlines()
+        self.assertEqual(lines[0], "Dynamic Range Low (dBm),-81.0")
+        self.assertEqual(lines[1], "Dynamic Range High (dBm),-19.0")
+        self.assertEqual(len(lines), 106)
+        self.assertFalse(self.session.execute("detector --name rx_2 --pin-start 0"))
+        self.assertIn("No detector found in rx_2.", self.lines)
+        self.assertIn("Both --pin-start and --pin-stop required.", self.lines)
+
+    def test_spurs(self):
+        """Test the mixer spur command."""
+        self.session.execute(f"netlist {self.file_name} --no-cache")
+        self.assertTrue(
+            self.session.execute(
+                "spurs --name rx_3 --rf-start 1500 --if-low 490 --if-high 510 "
+                "--order 3 --lo-stop 1010 --points 11"
+            )
+        )
+        self.assertIn(
+            "Spur Chart (dBc)m=0             m=1             m=2             m=3             ",
+            self.lines,
+        )
+        self.assertTrue(
+            any(
+                line.startswith("1000.0          1500.0          2")
+                for line in self.lines
+            )
+        )
+        self.assertFalse(self.session.execute("spurs --name rx_3 --block lna"))
+        self.assertIn("Mixer lna not found in rx_3.", self.lines)
+        self.assertFalse(self.session.execute("spurs --name rx_2 --rf-start 1"))
+        self.assertIn("No mixer found in rx_2.", self.lines)
+        self.assertFalse(self.session.execute("spurs --name rx_3 --block 2"))
+        self.assertIn("RF frequency required (--rf-start).", self.lines)
@@ -13,3 +13,15 @@ class TestAmplifier(unittest.TestCase):
         amp = Amplifier()
         self.assertEqual(amp.f3db, math.inf)
         self.assertEqual(amp.fbw, math.inf)
+
+    def test_response(self):
+        """Test the amplifier poles shape the frequency response."""
+        amp = Amplifier(gain=20, f3db=100, fbw=1000)
+        response = amp.response([0, 100, 1e6])
+        self.assertAlmostEqual(response[0], 10)
+        self.assertAlmostEqual(abs(response[1]), 10 / math.sqrt(2), places=1)
+        self.assertLess(abs(response[2]), 1e-2)
+        revision = amp.revision
+        amp.f3db = 200
+        self.assertGreater(amp.revision, revision)
+        self.assertAlmostEqual(Amplifier(gain=6).response([1e9])[0], 10 ** 0.3)
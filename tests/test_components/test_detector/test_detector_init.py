@@ -1,7 +1,8 @@
 """Test for VGA class."""
 import unittest
+import numpy as np
 from rfdesigner.components import RFSignal
-from rfdesigner.components.detector import Detector
+from rfdesigner.components.detector import LAW_UNIT_MAP, Detector
 
 
 class TestDetector(unittest.TestCase):
@@ -85,3 +86,17 @@ class TestDetector(unittest.TestCase):
         # Power > Drange
         pin = RFSignal(20, units="V")
         self.assertEqual(round(det.output(pin=pin).V, 2), 100)
+
+    def test_detector_transfer(self):
+        """Check that the vectorized transfer matches the output of every law."""
+        pins = [-30, -11, 5, 11, 20]
+        for law, mds, smax in [
+            ("log", -10, 10),
+            ("square", 1e-5, 1e-2),
+            ("rms", 0.01, 0.5),
+        ]:
+            det = Detector(gain=10, mds=mds, smax=smax, law=law)
+            reading = det.transfer(np.array(pins, dtype=float))
+            self.assertEqual(reading.units, LAW_UNIT_MAP[law])
+            expected = [det.output(pin=pin) for pin in pins]
+            self.assertTrue(np.allclose(reading.dBm.values, expected))
@@ -0,0 +1,87 @@
+"""Test class for the filters."""
+
+import math
+import unittest
+import numpy as np
+from rfdesigner.components.filter import LPF, HPF, BPF, design
+
+
+def gain_db(block, freqs):
+    """Get the gain of a block in dB at each frequency."""
+    return 20 * np.log10(np.abs(block.response(freqs)))
+
+
+class TestFilter(unittest.TestCase):
+    """Test the filter classes."""
+
+    def test_flat_default(self):
+        """Test filters without a cutoff behave like a flat passive."""
+        for block in [LPF(gain=-2), HPF(gain=-2), BPF(gain=-2, fc=100)]:
+            self.assertFalse(block.shaped)
+            self.assertTrue(np.allclose(gain_db(block, [1, 1e3]), -2))
+            self.assertListEqual(block.corner_frequencies(), [])
+
+    def test_lowpass_prototypes(self):
+        """Test the passband edge and stopband of each prototype."""
+        butter = LPF(fc=10, order=4, gain=-1)
+        self.assertAlmostEqual(gain_db(butter, [0])[0], -1)
+        self.assertAlmostEqual(gain_db(butter, [10])[0], -1 - 3.0103, places=3)
+        self.assertAlmostEqual(gain_db(butter, [100])[0], -81, places=1)
+        cheby = LPF(fc=10, order=4, prototype="Cheby1", ripple=1)
+        passband = gain_db(cheby, np.linspace(0, 10, 1001))
+        self.assertAlmostEqual(passband.min(), -1, places=6)
+        self.assertAlmostEqual(passband.max(), 0, places=4)
+        ellip = LPF(fc=10, order=5, prototype="ellip", ripple=0.5, attenuation=50)
+        self.assertAlmostEqual(gain_db(ellip, [10])[0], -0.5, places=6)
+        self.assertLessEqual(gain_db(ellip, np.linspace(15, 1e4, 10001)).max(), -50)
+        self.assertEqual(LPF(prototype="foo").prototype, "butter")
+
+    def test_highpass_bandpass(self):
+        """Test the highpass and bandpass transformations."""
+        hpf = HPF(fc=10, order=3)
+        self.assertAlmostEqual(gain_db(hpf, [10])[0], -3.0103, places=3)
+        self.assertLess(gain_db(hpf, [1])[0], -59)
+        self.assertEqual(abs(hpf.response([0])[0]), 0)
+        bpf = BPF(fc=100, bandwidth=20, order=3, prototype="cheby1", ripple=0.5)
+        low, high = bpf.corner_frequencies()
+        self.assertAlmostEqual(high - low, 20)
+        self.assertAlmostEqual(low * high, 100 ** 2)
+        edges = gain_db(bpf, [low, 100, high])
+        self.assertTrue(np.allclose(edges, [-0.5, 0, -0.5], atol=1e-6))
+        self.assertTrue(np.all(gain_db(bpf, [10, 1000]) < -50))
+
+    def test_response_cache(self):
+        """Test responses are cached per parameter set and grid."""
+        freqs = np.linspace(0, 100, 101)
+        lpf = LPF(fc=10, order=5)
+        response = lpf.response(freqs)
+        self.assertFalse(response.flags.writeable)
+        self.assertIs(LPF(fc=10, order=5).response(freqs.copy()), response)
+        revision = lpf.revision
+        lpf.order = 3
+        self.assertGreater(lpf.revision, revision)
+        self.assertIsNot(lpf.response(freqs), response)
+        lpf.gain = -1
+        self.assertAlmostEqual(gain_db(lpf, [0])[0], -1)
+
+
+class TestDesign(unittest.TestCase):
+    """Test the filter design functions."""
+
+    def test_elliptic_functions(self):
+        """Test elliptic integrals and functions against known values."""
+        self.assertAlmostEqual(design.ellipk(0), math.pi / 2)
+        self.assertAlmostEqual(design.ellipk(math.sqrt(0.5)), 1.8540746773013719)
+        u = np.array([0.1, 0.4 + 0.2j])
+        self.assertTrue(np.allclose(design.acde(design.cde(u, 0.7), 0.7), u))
+        self.assertTrue(np.allclose(design.asne(design.sne(u, 0.7), 0.7), u))
+
+    def test_prototype_cache(self):
+        """Test prototypes are designed once per parameter set."""
+        design.lowpass_prototype.cache_clear()
+        zeros, poles, gain = design.lowpass_prototype("butter", 2)
+        self.assertEqual(zeros, ())
+        self.assertAlmostEqual(gain, 1)
+        self.assertTrue(np.allclose(sorted(np.abs(poles)), [1, 1]))
+        design.lowpass_prototype("butter", 2)
+        self.assertEqual(design.lowpass_prototype.cache_info().hits, 1)
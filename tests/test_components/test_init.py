@@ -1,8 +1,11 @@
 """Test components.__init__ file."""
 
+import gc
 import math
+import pickle
 import unittest
-from rfdesigner.components import RFSignal, Generic
+import numpy as np
+from rfdesigner.components import RFSignal, RFSignalArray, Generic, ProcessState
 
 
 class TestRFSignalClass(unittest.TestCase):
@@ -75,6 +78,101 @@ class TestRFSignalClass(unittest.TestCase):
         self.assertEqual(my_var.V, math.sqrt(5e-3))
         self.assertEqual(my_var.A, math.sqrt(2e-6))
 
+    def test_conversion_units(self):
+        """Test that converted values are tagged with the new units."""
+        my_var = RFSignal(-10, units="dBm")
+        for prop in ["dBm", "dBW", "dBV", "dBA", "W", "V", "A"]:
+            self.assertEqual(getattr(my_var, prop).units, prop)
+        self.assertEqual(my_var.Vgain.units, "V")
+        self.assertAlmostEqual(my_var.W.dBm, -10)
+        self.assertAlmostEqual(my_var.V.dBm, -10)
+
+    def test_cached_conversions(self):
+        """Test that conversions are cached until the units change."""
+        my_var = RFSignal(1, units="W")
+        self.assertIs(my_var.dBm, my_var.dBm)
+        self.assertEqual(my_var.dBm, 30)
+        my_var.units = "dBm"
+        self.assertEqual(my_var.dBm, 1)
+        self.assertAlmostEqual(my_var.W, 10 ** (1 / 10 - 3))
+
+    def test_same_units_not_cached(self):
+        """Test that reading the own units does not make a reference cycle."""
+        my_var = RFSignal(3, units="dBm")
+        self.assertIs(my_var.dBm, my_var)
+        self.assertNotIn(my_var, gc.get_referents(my_var))
+        volts = RFSignal(1, units="V")
+        self.assertIs(volts.Vgain, volts)
+        self.assertNotIn(volts, gc.get_referents(volts))
+
+    def test_slots(self):
+        """Test that signals do not carry an instance dictionary."""
+        my_var = RFSignal(1)
+        self.assertFalse(hasattr(my_var, "__dict__"))
+        with self.assertRaises(AttributeError):
+            my_var.foo = 1
+
+    def test_pickle(self):
+        """Test that units survive pickling."""
+        my_var = RFSignal(-10, units="dBW")
+        my_var.W
+        result = pickle.loads(pickle.dumps(my_var))
+        self.assertEqual(result, -10)
+        self.assertEqual(result.units, "dBW")
+        self.assertEqual(result.W, 0.1)
+
+
+class TestRFSignalArrayClass(unittest.TestCase):
+    """Test the RFSignalArray type."""
+
+    def test_default_units(self):
+        """Test to check correct default units."""
+        my_var = RFSignalArray([1, 2])
+        self.assertEqual(my_var.units, "dBm")
+        my_var = RFSignalArray([1, 2], units="bad-option")
+        self.assertEqual(my_var.units, "dBm")
+
+    def test_no_unit_change(self):
+        """Test that units are carried through math and slicing."""
+        my_var = RFSignalArray([1, 2, 3], units="W")
+        self.assertEqual((my_var * 2).units, "W")
+        self.assertEqual((my_var + 1).__class__, RFSignalArray)
+        self.assertEqual(my_var[1:].units, "W")
+        self.assertListEqual((my_var - 1).tolist(), [0, 1, 2])
+
+    def test_element_is_rfsignal(self):
+        """Test that single elements are returned as RFSignal."""
+        my_var = RFSignalArray([1, 2], units="V")
+        self.assertEqual(my_var[1].__class__, RFSignal)
+        self.assertEqual(my_var[1].units, "V")
+        self.assertEqual(my_var[1], 2)
+
+    def test_matches_rfsignal(self):
+        """Test that conversions match the scalar RFSignal type."""
+        values = [0.01, 0.5, 1, 3.0]
+        for units in ["dBm", "dBW", "dBV", "dBA", "W", "V", "A"]:
+            array = RFSignalArray(values, units=units)
+            for prop in ["dBm", "dBW", "dBV", "dBA", "W", "V", "A", "Vgain"]:
+                converted = getattr(array, prop)
+                for index, value in enumerate(values):
+                    expected = getattr(RFSignal(value, units=units), prop)
+                    self.assertAlmostEqual(converted.values[index], expected)
+
+    def test_conversion_units(self):
+        """Test that converted arrays are tagged with the new units."""
+        my_var = RFSignalArray([0, -10], units="dBm")
+        self.assertEqual(my_var.W.units, "W")
+        self.assertListEqual(my_var.W.values.tolist(), [0.001, 1e-4])
+        self.assertListEqual(my_var.W.dBm.values.tolist(), [0, -10])
+        self.assertEqual(my_var.Vgain.units, "V")
+
+    def test_pickle(self):
+        """Test that units survive pickling."""
+        my_var = RFSignalArray([1, 2], units="A")
+        result = pickle.loads(pickle.dumps(my_var))
+        self.assertEqual(result.units, "A")
+        self.assertListEqual(result.tolist(), [1, 2])
+
 
 class TestGeneric(unittest.TestCase):
     """Test the generic RF class."""
@@ -129,3 +227,127 @@ class TestGeneric(unittest.TestCase):
         self.assertFalse(rf.is_compressed)
         self.assertEqual(rf.output(pin=20), 19)
         self.assertTrue(rf.is_compressed)
+
+    def test_output_array(self):
+        """Test vectorized output function."""
+        rf = Generic(gain=10, p1db=10)
+        pout, compressed = rf.output_array([1, 20])
+        self.assertListEqual(pout.tolist(), [11, 19])
+        self.assertEqual(pout.units, "dBm")
+        self.assertListEqual(compressed.tolist(), [False, True])
+        pout, _ = rf.output_array(RFSignalArray([0.001], units="W"))
+        self.assertListEqual(pout.tolist(), [10])
+        self.assertFalse(rf.output(pin=1) == 19)
+        self.assertFalse(rf.is_compressed)
+
+    def test_compression_models(self):
+        """Test every model is compressed by 1dB at the input p1db."""
+        pin = np.array([-60, 10, 30.0])
+        for model in ["hard", "rapp", "tanh", "polynomial"]:
+            rf = Generic(gain=10, p1db=10, iip3=19.6, compression=model)
+            pout, phase, compressed = rf.compress(pin)
+            self.assertAlmostEqual(pout[0], -50, places=3)
+            self.assertAlmostEqual(pout[1], 19)
+            # Outputs saturate a few dB above the output 1dB compression point
+            self.assertLess(pout[2], 25)
+            self.assertListEqual(compressed.tolist(), [False, True, True])
+            self.assertListEqual(phase.tolist(), [0, 0, 0])
+            self.assertEqual(rf.output(pin=10), pout[1])
+            self.assertTrue(rf.is_compressed)
+        with self.assertRaisesRegex(ValueError, "hard, rapp, tanh, polynomial"):
+            Generic(compression="foo")
+        rf = Generic(compression="Rapp")
+        self.assertEqual(rf.compression, "rapp")
+        with self.assertRaises(ValueError):
+            rf.compression = "foo"
+        self.assertEqual(rf.compression, "rapp")
+        ratio = Generic(gain=10, p1db=10).gain_ratio([0, 10])
+        self.assertAlmostEqual(ratio[1], 10 ** (-1 / 20))
+        rf = Generic(gain=10, compression="tanh")
+        self.assertListEqual(rf.compress([40])[0].tolist(), [50])
+
+    def test_compression_smoothness(self):
+        """Test a smooth rapp knee compresses earlier than a sharp one."""
+        soft = Generic(gain=10, p1db=10, compression="rapp", smoothness=1)
+        sharp = Generic(gain=10, p1db=10, compression="rapp", smoothness=10)
+        self.assertLess(soft.compress([5])[0][0], sharp.compress([5])[0][0])
+        self.assertAlmostEqual(sharp.compress([10])[0][0], 19)
+
+    def test_compression_am_pm(self):
+        """Test the phase shift grows with compression and is am_pm at 1dB."""
+        rf = Generic(gain=10, p1db=10, compression="rapp", am_pm=5)
+        _, phase, _ = rf.compress([-60, 0, 10, 20])
+        self.assertAlmostEqual(phase[0], 0, places=6)
+        self.assertAlmostEqual(phase[2], 5)
+        self.assertTrue(np.all(np.diff(phase) > 0))
+        _, phase, _ = Generic(gain=10, p1db=10, am_pm=5).compress([-10, 20])
+        self.assertEqual(phase[0], 0)
+        self.assertGreater(phase[1], 5)
+
+    def test_polynomial_gain_ratio(self):
+        """Test the polynomial model never expands past its smallest gain."""
+        rf = Generic(gain=15, p1db=15, compression="polynomial")
+        self.assertGreater(rf.polynomial()[2], 0)
+        pout, _, _ = rf.compress(np.arange(-20, 40.0))
+        self.assertTrue(np.all(np.diff(pout) >= -1e-9))
+        self.assertAlmostEqual(pout[-1], pout[-10])
+
+    def test_tolerances(self):
+        """Test tolerance parsing."""
+        rf = Generic(gain=10, gain_sigma=0.5, nf_range=[1, 2])
+        self.assertTupleEqual(rf.tolerances["gain"], ("normal", 0.5))
+        self.assertTupleEqual(rf.tolerances["nf"], ("uniform", 1, 2))
+        self.assertNotIn("iip3", rf.tolerances)
+
+    def test_polynomial(self):
+        """Test the polynomial meets the IIP3 and the 1dB compression point."""
+        rf = Generic(gain=10, iip3=0, p1db=-7)
+        a1, a3, a5 = rf.polynomial()
+        self.assertAlmostEqual(a1, 10 ** 0.5)
+        self.assertAlmostEqual(math.sqrt(4 / 3 * abs(a1 / a3)), math.sqrt(2e-3))
+        amplitude = math.sqrt(2 * 10 ** ((-7 - 30) / 10))
+        fundamental = a1 * amplitude + 0.75 * a3 * amplitude ** 3
+        fundamental += 0.625 * a5 * amplitude ** 5
+        self.assertAlmostEqual(20 * math.log10(fundamental / amplitude), 9)
+        self.assertTupleEqual(Generic(gain=-3).polynomial()[1:], (0.0, 0.0))
+
+    def test_saturation_amplitude(self):
+        """Test the slope of the polynomial is zero at the saturation amplitude."""
+        rf = Generic(gain=10, iip3=0, p1db=-11)
+        a1, a3, a5 = rf.polynomial()
+        limit = rf.saturation_amplitude()
+        self.assertAlmostEqual(a1 + 3 * a3 * limit ** 2 + 5 * a5 * limit ** 4, 0)
+        limit = rf.saturation_amplitude(envelope=True)
+        self.assertAlmostEqual(a1 + 2.25 * a3 * limit ** 2 + 3.125 * a5 * limit ** 4, 0)
+        self.assertEqual(Generic(gain=3).saturation_amplitude(), math.inf)
+
+    def test_process(self):
+        """Test gain and compression of real and complex samples."""
+        rf = Generic(gain=10, iip3=0, p1db=-11)
+        amplitude = math.sqrt(2 * 10 ** ((-11 - 30) / 10))
+        samples = np.array([1e-6, amplitude, 1e3]) + 0j
+        out = rf.process(samples)
+        self.assertAlmostEqual(abs(out[0]) / 1e-6, 10 ** 0.5)
+        self.assertAlmostEqual(20 * math.log10(abs(out[1]) / amplitude), 9)
+        peak = rf.process([rf.saturation_amplitude(envelope=True) + 0j])
+        self.assertAlmostEqual(abs(out[2]), abs(peak[0]))
+        real = rf.process(np.array([-1e3, -1e-6, 1e-6]))
+        self.assertEqual(real.dtype, float)
+        self.assertAlmostEqual(real[2] / 1e-6, 10 ** 0.5)
+        self.assertEqual(real[0], -rf.process([rf.saturation_amplitude()])[0])
+        samples = np.ones(4, dtype=np.complex64)
+        self.assertIs(rf.process(samples, out=samples), samples)
+
+    def test_process_noise(self):
+        """Test the noise added by a block carries on between calls."""
+        rf = Generic(gain=10, nf=3)
+        state = ProcessState(100, seed=1)
+        out = np.concatenate(
+            [rf.process(np.zeros(1000, complex), state) for _ in range(200)]
+        )
+        power = np.mean(np.abs(out) ** 2) / 2
+        expected = rf.noise_power(100) * 10
+        self.assertAlmostEqual(power / expected, 1, places=1)
+        whole = rf.process(np.zeros(200000, complex), ProcessState(100, seed=1))
+        self.assertTrue(np.array_equal(out, whole))
+        self.assertEqual(Generic(gain=10, nf=0).noise_power(100), 0)
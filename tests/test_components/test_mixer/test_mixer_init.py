@@ -0,0 +1,27 @@
+"""Test class for the mixer."""
+
+import math
+import unittest
+from rfdesigner.components.mixer import Mixer
+
+
+class TestMixer(unittest.TestCase):
+    """Test the Mixer class."""
+
+    def test_defaults(self):
+        """Test the default spur parameters."""
+        mixer = Mixer(gain=-7)
+        self.assertTrue(math.isnan(mixer.lo))
+        self.assertEqual(mixer.spur_pin, -10)
+        self.assertEqual(mixer.spur_levels(1, -1), 0)
+
+    def test_spur_levels(self):
+        """Test the spur level estimate."""
+        mixer = Mixer(lo_rejection=10, rf_rejection=20, even_rejection=5, spur_pin=0)
+        levels = mixer.spur_levels([1, 3, 1, 2, 0], [1, 1, -3, -2, 1])
+        self.assertListEqual(levels.tolist(), [0, -20, -40, -40, -5])
+        # Third order RF products rise 2 dB per dB of drive
+        self.assertEqual(mixer.spur_levels(1, 3, pin=10), -20)
+        revision = mixer.revision
+        mixer.lo = 1000
+        self.assertGreater(mixer.revision, revision)
@@ -0,0 +1,33 @@
+"""Test the command line entry point."""
+import subprocess
+import sys
+import unittest
+
+CHECK_IMPORTS = """
+import sys
+from rfdesigner.__main__ import main
+sys.argv = ["rfdesigner"] + sys.argv[1:]
+try:
+    main()
+except SystemExit:
+    pass
+heavy = ["cmd2", "numpy", "toml", "rfdesigner.cli", "rfdesigner.components"]
+if sys.argv[1:] == ["--version"]:
+    heavy.append("rfdesigner.options")
+print(",".join(module for module in heavy if module in sys.modules))
+"""
+
+
+class TestMain(unittest.TestCase):
+    """Object to test the command line entry point."""
+
+    def test_informational_flags_stay_light(self):
+        """Test informational flags do not import heavy modules."""
+        for flags in [["--version"], ["--implemented"], ["--help"]]:
+            output = subprocess.run(
+                [sys.executable, "-c", CHECK_IMPORTS] + flags,
+                stdout=subprocess.PIPE,
+                check=True,
+                universal_newlines=True,
+            ).stdout
+            self.assertEqual(output.splitlines()[-1], "", flags)
@@ -1,6 +1,11 @@
 """Test netlist utility."""
+import io
+import os
+import tempfile
 import unittest
+from contextlib import redirect_stdout
 from unittest import mock
+import numpy as np
 import toml
 from rfdesigner import netlist
 from rfdesigner.components import Generic, Passive
@@ -18,6 +23,8 @@ class TestNetlist(unittest.TestCase):
         self.assertFalse(netlist.validate_signal_chain(name, system))
         system = {"1": {"type": "foobar"}}
         self.assertFalse(netlist.validate_signal_chain(name, system))
+        system = {"1": {"type": "generic", "compression": "foobar"}}
+        self.assertFalse(netlist.validate_signal_chain(name, system))
 
     def test_validate_signal_chain_ok(self):
         """Test the validate signal chain method with good data."""
@@ -33,6 +40,30 @@ class TestNetlist(unittest.TestCase):
         self.assertEqual(chain.system[0].__class__, Generic)
         self.assertEqual(chain.system[1].__class__, Passive)
 
+    def test_signal_chain_stream(self):
+        """Test streaming samples through a SignalChain."""
+        system = {"1": {"type": "generic", "gain": 20}, "2": {"type": "passive"}}
+        chain = netlist.SignalChain("foobar", system)
+        chunks = [np.ones(3), np.ones(2)]
+        out = list(chain.stream(chunks, sample_rate=10, noise=False))
+        self.assertListEqual([len(chunk) for chunk in out], [3, 2])
+        self.assertAlmostEqual(out[1][0], 10)
+
+    def test_design_space_class(self):
+        """Test the DesignSpace class."""
+        system = {
+            "2": {"type": "passive"},
+            "1": [{"type": "generic", "gain": 10}, {"type": "generic", "gain": 20}],
+        }
+        self.assertTrue(netlist.validate_signal_chain("foobar", system))
+        space = netlist.DesignSpace("foobar", system)
+        self.assertEqual(space.name, "foobar")
+        self.assertListEqual([len(slot) for slot in space.slots], [2, 1])
+        self.assertEqual(space.slots[0][1].gain, 20)
+        self.assertEqual(space.system[1].__class__, Passive)
+        system["1"].append({"type": "foobar"})
+        self.assertFalse(netlist.validate_signal_chain("foobar", system))
+
     def test_parse_netlist_missing_file(self):
         """Test netlist parsing failure on missing file."""
         self.assertEqual(netlist.parse_netlist("/foo/bar"), None)
@@ -42,3 +73,40 @@ class TestNetlist(unittest.TestCase):
         """Test empty dict on bad toml data."""
         toml_data = ""
         self.assertEqual(netlist.parse_netlist(toml_data), None)
+
+    def test_system_registry(self):
+        """Test systems are only parsed and built on access."""
+        netlist_text = (
+            'rx = {1 = {type = "generic", gain = 3}}\n'
+            "[simulation]\npin = -20\n"
+            '[chain]\n  [chain.1]\n  type = "lna"\n  gain = 10\n'
+            '[bad.1]\ntype = "foobar"\n'
+            '["quoted name".1]\ntype = "passive"\n'
+            'tags = [\n["a"],\n]\n'
+            '[[space.1]]\ntype = "amp"\n[[space.1]]\ntype = "amp"\n'
+            '[chain.2]\ntype = "passive"\ngain = -3\n'
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            file_name = os.path.join(tmp, "netlist.toml")
+            with open(file_name, "w") as netlist_file:
+                netlist_file.write(netlist_text)
+            systems = netlist.parse_netlist(file_name, use_cache=False, lazy=True)
+            self.assertIsInstance(systems, netlist.SystemRegistry)
+            self.assertListEqual(
+                list(systems), ["rx", "sim", "chain", "bad", "quoted name", "space"]
+            )
+            self.assertFalse(systems.is_loaded("chain"))
+            self.assertEqual(systems["sim"]["pin"], -20)
+            chain = systems["chain"]
+            self.assertTrue(systems.is_loaded("chain"))
+            self.assertFalse(systems.is_loaded("space"))
+            self.assertIs(systems["chain"], chain)
+            self.assertListEqual([block.gain for block in chain.system], [10, -3])
+            self.assertEqual(systems["rx"].system[0].gain, 3)
+            self.assertEqual(len(systems["space"].slots[0]), 2)
+            self.assertEqual(systems["quoted name"].system[0].__class__, Passive)
+            with redirect_stdout(io.StringIO()) as output:
+                self.assertNotIn("bad", systems)
+            self.assertIn("foobar", output.getvalue())
+            with self.assertRaises(KeyError):
+                systems["bad"]
@@ -0,0 +1,31 @@
+"""Test the block type registry."""
+import unittest
+from rfdesigner.components.amplifier import LNA, PowerAmp
+from rfdesigner.registry import BLOCK_PATHS, IMPLEMENTED_BLOCKS, BlockRegistry
+
+
+class TestRegistry(unittest.TestCase):
+    """Object to test the block type registry."""
+
+    def test_lookup(self):
+        """Test block types map to their component classes."""
+        self.assertIs(IMPLEMENTED_BLOCKS["lna"], LNA)
+        self.assertIs(IMPLEMENTED_BLOCKS["pa"], PowerAmp)
+        self.assertListEqual(list(IMPLEMENTED_BLOCKS), list(BLOCK_PATHS))
+        self.assertEqual(len(IMPLEMENTED_BLOCKS), len(BLOCK_PATHS))
+        with self.assertRaises(KeyError):
+            IMPLEMENTED_BLOCKS["foobar"]
+
+    def test_every_block_importable(self):
+        """Test every registered class exists and is named after a block type."""
+        for name in IMPLEMENTED_BLOCKS:
+            block_type = IMPLEMENTED_BLOCKS[name]
+            self.assertIn(block_type.__name__.lower(), IMPLEMENTED_BLOCKS)
+
+    def test_contains_without_import(self):
+        """Test membership checks do not import component modules."""
+        registry = BlockRegistry({"foo": ("rfdesigner.does_not_exist", "Foo")})
+        self.assertIn("foo", registry)
+        self.assertNotIn("bar", registry)
+        with self.assertRaises(ImportError):
+            registry["foo"]
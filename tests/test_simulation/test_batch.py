@@ -0,0 +1,69 @@
+"""Test module for batch cascade methods."""
+import math
+import unittest
+import numpy as np
+import rfdesigner.simulation.cascade as sim
+from rfdesigner.simulation import batch
+from rfdesigner.components import Generic
+
+
+class TestBatch(unittest.TestCase):
+    """Object to test batch cascade methods."""
+
+    def setUp(self):
+        """Set up batch testing."""
+        self.systems = [
+            [
+                Generic(gain=15, nf=3, p1db=10, iip3=20),
+                Generic(gain=10, nf=6, p1db=12, iip3=30),
+            ],
+            [
+                Generic(gain=-3, nf=3),
+                Generic(gain=20, nf=2, p1db=5, iip3=15),
+                Generic(gain=12, nf=8, p1db=18, iip3=25),
+            ],
+            [Generic(gain=5)],
+        ]
+
+    def test_pack_systems(self):
+        """Test packing ragged systems into padded arrays."""
+        arrays = batch.pack_systems(self.systems)
+        self.assertEqual(arrays["gain"].shape, (3, 3))
+        self.assertListEqual(arrays["mask"][2].tolist(), [True, False, False])
+        self.assertEqual(arrays["gain"][1, 2], 12)
+        self.assertEqual(arrays["iip3"][0, 2], math.inf)
+
+    def test_matches_cascade_run(self):
+        """Test that batch results match the scalar cascade engine."""
+        results = batch.run_systems(self.systems, pin=-60, bandwidth=10)
+        for row, system in enumerate(self.systems):
+            expected = sim.run(system, pin=-60, bandwidth=10)
+            for key in ["gain", "nf", "iip3", "oip3", "p1db", "pout", "snr", "sfdr"]:
+                self.assertAlmostEqual(results[key][row], expected[key], places=9)
+            for col, block in enumerate(system):
+                self.assertEqual(results["total_nf"][row, col], block.total_nf)
+                self.assertEqual(results["total_iip3"][row, col], block.total_iip3)
+                self.assertEqual(results["total_p1db"][row, col], block.total_p1db)
+                self.assertAlmostEqual(
+                    results["total_gain"][row, col], block.total_gain, places=9
+                )
+
+    def test_padded_stages_are_nan(self):
+        """Test that padded stages report NaN cumulative values."""
+        results = batch.run_systems(self.systems)
+        self.assertTrue(np.isnan(results["total_nf"][2, 1:]).all())
+        self.assertTrue(np.isnan(results["total_gain"][0, 2]))
+        self.assertEqual(results["gain"][2], 5)
+        arrays = batch.pack_systems(self.systems)
+        results = batch.cascade(decimals=None, **arrays)
+        self.assertEqual(results["gain"][2], 5)
+
+    def test_no_rounding(self):
+        """Test that rounding can be disabled."""
+        results = batch.cascade([[15, 10]], [[3, 6]], [[20, 30]], [[10, 12]])
+        self.assertEqual(results["nf"][0], 3.20)
+        results = batch.cascade(
+            [[15, 10]], [[3, 6]], [[20, 30]], [[10, 12]], decimals=None
+        )
+        self.assertNotEqual(results["nf"][0], 3.20)
+        self.assertAlmostEqual(results["nf"][0], 3.20, places=2)
@@ -70,3 +70,9 @@ class TestCascade(unittest.TestCase):
         self.assertEqual(results["nf"], self.expected_nf)
         self.assertEqual(results["iip3"], self.expected_iip3)
         self.assertEqual(results["oip3"], self.expected_iip3 + self.expected_gain)
+
+    def test_cascade_compressed_pout(self):
+        """Test that reported output power includes compression."""
+        results = sim.run(self.system, pin=20)
+        self.assertEqual(results["pout"], 21)
+        self.assertTrue(self.system[-1].is_compressed)
@@ -0,0 +1,75 @@
+"""Test module for the binary column result format."""
+import os
+import tempfile
+import unittest
+import numpy as np
+from rfdesigner.simulation import columnar, results, sweep
+from rfdesigner.components import Generic
+
+
+class TestColumnar(unittest.TestCase):
+    """Object to test column files."""
+
+    def setUp(self):
+        """Set up a temporary directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.file_name = os.path.join(self.tmp.name, "results.rfcol")
+
+    def test_save_read(self):
+        """Test columns round trip and are read lazily."""
+        columns = {
+            "pin": np.arange(1000, dtype=np.float32),
+            "stage": np.arange(3000.0).reshape(1000, 3),
+            "flag": np.arange(1000) % 2 == 0,
+        }
+        columnar.save(self.file_name, columns, attrs={"names": ["a", "b", "c"]})
+        store = columnar.ColumnFile(self.file_name)
+        self.assertEqual(len(store), 1000)
+        self.assertListEqual(store.columns, ["pin", "stage", "flag"])
+        self.assertDictEqual(store.attrs, {"names": ["a", "b", "c"]})
+        self.assertIsInstance(store["stage"], np.memmap)
+        self.assertEqual(store["stage"].shape, (1000, 3))
+        for name, values in columns.items():
+            np.testing.assert_array_equal(store[name], values)
+            self.assertEqual(store[name].dtype, values.dtype)
+        part = store.read(slice(10, 20), columns=["stage"])
+        self.assertListEqual(list(part), ["stage"])
+        np.testing.assert_array_equal(part["stage"], columns["stage"][10:20])
+        self.assertNotIsInstance(part["stage"], np.memmap)
+        with self.assertRaises(ValueError):
+            store["pin"][0] = 1
+
+    def test_create_write(self):
+        """Test filling a created file in chunks."""
+        store = columnar.create(self.file_name, {"x": ("float64", (2,))}, rows=5)
+        store.write(3, x=[[1, 2], [3, 4]])
+        store.flush()
+        values = columnar.ColumnFile(self.file_name).read()["x"]
+        self.assertListEqual(values.tolist(), [[0, 0]] * 3 + [[1, 2], [3, 4]])
+
+    def test_invalid(self):
+        """Test errors on bad files and columns."""
+        with open(self.file_name, "w") as bad_file:
+            bad_file.write("Pin (dBm),Pout (dBm)\n")
+        with self.assertRaises(ValueError):
+            columnar.ColumnFile(self.file_name)
+        with self.assertRaises(ValueError):
+            columnar.save(self.file_name, {"a": np.zeros(2), "b": np.zeros(3)})
+        columnar.save(self.file_name, {"a": np.zeros(0)})
+        self.assertEqual(len(columnar.ColumnFile(self.file_name).read()["a"]), 0)
+
+    def test_columns_sweep(self):
+        """Test sweep results as columns."""
+        system = [Generic(name="amp", gain=15, p1db=10), Generic(name="att", gain=-3)]
+        result = sweep.run(system, pin=[-60, 20])
+        columns, attrs = results.columns_sweep(system, result)
+        results.save_columns(self.file_name, columns, attrs)
+        store = columnar.ColumnFile(self.file_name)
+        self.assertListEqual(store["pin"].tolist(), [-60, 20])
+        self.assertEqual(store["stage_pout"].shape, (2, 2))
+        self.assertListEqual(store["compressed"][1].tolist(), [True, False])
+        self.assertListEqual(store.attrs["names"], ["amp", "att"])
+        self.assertEqual(store.attrs["gain"], 12)
+        self.assertNotIn("pout", store.columns)
+        self.assertEqual(store.attrs["sfdr"], result["sfdr"][0])
@@ -0,0 +1,83 @@
+"""Test module for AM-AM and AM-PM compression analysis."""
+import math
+import unittest
+import numpy as np
+from rfdesigner.chaintable import ChainTable
+from rfdesigner.components import Generic
+from rfdesigner.simulation import compression, results
+
+
+class TestCompression(unittest.TestCase):
+    """Object to test compression analysis methods."""
+
+    def setUp(self):
+        """Set up compression testing."""
+        self.system = [
+            Generic(gain=20, nf=2, p1db=10, compression="rapp"),
+            Generic(gain=-3),
+            Generic(gain=15, p1db=15, compression="tanh", am_pm=3),
+        ]
+
+    def test_curves(self):
+        """Test the curves chain every block over all input powers."""
+        pin = np.array([-80, -20, 0.0])
+        result = compression.curves(self.system, pin)
+        expected = pin
+        for block in self.system:
+            expected, _, _ = block.compress(expected)
+        self.assertTrue(np.array_equal(result["pout"], expected))
+        self.assertAlmostEqual(result["gain"][0], 32, places=4)
+        self.assertAlmostEqual(result["compression"][0], 0, places=4)
+        self.assertGreater(result["compression"][-1], 1)
+        self.assertGreater(result["phase"][-1], result["phase"][0])
+
+    def test_single_block(self):
+        """Test the hard and smooth models agree on the 1dB point of one block."""
+        for model in ["hard", "rapp", "tanh", "polynomial"]:
+            block = Generic(gain=10, p1db=10, iip3=19.6, compression=model)
+            result = compression.run([block], step=0.01)
+            self.assertAlmostEqual(result["p1db_in"], 10, places=3)
+            self.assertAlmostEqual(result["p1db_out"], 19, places=3)
+            self.assertEqual(result["estimate"], 10)
+
+    def test_run(self):
+        """Test the chain compresses before either block alone."""
+        result = compression.run(self.system)
+        self.assertEqual(compression.estimate_input_p1db(self.system), -2)
+        self.assertLess(result["p1db_in"], -2)
+        self.assertAlmostEqual(result["p1db_out"], result["p1db_in"] + 31)
+        self.assertEqual(result["pin"][0], -32)
+        # The cascade estimate is referred to the same input plane
+        self.assertEqual(result["estimate"], -2.27)
+        self.assertAlmostEqual(result["p1db_in"], result["estimate"], delta=0.5)
+        table = compression.run(ChainTable.from_blocks(self.system))
+        self.assertEqual(table["p1db_in"], result["p1db_in"])
+
+    def test_compression_point(self):
+        """Test the compression point is interpolated between sweep points."""
+        pin = np.arange(4.0)
+        self.assertEqual(compression.compression_point(pin, pin * 0.8), 1.25)
+        self.assertEqual(compression.compression_point(pin, pin + 1), 0)
+        self.assertTrue(math.isnan(compression.compression_point(pin, pin * 0)))
+
+    def test_large_curve(self):
+        """Test a million point curve is computed."""
+        pin = np.linspace(-60, 10, 1000000)
+        result = compression.run(self.system, pin)
+        self.assertEqual(result["pout"].shape, pin.shape)
+
+    def test_csv(self):
+        """Test compression results csv."""
+        result = compression.run(self.system, [-40, -30])
+        lines = list(results.iter_csv_compression(result))
+        self.assertEqual(lines[0], "P1dB In (dBm),nan")
+        self.assertEqual(
+            lines[4], "Pin (dBm),Pout (dBm),Gain (dB),Compression (dB),Phase (deg)"
+        )
+        self.assertTrue(lines[5].startswith("-40.0,-8.0"))
+        self.assertEqual(len(lines), 7)
+        self.assertEqual(compression.run([]), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Test module for design-space exploration."""
+import itertools
+import unittest
+import numpy as np
+from rfdesigner.simulation import batch, designspace, rfmath
+from rfdesigner.components import Generic
+
+
+class TestDesignSpace(unittest.TestCase):
+    """Object to test design-space exploration methods."""
+
+    def setUp(self):
+        """Set up design-space testing."""
+        rng = np.random.default_rng(0)
+        self.slots = []
+        for slot in range(4):
+            candidates = []
+            for _ in range(6):
+                if slot % 2:
+                    gain = -float(rng.integers(1, 6))
+                    candidates.append(Generic(gain=gain, nf=-gain))
+                    continue
+                candidates.append(
+                    Generic(
+                        gain=float(rng.integers(10, 25)),
+                        nf=float(rng.uniform(0.5, 5)),
+                        iip3=float(rng.uniform(-10, 20)),
+                        power=float(rng.uniform(0.01, 0.5)),
+                    )
+                )
+            self.slots.append(candidates)
+
+    def brute_force(self):
+        """Get the Pareto front by evaluating every combination."""
+        grid = np.array(list(itertools.product(range(6), repeat=len(self.slots))))
+        packed = [batch.pack_systems([candidates]) for candidates in self.slots]
+        arrays = {
+            prop: np.stack(
+                [packed[slot][prop][0][grid[:, slot]] for slot in range(4)], axis=1
+            )
+            for prop in ["gain", "nf", "iip3", "p1db"]
+        }
+        totals = batch.cascade(**arrays, decimals=None)
+        power = sum(
+            np.array([block.power for block in candidates])[grid[:, slot]]
+            for slot, candidates in enumerate(self.slots)
+        )
+        costs = np.stack([totals["nf"], -totals["iip3"], -totals["gain"], power], 1)
+        mask = rfmath.pareto_mask(costs)
+        return sorted(
+            zip(
+                np.round(totals["nf"][mask], 2),
+                np.round(totals["iip3"][mask], 2),
+                np.round(totals["gain"][mask], 2),
+            )
+        )
+
+    def test_exit_on_empty_design_space(self):
+        """Test that exploration returns empty list on empty design space."""
+        self.assertListEqual(designspace.run([]), [])
+        self.assertListEqual(designspace.run([self.slots[0], []]), [])
+
+    def test_prune_candidates(self):
+        """Test that only dominated candidates of a slot are removed."""
+        slots = [
+            [
+                Generic(gain=10, nf=2, iip3=0),
+                Generic(gain=10, nf=3, iip3=0),
+                Generic(gain=12, nf=3, iip3=0),
+            ],
+            [Generic(gain=10, nf=2), Generic(gain=12, nf=2), Generic(gain=12, nf=2)],
+        ]
+        kept = designspace.prune_candidates(designspace.pack_slots(slots))
+        self.assertListEqual(kept[0].tolist(), [0, 2])
+        self.assertListEqual(kept[1].tolist(), [1])
+
+    def test_matches_brute_force(self):
+        """Test that exploration finds the front of every combination."""
+        for chunk_size in [100000, 7]:
+            result = designspace.run(self.slots, chunk_size=chunk_size)
+            points = sorted((r["nf"], r["iip3"], r["gain"]) for r in result)
+            self.assertListEqual(points, self.brute_force())
+
+    def test_parts(self):
+        """Test that reported parts reproduce the reported results."""
+        for entry in designspace.run(self.slots):
+            chain = [self.slots[slot][part] for slot, part in enumerate(entry["parts"])]
+            totals = batch.cascade(**batch.pack_systems([chain]))
+            self.assertEqual(entry["nf"], totals["nf"][0])
+            self.assertEqual(entry["gain"], totals["gain"][0])
+            power = sum(block.power for block in chain)
+            self.assertAlmostEqual(entry["power"], power, places=3)
+
+    def test_explore_progress(self):
+        """Test that exploration streams progress until every chain is covered."""
+        updates = list(designspace.explore(self.slots, chunk_size=50))
+        self.assertGreater(len(updates), 1)
+        covered, total, front = updates[-1]
+        self.assertEqual(covered, total)
+        self.assertGreater(len(front), 0)
@@ -0,0 +1,93 @@
+"""Test module for detector transfer curve analysis."""
+import math
+import unittest
+import numpy as np
+from rfdesigner.components import Generic
+from rfdesigner.components.detector import Detector
+from rfdesigner.simulation import detection, results
+
+
+class TestDetection(unittest.TestCase):
+    """Object to test detector transfer curve methods."""
+
+    def setUp(self):
+        """Set up detector testing."""
+        self.detector = Detector(gain=0, mds=-60, smax=0, law="log")
+        self.system = [Generic(gain=20, nf=3), self.detector]
+        self.pin = np.arange(-100, 1.0)
+
+    def test_detector_index(self):
+        """Test the last detector of a chain is found."""
+        self.assertEqual(detection.detector_index(self.system), 1)
+        self.assertIsNone(detection.detector_index([Generic(gain=1)]))
+
+    def test_dynamic_range(self):
+        """Test the widest span within tolerance is found."""
+        pin = np.arange(8.0)
+        error = np.array([5, 0, 0, 5, 0, 0, 0, 5])
+        self.assertEqual(detection.dynamic_range(pin, error), (4.0, 6.0))
+        low, high = detection.dynamic_range(pin, np.full(8, 5.0))
+        self.assertTrue(math.isnan(low) and math.isnan(high))
+
+    def test_derivative(self):
+        """Test central differences of a line give its slope."""
+        x = np.arange(5.0)
+        self.assertTrue(np.allclose(detection.derivative(3 * x + 1, x), 3))
+        self.assertEqual(detection.derivative(np.ones(1), x[:1]).tolist(), [0])
+
+    def test_run(self):
+        """Test the transfer curve includes the front end gain and clamping."""
+        result = detection.run(self.system, self.pin, bandwidth=1e6)
+        self.assertEqual(result["units"], "dBm")
+        # The front end moves the mds (-60 dBm) and smax (0 dBm) down by its gain
+        self.assertEqual(result["dynamic_range"], (-81.0, -19.0))
+        self.assertEqual(result["reading"][0], -60)
+        self.assertEqual(result["reading"][-1], 0)
+        self.assertAlmostEqual(result["reading"][50], -30, places=3)
+        self.assertAlmostEqual(result["slope"][50], 1, places=3)
+        self.assertEqual(result["slope"][-1], 0)
+
+    def test_run_laws(self):
+        """Test readings and slopes are in the units of the law."""
+        system = [Generic(gain=20), Detector(gain=0, mds=1e-9, smax=1e-3, law="square")]
+        result = detection.run(system, [-50, -49.9, -49.8])
+        self.assertEqual(result["units"], "W")
+        self.assertAlmostEqual(result["reading"][1] / 10 ** ((-29.9 - 30) / 10), 1)
+        # A square law detector follows power with the linear gain of the chain
+        self.assertAlmostEqual(result["slope"][1], 100, places=3)
+        self.assertTrue(np.allclose(result["error"], 0))
+
+    def test_run_noise(self):
+        """Test front end noise raises the reading of small signals."""
+        quiet = detection.run(self.system, self.pin, bandwidth=1)
+        noisy = detection.run(self.system, self.pin, bandwidth=1e9)
+        self.assertLess(noisy["dynamic_range"][1] - noisy["dynamic_range"][0], 62)
+        self.assertEqual(quiet["dynamic_range"], (-81.0, -19.0))
+
+    def test_run_no_detector(self):
+        """Test a chain without a detector raises."""
+        with self.assertRaises(ValueError):
+            detection.run([Generic(gain=1)], self.pin)
+        self.assertEqual(detection.run([], self.pin), {})
+
+    def test_large_curve(self):
+        """Test a million point curve is computed."""
+        pin = np.linspace(-100, 0, 1000000)
+        result = detection.run(self.system, pin, bandwidth=1e6)
+        self.assertEqual(result["reading"].shape, pin.shape)
+        low, high = result["dynamic_range"]
+        self.assertAlmostEqual(low, -81, places=3)
+        self.assertAlmostEqual(high, -19, places=3)
+
+    def test_csv(self):
+        """Test detector results csv."""
+        result = detection.run(self.system, self.pin, bandwidth=1e6)
+        lines = list(results.iter_csv_detector(result))
+        self.assertEqual(lines[2], "Dynamic Range (dB),62.0")
+        self.assertEqual(lines[4], "Pin (dBm),Reading (dBm),Slope (dB/dB),Error (dB)")
+        self.assertEqual(lines[5], "-100.0,-60,0,20.0")
+        self.assertEqual(len(lines), 5 + len(self.pin))
+
+
+if __name__ == "__main__":
+    unittest.main()
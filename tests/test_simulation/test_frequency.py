@@ -0,0 +1,100 @@
+"""Test module for cascade analysis versus frequency."""
+import math
+import unittest
+import numpy as np
+import rfdesigner.simulation.cascade as sim
+from rfdesigner.simulation import frequency, results
+from rfdesigner.chaintable import ChainTable
+from rfdesigner.components import Generic, Passive
+from rfdesigner.components.amplifier import Amplifier
+from rfdesigner.components.filter import LPF
+
+
+class TestFrequency(unittest.TestCase):
+    """Object to test frequency response methods."""
+
+    def setUp(self):
+        """Set up frequency response testing."""
+        self.system = [
+            Amplifier(name="lna", gain=15, nf=2, iip3=5, f3db=500),
+            Passive(name="loss", gain=-3),
+            Amplifier(name="amp", gain=10, nf=4, iip3=20, f3db=2000, fbw=8000),
+        ]
+        self.freqs = frequency.frequency_grid(1, 10000, 2001)
+
+    def test_frequency_grid(self):
+        """Test linear and logarithmic frequency grids."""
+        self.assertListEqual(frequency.frequency_grid(0, 10, 3).tolist(), [0, 5, 10])
+        log_grid = frequency.frequency_grid(1, 100, 3, log=True)
+        self.assertTrue(np.allclose(log_grid, [1, 10, 100]))
+
+    def test_matches_cascade_in_band(self):
+        """Test results far below every pole match scalar cascade analysis."""
+        result = frequency.run(self.system, [1e-6])
+        expected = sim.run(self.system)
+        for key in ["gain", "nf", "iip3", "oip3"]:
+            self.assertAlmostEqual(result[key][0], expected[key], places=2)
+
+    def test_roll_off(self):
+        """Test gain, noise figure and intercepts past the poles."""
+        result = frequency.run(self.system, [1e-6, 500, 1e5])
+        poles = [500, 2000, 8000]
+        drop = sum(10 * math.log10(1 + (500 / pole) ** 2) for pole in poles)
+        self.assertAlmostEqual(result["gain"][0] - result["gain"][1], drop, places=1)
+        self.assertLess(result["gain"][2], 0)
+        self.assertGreater(result["nf"][2], result["nf"][0])
+        self.assertGreater(result["iip3"][2], result["iip3"][0])
+        passive = Passive(gain=-3)
+        self.assertListEqual(passive.nf_response([-3, -5]).tolist(), [3, 5])
+
+    def test_group_delay(self):
+        """Test group delay against the low frequency delay of the poles."""
+        result = frequency.run(self.system, self.freqs)
+        poles = [500, 2000, 8000]
+        expected = sum(1e3 / (2 * math.pi * pole) for pole in poles)
+        self.assertAlmostEqual(result["group_delay"][0], expected, places=3)
+        self.assertTrue(np.all(np.diff(result["phase"]) < 0))
+        self.assertListEqual(
+            frequency.run(self.system, [1])["group_delay"].tolist(), [0]
+        )
+
+    def test_update_after_edit(self):
+        """Test only edited blocks are re-evaluated and results match a new run."""
+        response = frequency.FrequencyResponse(self.system, self.freqs)
+        response.run()
+        self.assertListEqual(response.update(), [])
+        self.system[1].gain = -6
+        self.system[2].f3db = 1000
+        self.assertListEqual(response.update(), [1, 2])
+        self.system[2].iip3 = 25
+        edited = response.run()
+        expected = frequency.FrequencyResponse(self.system, self.freqs).run()
+        for key in frequency.RESULT_KEYS:
+            self.assertTrue(np.allclose(edited[key], expected[key]), key)
+
+    def test_chain_table(self):
+        """Test compact chains give the same response."""
+        table = ChainTable.from_blocks(self.system)
+        result = frequency.run(table, self.freqs)
+        expected = frequency.run(self.system, self.freqs)
+        self.assertTrue(np.allclose(result["gain"], expected["gain"]))
+
+    def test_csv_frequency(self):
+        """Test csv generation for frequency results."""
+        self.assertEqual(frequency.run([], self.freqs), {})
+        lines = results.csv_frequency(frequency.run([Generic(gain=3)], [1, 2]))
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("Freq (MHz),Gain (dB)"))
+        self.assertTrue(lines[2].startswith("2.0,3.0,"))
+
+    def test_noise_bandwidth(self):
+        """Test equivalent noise bandwidth against closed forms."""
+        for order in [1, 3]:
+            expected = 10e6 * (math.pi / (2 * order)) / math.sin(math.pi / (2 * order))
+            lpf = LPF(fc=10, order=order, gain=-2)
+            self.assertAlmostEqual(
+                frequency.noise_bandwidth([lpf]) / expected, 1, places=2
+            )
+        self.assertEqual(frequency.noise_bandwidth([Generic(gain=10)]), math.inf)
+        response = frequency.FrequencyResponse([Generic(gain=10)], [0, 1, 3])
+        self.assertAlmostEqual(response.noise_bandwidth(), 3e6)
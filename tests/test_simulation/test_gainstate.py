@@ -0,0 +1,94 @@
+"""Test module for VGA gain-state tables."""
+import unittest
+import rfdesigner.simulation.cascade as sim
+from rfdesigner.chaintable import ChainTable
+from rfdesigner.simulation import gainstate
+from rfdesigner.components import Generic
+from rfdesigner.components.vga import VGA
+
+
+class TestGainState(unittest.TestCase):
+    """Object to test gain-state tables."""
+
+    def setUp(self):
+        """Set up gain-state testing."""
+        self.system = [
+            Generic(gain=15, nf=3, p1db=10, iip3=20),
+            VGA(gain_min=-5, gain_max=20, gain_step=2, nf=8, iip3=15),
+            Generic(gain=-3, nf=3),
+            VGA(gain_min=0, gain_max=10, gain_step=1, nf=6, iip3=25),
+        ]
+        self.table = gainstate.GainStateTable(self.system, pin=-50, bandwidth=10)
+
+    def test_control_gains(self):
+        """Test VGA gains are generated for every control code."""
+        gains = gainstate.control_gains(VGA(gain_min=-5, gain_max=20, gain_step=2))
+        self.assertEqual(len(gains), 14)
+        self.assertEqual(gains[0], -5)
+        self.assertEqual(gains[-1], 20)
+        gains = gainstate.control_gains(VGA(gain_min=3, gain_max=3, gain_step=1))
+        self.assertListEqual(gains.tolist(), [3])
+
+    def test_table_shape(self):
+        """Test table covers the cartesian product of control codes."""
+        self.assertListEqual(self.table.vga_index, [1, 3])
+        self.assertTupleEqual(self.table.shape, (14, 11))
+
+    def test_lookup_matches_cascade(self):
+        """Test lookups match a full cascade at the same control codes."""
+        for codes in [(0, 0), (3, 7), (13, 10), (20, 15)]:
+            self.system[1].control = codes[0]
+            self.system[3].control = codes[1]
+            expected = sim.run(self.system, pin=-50, bandwidth=10)
+            result = self.table.lookup(*codes)
+            for key in gainstate.TABLE_KEYS:
+                self.assertAlmostEqual(result[key], expected[key], places=9)
+
+    def test_lookup_wrong_codes(self):
+        """Test that the number of codes must match the number of VGAs."""
+        with self.assertRaises(ValueError):
+            self.table.lookup(1)
+
+    def test_invalidation(self):
+        """Test that changing a block parameter rebuilds the table."""
+        self.assertFalse(self.table.stale)
+        Generic(gain=1).nf = 4
+        self.assertFalse(self.table.stale)
+        before = self.table.lookup(2, 2)["nf"]
+        self.system[0].nf = 1
+        self.assertTrue(self.table.stale)
+        after = self.table.lookup(2, 2)["nf"]
+        self.assertFalse(self.table.stale)
+        self.assertLess(after, before)
+        self.system[3].gain_max = 5
+        self.assertEqual(self.table.lookup(0, 20)["gain"], 15 - 5 - 3 + 5)
+        self.assertTupleEqual(self.table.shape, (14, 6))
+
+    def test_control_keeps_table(self):
+        """Test that changing VGA control codes does not rebuild the table."""
+        results = self.table.results
+        self.system[1].control = 3
+        self.system[3].control = 7
+        self.assertFalse(self.table.stale)
+        self.table.lookup(3, 7)
+        self.assertIs(self.table.results, results)
+        self.system[1].gain_step = 1
+        self.assertTrue(self.table.stale)
+
+    def test_compact_chain(self):
+        """Test tables built on a compact chain find VGAs and keep up to date."""
+        chain = ChainTable.from_blocks(self.system)
+        table = gainstate.GainStateTable(chain, pin=-50, bandwidth=10)
+        self.assertListEqual(table.vga_index, [1, 3])
+        self.assertTupleEqual(table.shape, self.table.shape)
+        results = table.lookup(3, 7)
+        chain[1].control = 3
+        chain[3].control = 7
+        self.assertFalse(table.stale)
+        expected = sim.run(chain, pin=-50, bandwidth=10)
+        for key in gainstate.TABLE_KEYS:
+            self.assertAlmostEqual(results[key], expected[key], places=6)
+        chain[0].gain = 12
+        self.assertTrue(table.stale)
+        results = table.lookup(3, 7)
+        self.assertAlmostEqual(results["gain"], expected["gain"] - 3, places=6)
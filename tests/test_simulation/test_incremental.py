@@ -0,0 +1,77 @@
+"""Test module for incremental cascade analysis."""
+import unittest
+import rfdesigner.simulation.cascade as sim
+from rfdesigner.simulation import incremental
+from rfdesigner.components import Generic
+from rfdesigner.components.vga import VGA
+
+RESULT_KEYS = ["pout", "gain", "nf", "iip3", "oip3", "p1db", "snr", "sfdr", "mds"]
+
+
+class TestIncremental(unittest.TestCase):
+    """Object to test incremental cascade methods."""
+
+    def setUp(self):
+        """Set up incremental testing."""
+        self.system = [
+            Generic(gain=15, nf=3, p1db=10, iip3=20),
+            Generic(gain=-3, nf=3),
+            VGA(gain_min=0, gain_max=20, gain_step=2, control=3, nf=6, iip3=15),
+            Generic(gain=10, nf=6, p1db=12, iip3=30),
+        ]
+        self.state = incremental.CascadeState(self.system, pin=-50, bandwidth=10)
+
+    def assert_matches_run(self, result):
+        """Check results against a full cascade run."""
+        expected = sim.run(self.system, pin=-50, bandwidth=10)
+        for key in RESULT_KEYS:
+            self.assertAlmostEqual(result[key], expected[key], places=9)
+
+    def test_initial_totals(self):
+        """Test that the initial state matches a full cascade."""
+        self.assert_matches_run(self.state.totals())
+
+    def test_update(self):
+        """Test that updating a block matches a full cascade."""
+        for index, props in [
+            (3, {"gain": 12}),
+            (0, {"nf": 1.5, "gain": 18}),
+            (1, {"iip3": 5}),
+            (2, {"control": 8}),
+            (0, {"p1db": 0}),
+        ]:
+            result = self.state.update(index, **props)
+            self.assert_matches_run(result)
+
+    def test_what_if(self):
+        """Test that what-if queries match a full cascade without mutating."""
+        before = self.state.totals()
+        for index in range(len(self.system)):
+            props = {"gain": 7, "nf": 4, "iip3": 12, "p1db": 2}
+            result = self.state.what_if(index, **props)
+            self.assertDictEqual(self.state.totals(), before)
+            original = {prop: getattr(self.system[index], prop) for prop in props}
+            self.system[index] = Generic(**props)
+            self.assert_matches_run(result)
+            self.system[index] = Generic(**original)
+        self.assert_matches_run(self.state.totals())
+
+    def test_empty_chain(self):
+        """Test that an empty chain has no totals, as in cascade.run."""
+        state = incremental.CascadeState([])
+        self.assertDictEqual(state.totals(), {})
+        self.assertDictEqual(state.what_if(0, gain=10), {})
+
+    def test_what_if_bad_property(self):
+        """Test that what-if only accepts cascade properties."""
+        with self.assertRaises(ValueError):
+            self.state.what_if(0, control=4)
+
+    def test_write_totals(self):
+        """Test that block totals match those written by a cascade run."""
+        self.state.update(1, gain=-6)
+        self.state.write_totals()
+        totals = [(b.total_gain, b.total_nf, b.total_iip3) for b in self.system]
+        sim.run(self.system, pin=-50, bandwidth=10)
+        expected = [(b.total_gain, b.total_nf, b.total_iip3) for b in self.system]
+        self.assertListEqual(totals, expected)
@@ -0,0 +1,84 @@
+"""Test module for multi-tone intermodulation simulation."""
+import math
+import unittest
+import numpy as np
+from rfdesigner.components import Generic
+from rfdesigner.simulation import cascade, intermod, results
+
+
+class TestIntermod(unittest.TestCase):
+    """Object to test multi-tone simulation methods."""
+
+    def setUp(self):
+        """Set up a chain with two nonlinear stages."""
+        self.system = [
+            Generic(name="lna", gain=20, nf=2, iip3=0),
+            Generic(name="pad", gain=-3),
+            Generic(name="amp", gain=15, iip3=5, p1db=12),
+        ]
+
+    def test_intermod_products(self):
+        """Test the products of two and three tones."""
+        self.assertListEqual(
+            intermod.intermod_products([100, 101], 3).tolist(), [99, 102]
+        )
+        self.assertListEqual(
+            intermod.intermod_products([100, 101], 5).tolist(), [98, 103]
+        )
+        products = intermod.intermod_products([100, 101, 103], 3)
+        self.assertIn(100 + 101 - 103, products)
+        self.assertIn(2 * 103 - 100, products)
+        self.assertEqual(len(intermod.intermod_products([100], 3)), 0)
+
+    def test_tone_bins(self):
+        """Test tones move to the nearest bin and must be apart."""
+        bins = intermod.tone_bins([100, 110.4], 1024, 1024)
+        self.assertListEqual(bins.tolist(), [100, 110])
+        with self.assertRaises(ValueError):
+            intermod.tone_bins([100, 102], 1024, 1024)
+        with self.assertRaises(ValueError):
+            intermod.tone_bins([511], 1024, 1024)
+
+    def test_single_tone(self):
+        """Test the power of a tone through a linear chain."""
+        system = [Generic(gain=10), Generic(gain=-3)]
+        result = intermod.run(system, [100], -20, 1000, 1 << 16)
+        self.assertEqual(result["pout"], -13)
+        self.assertEqual(result["gain"], 7)
+        self.assertEqual(result["im3"], -math.inf)
+
+    def test_two_tone(self):
+        """Test two-tone IM3 against the cascade estimate."""
+        expected = cascade.run(self.system, pin=-50)
+        result = intermod.run(self.system, [100, 101], -50, 1000, 1 << 17)
+        self.assertAlmostEqual(result["iip3"], expected["iip3"], places=1)
+        self.assertAlmostEqual(result["gain"], expected["gain"], places=1)
+        self.assertAlmostEqual(
+            result["im3_dbc"], float(self.system[-1].total_im3), places=1
+        )
+        # IM3 rises 3 dB and IM5 5 dB per dB of input power
+        louder = intermod.run(self.system, [100, 101], -40, 1000, 1 << 17)
+        self.assertAlmostEqual(louder["im3"] - result["im3"], 30, places=0)
+        self.assertAlmostEqual(louder["im5"] - result["im5"], 50, places=0)
+
+    def test_chunked_record(self):
+        """Test a long record averages to the spectrum of one chunk."""
+        test = intermod.MultiToneTest(self.system, [100, 101, 103], -45, 1000, 4096)
+        one = test.spectrum(4096)
+        many = test.spectrum(4096 * 8 + 100)
+        peaks = one > one.max() * 1e-9
+        self.assertTrue(np.allclose(one[peaks], many[peaks], rtol=1e-6))
+        chunks = list(test.chunks(3 * 4096))
+        self.assertEqual(len(chunks), 3)
+        self.assertIs(chunks[0], chunks[2])
+
+    def test_csv_intermod(self):
+        """Test the csv of a multi-tone result."""
+        result = intermod.run(self.system, [100, 101], -50, 1024, 1 << 12)
+        lines = list(results.iter_csv_intermod(result, {"iip3": -12.27}))
+        self.assertTrue(lines[0].startswith("Tones (MHz),"))
+        self.assertEqual(lines[2], "Result,Simulated,Estimated")
+        self.assertTrue(lines[-1].startswith("iip3,"))
+        self.assertTrue(lines[-1].endswith(",-12.27"))
+        lines = list(results.iter_csv_intermod(result, spectrum=True))
+        self.assertEqual(lines[-1].split(",")[0], "512.0")
@@ -0,0 +1,100 @@
+"""Test module for Monte Carlo analysis."""
+import os
+import tempfile
+import unittest
+import numpy as np
+from rfdesigner.simulation import columnar, montecarlo
+from rfdesigner.components import Generic
+
+
+class TestMonteCarlo(unittest.TestCase):
+    """Object to test Monte Carlo methods."""
+
+    def setUp(self):
+        """Set up Monte Carlo testing."""
+        self.system = [
+            Generic(gain=15, nf=3, p1db=10, iip3=20, gain_sigma=0.5),
+            Generic(gain=10, nf=6, p1db=12, iip3=30, nf_range=[5, 7]),
+        ]
+
+    def test_exit_on_empty_system(self):
+        """Test that Monte Carlo returns empty dict on empty system."""
+        self.assertDictEqual(montecarlo.run(), {})
+        self.assertDictEqual(montecarlo.run(self.system, samples=0), {})
+        with self.assertRaises(ValueError):
+            montecarlo.run(self.system, samples=10, chunk_size=0)
+
+    def test_pack_tolerances(self):
+        """Test that block tolerances are packed per property."""
+        spec = montecarlo.pack_tolerances(self.system)
+        nominal, sigma, low, high = spec["gain"]
+        self.assertListEqual(nominal.tolist(), [15, 10])
+        self.assertListEqual(sigma.tolist(), [0.5, 0])
+        self.assertTrue(np.isnan(low).all())
+        nominal, sigma, low, high = spec["nf"]
+        self.assertListEqual(low[1:].tolist(), [5])
+        self.assertListEqual(high[1:].tolist(), [7])
+
+    def test_draw_samples(self):
+        """Test samples follow the declared distributions."""
+        spec = montecarlo.pack_tolerances(self.system)
+        arrays = montecarlo.draw_samples(spec, 20000, np.random.default_rng(0))
+        self.assertAlmostEqual(arrays["gain"][:, 0].std(), 0.5, places=1)
+        self.assertTrue((arrays["gain"][:, 1] == 10).all())
+        self.assertTrue((arrays["nf"][:, 1] >= 5).all())
+        self.assertTrue((arrays["nf"][:, 1] <= 7).all())
+        self.assertTrue((arrays["iip3"] == [20, 30]).all())
+
+    def test_reproducible(self):
+        """Test that seeded runs do not depend on worker count."""
+        first = montecarlo.run(self.system, samples=5000, seed=4, chunk_size=1000)
+        second = montecarlo.run(
+            self.system, samples=5000, seed=4, chunk_size=1000, workers=2
+        )
+        self.assertDictEqual(first, second)
+        third = montecarlo.run(self.system, samples=5000, seed=5, chunk_size=1000)
+        self.assertNotEqual(first, third)
+
+    def test_statistics(self):
+        """Test reported statistics and yield."""
+        result = montecarlo.run(
+            self.system,
+            samples=20000,
+            seed=1,
+            limits={"gain": (25, None), "nf": (None, 10)},
+        )
+        self.assertEqual(result["samples"], 20000)
+        self.assertEqual(result["gain"]["nominal"], 25)
+        self.assertAlmostEqual(result["gain"]["mean"], 25, places=1)
+        self.assertAlmostEqual(result["gain"]["std"], 0.5, places=1)
+        self.assertAlmostEqual(result["gain"]["percentiles"][50], 25, places=1)
+        self.assertLess(result["gain"]["percentiles"][5], 24.5)
+        self.assertAlmostEqual(result["yield"], 0.5, places=1)
+        self.assertEqual(result["iip3"]["nominal"], 13.81)
+
+    def test_samples_file(self):
+        """Test every sample is stored regardless of worker count."""
+        with tempfile.TemporaryDirectory() as tmp:
+            file_name = os.path.join(tmp, "samples.rfcol")
+            kwargs = {"samples": 5000, "seed": 2, "chunk_size": 1000}
+            result = montecarlo.run(self.system, samples_file=file_name, **kwargs)
+            store = columnar.ColumnFile(file_name)
+            self.assertEqual(len(store), 5000)
+            self.assertEqual(store["total_nf"].shape, (5000, 2))
+            self.assertAlmostEqual(
+                float(store["gain"].mean()), result["gain"]["mean"], 2
+            )
+            self.assertEqual(round(float(store["nf"].max()), 2), result["nf"]["max"])
+            first = store.read()
+            montecarlo.run(self.system, samples_file=file_name, workers=2, **kwargs)
+            second = columnar.ColumnFile(file_name).read()
+            for key in first:
+                np.testing.assert_array_equal(first[key], second[key])
+
+    def test_infinite_property(self):
+        """Test properties not defined in the chain are reported as nominal."""
+        system = [Generic(gain=10, nf=2, nf_sigma=0.1)]
+        result = montecarlo.run(system, samples=100, seed=0)
+        self.assertEqual(result["iip3"]["mean"], np.inf)
+        self.assertEqual(result["iip3"]["std"], 0)
+        self.assertIsNone(result["yield"])
@@ -0,0 +1,51 @@
+"""Test module for cascade analysis over several signal chains."""
+import unittest
+from rfdesigner.simulation import cascade, multichain, results, sweep
+from rfdesigner.components import Generic
+
+
+class TestMultiChain(unittest.TestCase):
+    """Object to test multi-chain cascade methods."""
+
+    def setUp(self):
+        """Set up multi-chain testing."""
+        self.systems = {
+            f"rx_{index}": [
+                Generic(name="amp", gain=10 + index, nf=2, iip3=10),
+                Generic(name="loss", gain=-3, nf=3),
+            ]
+            for index in range(5)
+        }
+
+    def test_run_matches_cascade(self):
+        """Test results match single-chain cascade analysis in order."""
+        chain_lines = multichain.run(self.systems, pin=-20, bandwidth=1e6, chunksize=2)
+        self.assertListEqual(list(chain_lines), list(self.systems))
+        for name, system in self.systems.items():
+            result = cascade.run(system=system, pin=-20, bandwidth=1e6)
+            self.assertListEqual(chain_lines[name], results.csv_cascade(system, result))
+
+    def test_run_sweep(self):
+        """Test input power sweeps over several chains."""
+        pin = sweep.pin_range(-30, -10, 10)
+        chain_lines = multichain.run(self.systems, pin_sweep=pin)
+        for name, system in self.systems.items():
+            result = sweep.run(system=system, pin=pin)
+            self.assertListEqual(chain_lines[name], results.csv_sweep(system, result))
+
+    def test_run_workers(self):
+        """Test worker processes give the same results."""
+        serial = multichain.run(self.systems, workers=1)
+        parallel = multichain.run(self.systems, workers=2, chunksize=2)
+        self.assertDictEqual(serial, parallel)
+
+    def test_csv_combined(self):
+        """Test combined csv output of several chains."""
+        lines = results.csv_combined({"a": ["x,1"], "b": ["y,2"]})
+        self.assertListEqual(lines, ["System,a", "x,1", "", "System,b", "y,2", ""])
+
+    def test_iter_run(self):
+        """Test chains are yielded lazily in order."""
+        chain_lines = multichain.iter_run(self.systems, workers=2, chunksize=1)
+        self.assertEqual(next(chain_lines)[0], "rx_0")
+        self.assertListEqual([name for name, _ in chain_lines], list(self.systems)[1:])
@@ -0,0 +1,97 @@
+"""Test module for block ordering optimization."""
+import itertools
+import unittest
+import numpy as np
+from rfdesigner.simulation import batch, cascade, ordering, rfmath
+from rfdesigner.components import Generic
+
+
+class TestOrdering(unittest.TestCase):
+    """Object to test block ordering methods."""
+
+    def setUp(self):
+        """Set up ordering testing."""
+        self.system = [
+            Generic(gain=20, nf=1, iip3=-5),
+            Generic(gain=-3, nf=3),
+            Generic(gain=15, nf=3, iip3=10),
+            Generic(gain=-6, nf=6),
+            Generic(gain=12, nf=5, iip3=25),
+            Generic(gain=-3, nf=3),
+            Generic(gain=10, nf=4, iip3=15),
+        ]
+
+    def brute_force(self, fixed, system=None):
+        """Get the exact Pareto front by evaluating every ordering."""
+        system = system or self.system
+        orders = [
+            order
+            for order in itertools.permutations(range(len(system)))
+            if all(order[pos] == blk for pos, blk in fixed.items())
+        ]
+        arrays = batch.pack_systems([system])
+        totals = batch.cascade(
+            *(arrays[prop][0][np.array(orders)] for prop in ordering.CASCADE_PROPS),
+            decimals=None,
+        )
+        costs = np.stack([totals["nf"], -totals["iip3"]], axis=1)
+        mask = rfmath.pareto_mask(costs)
+        return sorted(zip(totals["nf"][mask].round(9), totals["iip3"][mask].round(9)))
+
+    def test_exit_on_empty_system(self):
+        """Test that ordering returns empty list on empty system."""
+        self.assertListEqual(ordering.run(), [])
+
+    def test_matches_brute_force(self):
+        """Test that the search finds the exact Pareto front."""
+        for fixed in [{}, {0: 4}, {0: 1, 6: 0}]:
+            result = ordering.run(self.system, fixed=fixed, decimals=None)
+            points = sorted((round(r["nf"], 9), round(r["iip3"], 9)) for r in result)
+            self.assertListEqual(points, self.brute_force(fixed))
+            for entry in result:
+                self.assertListEqual(sorted(entry["order"]), list(range(7)))
+                for pos, blk in fixed.items():
+                    self.assertEqual(entry["order"][pos], blk)
+
+    def test_default_noise_figure(self):
+        """Test noise figures below 0 dB are noiseless in the search only."""
+        system = [Generic(gain=10, iip3=5)] + self.system[1:4]
+        result = ordering.run(system, decimals=None)
+        noiseless = [Generic(gain=10, nf=0, iip3=5)] + self.system[1:4]
+        expected = ordering.run(noiseless, decimals=None)
+        self.assertListEqual(
+            sorted(entry["order"] for entry in result),
+            sorted(entry["order"] for entry in expected),
+        )
+        # Totals are reported from the netlisted noise figures, as in cascade.run
+        for entry in result:
+            totals = cascade.run([system[index] for index in entry["order"]])
+            for key in ordering.CASCADE_PROPS:
+                self.assertAlmostEqual(entry[key], totals[key], places=2)
+        self.assertTrue(any(entry["nf"] < 0 for entry in result))
+
+    def test_parallel_search(self):
+        """Test that splitting the search gives the same orderings."""
+        for system in [self.system, self.system[:3]]:
+            serial = ordering.run(system)
+            parallel = ordering.run(system, workers=2, split_depth=2)
+            self.assertListEqual(
+                [(entry["nf"], entry["iip3"]) for entry in serial],
+                [(entry["nf"], entry["iip3"]) for entry in parallel],
+            )
+
+    def test_results_sorted(self):
+        """Test that orderings are sorted and non-dominated."""
+        result = ordering.run(self.system)
+        nf = [entry["nf"] for entry in result]
+        iip3 = [entry["iip3"] for entry in result]
+        self.assertListEqual(nf, sorted(nf))
+        self.assertListEqual(iip3, sorted(iip3))
+        self.assertEqual(len(set(nf)), len(nf))
+
+    def test_invalid_fixed(self):
+        """Test that invalid fixed positions raise errors."""
+        with self.assertRaises(ValueError):
+            ordering.run(self.system, fixed={7: 0})
+        with self.assertRaises(ValueError):
+            ordering.run(self.system, fixed={0: 1, 1: 1})
@@ -20,3 +20,20 @@ class TestRFMath(unittest.TestCase):
         """Test the SFDR method."""
         result = rfmath.sfdr(iip3=20, mds=5)
         self.assertEqual(result, 10)
+
+    def test_pareto_mask(self):
+        """Test the Pareto mask method."""
+        costs = [[1, 5], [2, 2], [3, 3], [2, 2], [5, 1], [1, 6]]
+        result = rfmath.pareto_mask(costs)
+        self.assertListEqual(result.tolist(), [True, True, False, False, True, False])
+        costs = [[1, 5, 0], [2, 2, 0], [3, 3, 0], [2, 2, 0], [5, 1, 0], [1, 6, 0]]
+        result = rfmath.pareto_mask(costs)
+        self.assertListEqual(result.tolist(), [True, True, False, False, True, False])
+
+    def test_dominated_mask(self):
+        """Test the dominated mask method."""
+        costs = [[1, 5], [2, 2], [0, 9], [3, 3]]
+        reference = [[1, 4], [2, 2]]
+        result = rfmath.dominated_mask(costs, reference, block_size=2)
+        self.assertListEqual(result.tolist(), [True, True, False, True])
+        self.assertFalse(rfmath.dominated_mask(costs, []).any())
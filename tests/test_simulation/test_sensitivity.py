@@ -0,0 +1,112 @@
+"""Test module for cascade sensitivity analysis."""
+import math
+import unittest
+import numpy as np
+from rfdesigner.chaintable import ChainTable
+from rfdesigner.components import Generic
+from rfdesigner.simulation import batch, results, sensitivity
+
+
+class TestSensitivity(unittest.TestCase):
+    """Object to test sensitivity methods."""
+
+    def setUp(self):
+        """Set up sensitivity testing."""
+        self.systems = [
+            [
+                Generic(gain=15, nf=3, p1db=10, iip3=20),
+                Generic(gain=10, nf=6, p1db=12, iip3=30),
+            ],
+            [
+                Generic(gain=-3, nf=3),
+                Generic(gain=20, nf=2, p1db=5, iip3=15),
+                Generic(gain=12, nf=8, p1db=18, iip3=25),
+            ],
+            [Generic(gain=5)],
+        ]
+
+    def totals(self, arrays):
+        """Get unrounded cascade totals of packed systems."""
+        result = batch.run(pin=-60, bandwidth=10, decimals=None, **arrays)
+        return {total: result[total] for total in sensitivity.TOTALS}
+
+    def test_matches_finite_differences(self):
+        """Test every derivative matches a small perturbation of the block."""
+        arrays = batch.pack_systems(self.systems)
+        derivatives = sensitivity.run_systems(self.systems)
+        base = self.totals(arrays)
+        step = 1e-6
+        for param in sensitivity.PARAMS:
+            for col in range(3):
+                perturbed = {key: value.copy() for key, value in arrays.items()}
+                perturbed[param][:, col] += step
+                moved = self.totals(perturbed)
+                for total in sensitivity.TOTALS:
+                    with np.errstate(invalid="ignore"):
+                        expected = (moved[total] - base[total]) / step
+                    actual = derivatives[total][param][:, col]
+                    exists = arrays["mask"][:, col]
+                    # Totals of chains without intercepts are infinite
+                    finite = exists & np.isfinite(base[total])
+                    self.assertTrue(
+                        np.allclose(actual[finite], expected[finite], atol=1e-5),
+                        f"d{total}/d{param} of block {col}",
+                    )
+                    self.assertTrue(np.all(np.isnan(actual[~exists])))
+
+    def test_run(self):
+        """Test a single system gives the first row of the batch."""
+        derivatives = sensitivity.run(self.systems[1])
+        batched = sensitivity.run_systems(self.systems)
+        for total in sensitivity.TOTALS:
+            for param in sensitivity.PARAMS:
+                self.assertTrue(
+                    np.array_equal(derivatives[total][param], batched[total][param][1])
+                )
+        table = sensitivity.run(ChainTable.from_blocks(self.systems[1]))
+        self.assertTrue(np.array_equal(table["nf"]["gain"], derivatives["nf"]["gain"]))
+        self.assertEqual(sensitivity.run([]), {})
+
+    def test_known_values(self):
+        """Test derivatives with simple closed forms."""
+        derivatives = sensitivity.run(self.systems[1])
+        self.assertListEqual(derivatives["gain"]["gain"].tolist(), [1, 1, 1])
+        # The last block's gain does not change any input referred total
+        for total in ["nf", "iip3", "p1db", "snr", "sfdr"]:
+            self.assertEqual(derivatives[total]["gain"][-1], 0)
+        # Sensitivities to the blocks' own intercepts share the total
+        self.assertAlmostEqual(derivatives["iip3"]["iip3"].sum(), 1)
+        self.assertEqual(derivatives["iip3"]["iip3"][0], 0)
+        self.assertTrue(
+            np.array_equal(derivatives["snr"]["nf"], -2 * derivatives["nf"]["nf"])
+        )
+        self.assertListEqual(derivatives["nf"]["iip3"].tolist(), [0, 0, 0])
+
+    def test_small_terms(self):
+        """Test small terms after large ones keep their precision."""
+        system = [
+            Generic(gain=0, nf=60),
+            Generic(gain=0, nf=60),
+            Generic(gain=0, nf=0.001),
+        ]
+        derivatives = sensitivity.run(system)
+        factor = 1 + 2 * (1e6 - 1) + (10 ** 0.0001 - 1)
+        self.assertAlmostEqual(
+            derivatives["nf"]["gain"][1] / -((10 ** 0.0001 - 1) / factor), 1, places=9
+        )
+
+    def test_csv(self):
+        """Test sensitivity results csv."""
+        system = self.systems[1]
+        system[1].name = "lna"
+        lines = list(results.iter_csv_sensitivity(system, sensitivity.run(system)))
+        self.assertEqual(lines[2], "Block,Parameter,Gain,NF,IIP3,P1dB,SNR,SFDR")
+        self.assertTrue(lines[3].startswith("1,gain,1.0,"))
+        self.assertTrue(lines[7].startswith("lna,gain,1.0,"))
+        self.assertEqual(len(lines), 3 + 4 * len(system))
+        self.assertFalse(any("nan" in line for line in lines))
+        self.assertFalse(math.isnan(sensitivity.run(system)["sfdr"]["nf"][0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Test module for mixer spur analysis."""
+import unittest
+import numpy as np
+from rfdesigner.components.mixer import Mixer
+from rfdesigner.simulation import results, spurs
+
+
+class TestSpurs(unittest.TestCase):
+    """Object to test mixer spur methods."""
+
+    def setUp(self):
+        """Set up spur testing."""
+        self.mixer = Mixer(gain=-7, lo_rejection=10, rf_rejection=15, spur_pin=-10)
+
+    def test_spur_orders(self):
+        """Test every product up to the order appears once."""
+        m, n = spurs.spur_orders(3)
+        pairs = set(zip(m.tolist(), n.tolist()))
+        self.assertEqual(len(pairs), len(m))
+        self.assertIn((1, -1), pairs)
+        self.assertIn((0, 3), pairs)
+        self.assertNotIn((0, -1), pairs)
+        self.assertNotIn((2, 2), pairs)
+        self.assertEqual(len(spurs.spur_orders(15)[0]), 240)
+
+    def test_spur_chart(self):
+        """Test the spur chart layout."""
+        chart = spurs.spur_chart(self.mixer, order=2)
+        self.assertTrue(np.isnan(chart[0, 0]))
+        self.assertTrue(np.isnan(chart[2, 1]))
+        self.assertEqual(chart[1, 1], 0)
+        self.assertEqual(chart[0, 2], -10)
+        self.assertEqual(chart[2, 0], -15)
+        lines = results.csv_spur_chart(chart)
+        self.assertListEqual(
+            lines[:2], ["Spur Chart (dBc),m=0,m=1,m=2", "n=0,,0.0,-10.0"]
+        )
+
+    def test_find_spurs(self):
+        """Test in-band spurs against a direct search."""
+        lo = np.linspace(900, 1100, 201)
+        rf = 1500
+        result = spurs.find_spurs(self.mixer, lo, rf, 490, 510, order=6, pin=0)
+        found = set(
+            zip(result["lo"].tolist(), result["m"].tolist(), result["n"].tolist())
+        )
+        expected = set()
+        for lo_freq in lo.tolist():
+            for m, n in zip(*spurs.spur_orders(6)):
+                freq = abs(m * lo_freq + n * rf)
+                if 490 <= freq <= 510 and (m, n) != (1, -1):
+                    expected.add((lo_freq, int(m), int(n)))
+        self.assertSetEqual(found, expected)
+        self.assertIn((1000.0, 2, -1), found)
+        levels = result["level"][result["lo"] == 1000]
+        self.assertTrue(np.all(np.diff(levels) <= 0))
+        self.assertTrue(
+            np.allclose(
+                result["freq"], np.abs(result["m"] * result["lo"] + result["n"] * rf)
+            )
+        )
+
+    def test_table_in_band(self):
+        """Test band queries on a spur table."""
+        table = spurs.SpurTable([1000, 2000], [1100, 2100], order=2)
+        points, products = table.in_band(100, 100)
+        self.assertListEqual(sorted(points.tolist()), [0, 1])
+        self.assertTrue(np.all(table.freqs[points, products] == 100))
+        self.assertEqual(len(table.in_band(1e6, 2e6)[0]), 0)
+
+    def test_csv_spurs(self):
+        """Test csv generation for in-band spurs."""
+        result = spurs.find_spurs(self.mixer, 1000, 1500, 490, 510, order=3)
+        lines = list(results.iter_csv_spurs(result))
+        self.assertEqual(lines[0], "LO (MHz),RF (MHz),m,n,Spur (MHz),Level (dBc)")
+        self.assertEqual(lines[1], "1000.0,1500.0,2,-1,500.0,-10.0")
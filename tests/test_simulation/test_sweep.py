@@ -0,0 +1,90 @@
+"""Test module for input power sweep methods."""
+import os
+import tempfile
+import unittest
+import numpy as np
+import rfdesigner.simulation.cascade as sim
+from rfdesigner.simulation import sweep, results
+from rfdesigner.components import Generic
+from rfdesigner.components.detector import Detector
+
+
+class TestSweep(unittest.TestCase):
+    """Object to test sweep methods."""
+
+    def setUp(self):
+        """Set up sweep testing."""
+        self.system = [
+            Generic(name="amp1", gain=15, nf=3, p1db=10, iip3=20),
+            Generic(name="amp2", gain=10, nf=6, p1db=12, iip3=30),
+        ]
+
+    def test_pin_range(self):
+        """Test that the sweep range includes the stop value."""
+        pins = sweep.pin_range(-10, -5, 2.5)
+        self.assertListEqual(pins.tolist(), [-10, -7.5, -5])
+
+    def test_exit_on_empty_system(self):
+        """Test that sweep returns empty dict on empty system."""
+        self.assertDictEqual(sweep.run(), {})
+
+    def test_propagate(self):
+        """Test per-stage output power and compression tracking."""
+        stage_pout, compressed = sweep.propagate(self.system, [-60, -4, 20])
+        self.assertListEqual(stage_pout[0].tolist(), [-45, -35])
+        # Second stage compresses once its input reaches 11dBm
+        self.assertListEqual(stage_pout[1].tolist(), [11, 21])
+        self.assertListEqual(compressed[1].tolist(), [False, True])
+        self.assertListEqual(compressed[2].tolist(), [True, True])
+
+    def test_matches_single_point(self):
+        """Test that each sweep point matches a single cascade run."""
+        pins = sweep.pin_range(-60, 20, 5)
+        result = sweep.run(self.system, pin=pins, bandwidth=10)
+        for index, pin in enumerate(pins):
+            expected = sim.run(self.system, pin=pin, bandwidth=10)
+            self.assertAlmostEqual(result["pout"][index], expected["pout"])
+            self.assertAlmostEqual(result["snr"][index], expected["snr"])
+            self.assertAlmostEqual(result["sfdr"][index], expected["sfdr"])
+            self.assertEqual(
+                result["compressed"][index, -1], self.system[-1].is_compressed
+            )
+        self.assertEqual(result["nf"], 3.20)
+        self.assertEqual(result["iip3"], 13.81)
+
+    def test_detector_clamps(self):
+        """Test that detector blocks clamp swept output."""
+        system = [Detector(gain=10, mds=-10, smax=10, law="log")]
+        stage_pout, _ = sweep.propagate(system, [-20, 5, 15])
+        self.assertListEqual(stage_pout[:, 0].tolist(), [0, 15, 20])
+
+    def test_csv_sweep(self):
+        """Test csv generation for sweep results."""
+        result = sweep.run(self.system, pin=[-60, 20])
+        lines = results.csv_sweep(self.system, result)
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("Pin (dBm),Pout (dBm)"))
+        self.assertTrue(lines[1].startswith("-60.0,-35.0"))
+        self.assertTrue(lines[2].endswith(",1 2"))
+        self.assertEqual(len(lines[1].split(",")), 7)
+        self.assertTrue(np.isfinite(result["snr"]).all())
+
+    def test_iter_run(self):
+        """Test streamed sweep blocks give the same csv as a single run."""
+        pin = sweep.pin_range(-60, 20, 0.5)
+        blocks = list(sweep.iter_run(self.system, pin, block_size=50))
+        self.assertEqual(len(blocks), 4)
+        lines = results.csv_sweep(self.system, sweep.run(self.system, pin=pin))
+        streamed = results.iter_csv_sweep(self.system, iter(blocks))
+        self.assertListEqual(list(streamed), lines)
+
+    def test_save_csv_generator(self):
+        """Test csv lines from a generator are written as they are produced."""
+        with tempfile.TemporaryDirectory() as tmp:
+            save_file = os.path.join(tmp, "sweep.csv")
+            blocks = sweep.iter_run(self.system, [-60, -50, 20], block_size=2)
+            results.save_csv(save_file, results.iter_csv_sweep(self.system, blocks))
+            with open(save_file) as results_file:
+                lines = results_file.read().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[3].startswith("20.0,"))
@@ -0,0 +1,85 @@
+"""Test module for time-domain waveform simulation."""
+import math
+import os
+import tempfile
+import unittest
+import numpy as np
+from rfdesigner.components import Generic
+from rfdesigner.simulation import cascade, rfmath, waveform
+
+
+class TestWaveform(unittest.TestCase):
+    """Object to test waveform simulation methods."""
+
+    def setUp(self):
+        """Set up a chain with linear and nonlinear stages."""
+        self.system = [
+            Generic(name="lna", gain=20, nf=2, iip3=0),
+            Generic(name="pad", gain=-3),
+            Generic(name="amp", gain=15, nf=6, iip3=5, p1db=12),
+        ]
+
+    def test_iter_chunks(self):
+        """Test chunks are views covering the samples."""
+        samples = np.arange(10)
+        chunks = list(waveform.iter_chunks(samples, 4))
+        self.assertListEqual([len(chunk) for chunk in chunks], [4, 4, 2])
+        self.assertTrue(np.shares_memory(chunks[1], samples))
+
+    def test_noise(self):
+        """Test output noise against the cascaded noise figure."""
+        samples = np.zeros(1 << 18, dtype=np.complex64)
+        out = waveform.run(self.system, samples, 100, noise_temp=290, seed=1)
+        self.assertEqual(out.dtype, np.complex64)
+        power = 10 * math.log10(np.mean(np.abs(out) ** 2) / 2) + 30
+        result = cascade.run(self.system, pin=-100, bandwidth=100e6)
+        expected = rfmath.noise_floor(result["nf"], 100e6) + result["gain"]
+        self.assertAlmostEqual(power, expected, places=1)
+        # A real waveform only carries the noise below half the sample rate
+        out = waveform.run(self.system, np.zeros(1 << 18), 100, noise_temp=290)
+        power = 10 * math.log10(np.mean(out ** 2)) + 30
+        self.assertAlmostEqual(power, expected - 10 * math.log10(2), places=1)
+
+    def test_chunk_independence(self):
+        """Test the output does not depend on the chunk size."""
+        samples = np.full(10000, 1e-3, dtype=complex)
+        chains = [
+            waveform.WaveformChain(self.system, 100, noise_temp=290, seed=2)
+            for _ in range(2)
+        ]
+        whole = chains[0].run(samples)
+        streamed = np.concatenate(
+            list(chains[1].stream(waveform.iter_chunks(samples, 999)))
+        )
+        self.assertTrue(np.array_equal(whole, streamed))
+
+    def test_noiseless(self):
+        """Test a noiseless chain applies the gain and compression of every block."""
+        samples = np.array([1e-9, 1.0]) + 0j
+        out = waveform.run(self.system, samples, 100, noise=False)
+        self.assertAlmostEqual(20 * math.log10(abs(out[0]) / 1e-9), 32)
+        expected = samples
+        for block in self.system:
+            expected = block.process(expected)
+        self.assertTrue(np.allclose(out, expected))
+
+    def test_memory_mapped(self):
+        """Test a memory-mapped file is processed into a memory-mapped file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            raw_file = os.path.join(tmp, "samples.bin")
+            samples = np.full(5000, 1e-4, dtype=np.complex64)
+            samples.tofile(raw_file)
+            loaded = waveform.load_samples(raw_file)
+            self.assertIsInstance(loaded, np.memmap)
+            out = waveform.open_output(os.path.join(tmp, "out.npy"), loaded)
+            chain = waveform.WaveformChain(self.system, 100, noise=False)
+            chain.run(loaded, out, chunk_size=1024)
+            out.flush()
+            del out
+            result = waveform.load_samples(os.path.join(tmp, "out.npy"))
+            self.assertEqual(result.dtype, np.complex64)
+            self.assertTrue(
+                np.allclose(
+                    result, waveform.run(self.system, samples, 100, noise=False)
+                )
+            )